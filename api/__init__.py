@@ -1,4 +1,13 @@
+import api.backend
 import api.matrix
+import api.eigen
+import api.lazy
+import api.loaders
+import api.parallel
+import api.profiling
+import api.serialize
+import api.solvers
 import api.space
+import api.structured
 import api.equation
 import api.vector
@@ -0,0 +1,66 @@
+
+"""
+This file contains the documentation for backend.py
+"""
+
+# The backend decides whether the arithmetic in vector.py and matrix.py runs in pure Python,
+# or is dispatched to vectorized NumPy kernels. NumPy is optional: without it, everything
+# runs in pure Python
+
+# BACKENDS: the valid backend names
+#   * 'auto': use NumPy for operands with at least THRESHOLD entries, if it is installed
+#   * 'python': always use the pure Python implementations
+#   * 'numpy': always use NumPy
+#              requires: NumPy is installed
+
+# THRESHOLD: the smallest operand size (number of entries) dispatched to NumPy under 'auto'
+
+# available_backends() produces the list of backends which can be selected
+
+# set_backend(name) selects the backend called name
+#  requires: name is in BACKENDS
+
+# get_backend() produces the name of the selected backend
+
+# use_numpy(size) produces true if an operand with size entries should be dispatched to NumPy
+
+
+# The kernels below are only used when NumPy is installed. Their operands are sequences of
+# numbers (lists, or arrays of doubles which are wrapped without copying), and a matrix is
+# given as its row-major buffer, shape and stride. They produce plain Python lists / numbers
+
+# add(a, b, *args) produces the elementwise sum of a, b and args
+
+# scale(a, s) produces s * a
+
+# combine(coefficients, operands) produces the linear combination of operands, i.e.,
+#  coefficients[0] * operands[0] + coefficients[1] * operands[1] + ...
+
+# add_into(a, b, t) adds t * b to a, in place
+#  requires: a is a contiguous, writable buffer of doubles (e.g. an array('d'))
+
+# scale_into(a, s) multiplies a by the real number s, in place
+#  requires: a is a contiguous, writable buffer of doubles (e.g. an array('d'))
+
+# dot(a, b) produces the dot product of a and b
+
+# norm(a) produces the euclidean norm of a
+
+# cross(a, b) produces the cross product of a and b
+
+# matvec(data, m, n, stride, x) produces the matrix vector product Ax, row-major
+
+# matmul(a, m, n, a_stride, b, p, b_stride) produces the m*p matrix product AB, row-major
+
+# transpose(data, m, n, stride) produces the n*m transpose of A, row-major
+
+# row_dot(a, b, count, dim) produces the dot products of the count rows of a and b
+
+# row_scale(a, scalars, count, dim) produces a with its kth row scaled by scalars[k], row-major
+
+# row_cross(a, b, count) produces the cross products of the count rows (in R^3) of a and b
+
+# eigvals(data, n, stride) produces the eigenvalues of the n*n matrix in data
+
+# eigh(data, n, stride) produces (values, vectors), the eigenvalues (ascending) of the n*n
+#  symmetric (Hermitian) matrix in data, and the components of their eigenvectors
@@ -0,0 +1,142 @@
+from typing import List
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+"""------------------------BACKEND SELECTION------------------------"""
+
+BACKENDS = ('auto', 'python', 'numpy')
+
+# smallest operand (number of entries) for which 'auto' dispatches to NumPy
+THRESHOLD = 256
+
+_backend = 'auto'
+
+
+def available_backends() -> List[str]:
+    if np is None:
+        return ['auto', 'python']
+    return list(BACKENDS)
+
+
+def set_backend(name: str):
+    assert name in BACKENDS, f"Invalid backend: {name}"
+    assert name != 'numpy' or np is not None, "NumPy is not installed"
+    global _backend
+    _backend = name
+
+
+def get_backend() -> str:
+    return _backend
+
+
+def use_numpy(size: int) -> bool:
+    if np is None or _backend == 'python':
+        return False
+    return _backend == 'numpy' or size >= THRESHOLD
+
+
+"""------------------------NUMPY KERNELS------------------------"""
+
+
+def _array(values):
+    # array('d') buffers are wrapped without copying
+    if isinstance(values, np.ndarray):
+        return values
+    try:
+        return np.frombuffer(values, dtype=np.float64)
+    except (TypeError, ValueError, BufferError):
+        return np.asarray(values)
+
+
+def _grid(data, m: int, n: int, stride: int):
+    # an m*n view of the row-major buffer data, the last row doesn't need to be padded to stride
+    a = _array(data)
+    return np.lib.stride_tricks.as_strided(a, (m, n), (stride * a.strides[0], a.strides[0]), writeable=False)
+
+
+def _scalar(x):
+    return x.item() if isinstance(x, np.generic) else x
+
+
+def add(a, b, *args) -> List:
+    total = _array(a) + _array(b)
+    for c in args:
+        total = total + _array(c)
+    return total.tolist()
+
+
+def scale(a, s) -> List:
+    return (_array(a) * s).tolist()
+
+
+def combine(coefficients, operands) -> List:
+    total = coefficients[0] * _array(operands[0])
+    for c, a in zip(coefficients[1:], operands[1:]):
+        total = total + c * _array(a)
+    return total.tolist()
+
+
+def add_into(a, b, t=1):
+    # a += t * b, in place, where a is a contiguous writable buffer of doubles
+    x = np.frombuffer(a, dtype=np.float64)
+    if t == 1:
+        x += _array(b)
+    elif t == -1:
+        x -= _array(b)
+    else:
+        x += t * _array(b)
+
+
+def scale_into(a, s):
+    x = np.frombuffer(a, dtype=np.float64)
+    x *= s
+
+
+def dot(a, b):
+    return _scalar(np.dot(_array(a), _array(b)))
+
+
+def norm(a) -> float:
+    return float(np.linalg.norm(_array(a)))
+
+
+def cross(a, b) -> List:
+    return np.cross(_array(a), _array(b)).tolist()
+
+
+def matvec(data, m: int, n: int, stride: int, x) -> List:
+    return (_grid(data, m, n, stride) @ _array(x)).tolist()
+
+
+def matmul(a, m: int, n: int, a_stride: int, b, p: int, b_stride: int) -> List:
+    return (_grid(a, m, n, a_stride) @ _grid(b, n, p, b_stride)).ravel().tolist()
+
+
+def transpose(data, m: int, n: int, stride: int) -> List:
+    return _grid(data, m, n, stride).T.ravel().tolist()
+
+
+def row_dot(a, b, count: int, dim: int) -> List:
+    return np.einsum('ij,ij->i', _grid(a, count, dim, dim), _grid(b, count, dim, dim)).tolist()
+
+
+def row_scale(a, scalars, count: int, dim: int) -> List:
+    return (_grid(a, count, dim, dim) * _array(scalars)[:, None]).ravel().tolist()
+
+
+def row_cross(a, b, count: int) -> List:
+    return np.cross(_grid(a, count, 3, 3), _grid(b, count, 3, 3)).ravel().tolist()
+
+
+def eigvals(data, n: int, stride: int) -> List:
+    return np.linalg.eigvals(_grid(data, n, n, stride)).tolist()
+
+
+def eigh(data, n: int, stride: int):
+    # produces the eigenvalues (ascending) and the eigenvectors, as lists of components
+    values, vectors = np.linalg.eigh(_grid(data, n, n, stride))
+    return values.tolist(), vectors.T.tolist()
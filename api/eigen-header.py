@@ -0,0 +1,47 @@
+"""
+This file contains the documentation for eigen.py
+"""
+
+# The functions in this file compute eigenvalues and eigenvectors of square matrices. Every
+# iterative method is bounded by an iteration limit, and reports whether it converged
+#  :param A: a square Matrix (real or complex), MatrixView, SparseMatrix or structured matrix
+#            (see structured.py); the last two are read through their dense form
+#  note: eigenvalues and symmetric_eigen are O(n^3); when NumPy is installed, the backend
+#        takes every A with at least THRESHOLD entries (see backend.py), but without it they
+#        run in pure Python, which takes about a second at n = 100, and from several seconds
+#        (eigenvalues) to half a minute (symmetric_eigen) at n = 200: this pure Python path is
+#        meant for matrices up to n of about 50
+#  :param tol: the relative tolerance
+#  :param max_iter: the iteration limit
+
+
+# EigenResult(values, vectors, converged, iterations):
+#    An EigenResult holds the outcome of an eigenvalue computation
+#
+#  FIELDS:
+#   * values: the eigenvalues found (complex only where they have a nonzero imaginary part)
+#   * vectors: the unit eigenvectors matching values, or None if they were not computed
+#   * converged: true if the method reached the tolerance
+#   * iterations: the number of iterations (sweeps for symmetric_eigen) performed,
+#                 0 if the NumPy backend was used
+
+
+# power_iteration(A, x0, tol, max_iter) produces the dominant eigenpair of A, i.e., the
+#  eigenvalue of greatest magnitude, starting from x0; it stops once ||Ax - lx|| <= tol * max(|l|, 1)
+#  requires: A has a single dominant eigenvalue (otherwise it does not converge)
+
+# inverse_iteration(A, shift, x0, tol, max_iter) produces the eigenpair of A whose eigenvalue is
+#  closest to shift; A - shift*I is factored once (see lu_factor), and a shift which is exactly
+#  an eigenvalue is moved by TOLERANCE
+
+# is_hermitian(A, tol) produces true if A is equal to its conjugate transpose (within tol)
+
+# eigenvalues(A, tol, max_iter) produces all n eigenvalues of A (with multiplicity), sorted by
+#  real part then imaginary part; A is reduced to upper Hessenberg form and then the shifted
+#  QR algorithm (Wilkinson shifts, with deflation) is applied, O(n^3) overall
+#  note: a Hermitian A is routed to symmetric_eigen, and large matrices to the NumPy backend
+
+# symmetric_eigen(A, tol, max_sweeps) produces all eigenvalues of A in ascending order, with an
+#  orthonormal set of eigenvectors, by cyclic Jacobi rotations; a complex Hermitian A is solved
+#  through its real symmetric 2n*2n embedding
+#  requires: A is symmetric (Hermitian)
@@ -0,0 +1,330 @@
+from cmath import sqrt as csqrt
+from math import sqrt
+from typing import List
+import api.backend as bk
+import api.vector as vc
+import api.matrix as mx
+
+
+class EigenResult:
+    def __init__(self, values: List, vectors: List[vc.Vector], converged: bool, iterations: int):
+        self.values = values
+        self.vectors = vectors
+        self.converged = converged
+        self.iterations = iterations
+
+    def __repr__(self):
+        status = 'converged' if self.converged else 'did not converge'
+        return f'{status} after {self.iterations} iterations: {self.values}'
+
+
+def _norm(x: List) -> float:
+    return sqrt(sum(abs(a) ** 2 for a in x))
+
+
+def _inner(x: List, y: List):
+    return sum(a * b.conjugate() for a, b in zip(x, y))
+
+
+def _packed(A) -> mx.Matrix:
+    # the kernels below read the entries of A from A.data, row by row with A.stride: a
+    # SparseMatrix or structured matrix is read through its (cached) dense form, and a view of
+    # part of a Matrix is copied, so that A.data only holds its entries
+    A = mx._dense(A)
+    if isinstance(A, mx.MatrixView) and A.stride != A.n:
+        return A.copy()
+    return A
+
+
+def _grid(A: mx.Matrix) -> List[List]:
+    return [list(A.data[i * A.stride:i * A.stride + A.n]) for i in range(A.m)]
+
+
+def _is_real(A: mx.Matrix) -> bool:
+    return not any(isinstance(a, complex) and a.imag != 0 for a in A.data)
+
+
+def _real(z, scale: float, tol: float):
+    # drops the imaginary part of z if it is only rounding error
+    if isinstance(z, complex) and abs(z.imag) <= tol * max(scale, 1):
+        return z.real
+    return z
+
+
+def _start(n: int, x0: vc.Vector) -> List:
+    if x0 is None:
+        # unlikely to be orthogonal to the wanted eigenvector
+        x = [1 / (i + 1) for i in range(n)]
+    else:
+        assert x0.dim == n, "x0 has the wrong dimension"
+        x = list(x0.components)
+    size = _norm(x)
+    assert size > 0, "x0 cannot be the zero vector"
+    return [a / size for a in x]
+
+
+def _matvec(A: mx.Matrix):
+    return lambda x: list(mx.matrix_vector_product(A, vc.Vector.from_sequence(x)).components)
+
+
+def power_iteration(A: mx.Matrix, x0: vc.Vector = None, tol: float = 1e-10,
+                    max_iter: int = 1000) -> EigenResult:
+    assert A.m == A.n, "A is not a square matrix"
+    matvec = _matvec(A)
+    x = _start(A.n, x0)
+    value = 0
+    k = 0
+    converged = False
+    while k < max_iter:
+        y = matvec(x)
+        k += 1
+        value = _inner(y, x)
+        if _norm([a - value * b for a, b in zip(y, x)]) <= tol * max(abs(value), 1):
+            converged = True
+            break
+        size = _norm(y)
+        if size == 0:
+            # x is in the null space of A, so (0, x) is an eigenpair
+            converged = True
+            break
+        x = [a / size for a in y]
+    value = _real(value, abs(value), tol)
+    return EigenResult([value], [vc.Vector.from_sequence(x)], converged, k)
+
+
+def inverse_iteration(A: mx.Matrix, shift=0, x0: vc.Vector = None, tol: float = 1e-10,
+                      max_iter: int = 1000) -> EigenResult:
+    assert A.m == A.n, "A is not a square matrix"
+    n = A.n
+    matvec = _matvec(A)
+    scale = mx._one_norm(_packed(A))
+    F = None
+    while F is None or F.rank < n:
+        # a shift which is exactly an eigenvalue is nudged, so that A - shift*I can be factored
+        if F is not None:
+            shift += vc.TOLERANCE * max(abs(shift), scale, 1)
+        B = mx.matrix_subtract(A, mx.matrix_scalar_product(mx.identity(n), shift))
+        F = mx.lu_factor(B)
+    x = _start(n, x0)
+    value = shift
+    k = 0
+    converged = False
+    while k < max_iter:
+        z = F.solve(vc.Vector.from_sequence(x)).components
+        size = _norm(z)
+        x = [a / size for a in z]
+        k += 1
+        Ax = matvec(x)
+        value = _inner(Ax, x)
+        if _norm([a - value * b for a, b in zip(Ax, x)]) <= tol * max(abs(value), 1):
+            converged = True
+            break
+    value = _real(value, abs(value), tol)
+    return EigenResult([value], [vc.Vector.from_sequence(x)], converged, k)
+
+
+def _reflect(x: List):
+    # produces the unit Householder vector v with (I - 2vv*)x a multiple of e1, or None
+    size = _norm(x)
+    if size == 0:
+        return None
+    alpha = -size if x[0] == 0 else -size * x[0] / abs(x[0])
+    v = list(x)
+    v[0] -= alpha
+    size = _norm(v)
+    return [a / size for a in v]
+
+
+def _hessenberg(H: List[List]):
+    # reduces H to upper Hessenberg form in place, by similarity transformations
+    n = len(H)
+    for k in range(n - 2):
+        v = _reflect([H[i][k] for i in range(k + 1, n)])
+        if v is None:
+            continue
+        for j in range(k, n):
+            s = 2 * sum(v[i].conjugate() * H[k + 1 + i][j] for i in range(len(v)))
+            if s != 0:
+                for i in range(len(v)):
+                    H[k + 1 + i][j] -= s * v[i]
+        for row in H:
+            s = 2 * sum(row[k + 1 + i] * v[i] for i in range(len(v)))
+            if s != 0:
+                for i in range(len(v)):
+                    row[k + 1 + i] -= s * v[i].conjugate()
+        for i in range(k + 2, n):
+            H[i][k] = 0
+
+
+def _wilkinson(a, b, c, d):
+    # produces the eigenvalue of [[a, b], [c, d]] closest to d
+    half = (a + d) / 2
+    disc = csqrt(half * half - (a * d - b * c))
+    mu1, mu2 = half + disc, half - disc
+    return mu1 if abs(mu1 - d) < abs(mu2 - d) else mu2
+
+
+def _hessenberg_qr(H: List[List], tol: float, max_iter: int):
+    # produces the eigenvalues of the Hessenberg matrix H by the shifted QR algorithm,
+    # using Givens rotations on the active (undeflated) block H[lo..hi]
+    n = len(H)
+    values = [0] * n
+    hi = n - 1
+    k = 0
+    stall = 0
+    while hi >= 0:
+        lo = hi
+        while lo > 0 and abs(H[lo][lo - 1]) > tol * (abs(H[lo - 1][lo - 1]) + abs(H[lo][lo])):
+            lo -= 1
+        if lo == hi:
+            values[hi] = H[hi][hi]
+            if hi > 0:
+                H[hi][hi - 1] = 0
+            hi -= 1
+            stall = 0
+            continue
+        if k >= max_iter:
+            for i in range(hi + 1):
+                values[i] = H[i][i]
+            return values, False, k
+        k += 1
+        stall += 1
+        if stall % 11 == 0:
+            # an exceptional shift breaks cycles of the Wilkinson shift
+            mu = H[hi][hi] + abs(H[hi][hi - 1]) * (0.75 + 0.5j)
+        else:
+            mu = _wilkinson(H[hi - 1][hi - 1], H[hi - 1][hi], H[hi][hi - 1], H[hi][hi])
+        for i in range(lo, hi + 1):
+            H[i][i] -= mu
+        rotations = []
+        for i in range(lo, hi):
+            x, y = H[i][i], H[i + 1][i]
+            r = sqrt(abs(x) ** 2 + abs(y) ** 2)
+            c, s = (1, 0) if r == 0 else (x / r, y / r)
+            cc, sc = c.conjugate(), s.conjugate()
+            top, bottom = H[i], H[i + 1]
+            for j in range(i, hi + 1):
+                a, b = top[j], bottom[j]
+                top[j] = cc * a + sc * b
+                bottom[j] = c * b - s * a
+            rotations.append((c, s, cc, sc))
+        for i, (c, s, cc, sc) in zip(range(lo, hi), rotations):
+            for row in H[lo:i + 2]:
+                a, b = row[i], row[i + 1]
+                row[i] = c * a + s * b
+                row[i + 1] = cc * b - sc * a
+        for i in range(lo, hi + 1):
+            H[i][i] += mu
+    return values, True, k
+
+
+def _sort(values: List) -> List:
+    # conjugate pairs stay together, since their real parts only differ by rounding error
+    return sorted(values, key=lambda z: (round(z.real, 8), z.imag) if isinstance(z, complex) else (round(z, 8), 0))
+
+
+def eigenvalues(A: mx.Matrix, tol: float = 1e-12, max_iter: int = None) -> EigenResult:
+    assert A.m == A.n, "A is not a square matrix"
+    A = _packed(A)
+    if is_hermitian(A):
+        result = symmetric_eigen(A, tol)
+        result.vectors = None
+        return result
+    n = A.n
+    scale = mx._one_norm(A)
+    if bk.use_numpy(n * n):
+        values, converged, k = bk.eigvals(A.data, n, A.stride), True, 0
+    else:
+        H = [[complex(a) for a in row] for row in _grid(A)]
+        _hessenberg(H)
+        max_iter = 30 * n if max_iter is None else max_iter
+        values, converged, k = _hessenberg_qr(H, tol, max_iter)
+    if _is_real(A):
+        values = [_real(z, scale, sqrt(tol)) for z in values]
+    return EigenResult(_sort(values), None, converged, k)
+
+
+def is_hermitian(A: mx.Matrix, tol: float = 1e-12) -> bool:
+    if A.m != A.n:
+        return False
+    A = _packed(A)
+    scale = max(mx._one_norm(A), 1)
+    for i in range(A.n):
+        for j in range(i, A.n):
+            if abs(A.data[i * A.stride + j] - A.data[j * A.stride + i].conjugate()) > tol * scale:
+                return False
+    return True
+
+
+def _jacobi(S: List[List], tol: float, max_sweeps: int):
+    # diagonalizes the real symmetric S in place by cyclic Jacobi rotations, producing the
+    # accumulated rotations V (as rows, so V[k] is the k-th eigenvector)
+    n = len(S)
+    V = [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+    total = sqrt(sum(a * a for row in S for a in row))
+    sweeps = 0
+    while True:
+        off = sqrt(sum(S[i][j] ** 2 for i in range(n) for j in range(n) if i != j))
+        if off <= tol * max(total, 1):
+            return V, True, sweeps
+        if sweeps >= max_sweeps:
+            return V, False, sweeps
+        sweeps += 1
+        for p in range(n - 1):
+            for q in range(p + 1, n):
+                apq = S[p][q]
+                if apq == 0:
+                    continue
+                theta = (S[q][q] - S[p][p]) / (2 * apq)
+                t = (1 if theta >= 0 else -1) / (abs(theta) + sqrt(theta * theta + 1))
+                c = 1 / sqrt(t * t + 1)
+                s = t * c
+                for row in S:
+                    a, b = row[p], row[q]
+                    row[p], row[q] = c * a - s * b, s * a + c * b
+                Sp, Sq = S[p], S[q]
+                for j in range(n):
+                    a, b = Sp[j], Sq[j]
+                    Sp[j], Sq[j] = c * a - s * b, s * a + c * b
+                Vp, Vq = V[p], V[q]
+                for j in range(n):
+                    a, b = Vp[j], Vq[j]
+                    Vp[j], Vq[j] = c * a - s * b, s * a + c * b
+
+
+def symmetric_eigen(A: mx.Matrix, tol: float = 1e-12, max_sweeps: int = 50) -> EigenResult:
+    A = _packed(A)
+    assert is_hermitian(A), "A is not symmetric (Hermitian)"
+    n = A.n
+    if bk.use_numpy(n * n):
+        values, vectors = bk.eigh(A.data, n, A.stride)
+        return EigenResult(values, [vc.Vector.from_sequence(v) for v in vectors], True, 0)
+    grid = _grid(A)
+    if _is_real(A):
+        S = [[float(a.real) if isinstance(a, complex) else float(a) for a in row] for row in grid]
+        V, converged, sweeps = _jacobi(S, tol, max_sweeps)
+        pairs = sorted((S[k][k], V[k]) for k in range(n))
+        return EigenResult([p[0] for p in pairs], [vc.Vector.from_sequence(p[1]) for p in pairs],
+                           converged, sweeps)
+    # a Hermitian A = X + iY is solved through the real symmetric [[X, -Y], [Y, X]], whose
+    # spectrum is that of A with every eigenvalue doubled; (x, y) maps to the eigenvector x + iy
+    S = [[0.0] * (2 * n) for i in range(2 * n)]
+    for i in range(n):
+        for j in range(n):
+            a = complex(grid[i][j])
+            S[i][j] = S[n + i][n + j] = a.real
+            S[i][n + j] = -a.imag
+            S[n + i][j] = a.imag
+    V, converged, sweeps = _jacobi(S, tol, max_sweeps)
+    values, vectors = [], []
+    for value, v in sorted((S[k][k], V[k]) for k in range(2 * n)):
+        z = [complex(v[i], v[n + i]) for i in range(n)]
+        # the partner of (x, y) is (-y, x), i.e., i(x + iy), so it is dropped by orthogonalization
+        for w in vectors:
+            c = _inner(z, w)
+            z = [a - c * b for a, b in zip(z, w)]
+        size = _norm(z)
+        if size > 0.5 and len(values) < n:
+            values.append(value)
+            vectors.append([a / size for a in z])
+    return EigenResult(values, [vc.Vector.from_sequence(v) for v in vectors], converged, sweeps)
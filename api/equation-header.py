@@ -28,6 +28,11 @@ This file contains the documentation for equation.py
 #   * m: m is the number of equations in the system
 #   * n: is the number of unknowns in each equation
 #
+#  CLASS METHODS:
+#   * LinearSystem.from_rows(rows, rhs) produces the system whose ith equation has the
+#     coefficients rows[i] (sequences or Vectors, shorter ones padded with zeros) and the
+#     right-hand-side rhs[i] (0 if rhs is None), built in a single pass
+#
 #  METHODS:
 #   * copy() produces a copy of self
 
@@ -6,7 +6,7 @@ import api.vector as vc
 class LinearEquation:
     def __init__(self, loc, rhs):
         self.n = len(loc)
-        self.a = vc.Vector(*loc)
+        self.a = vc.Vector.from_sequence(loc)
         self.rhs = rhs
 
     def __repr__(self):
@@ -40,6 +40,21 @@ class LinearSystem:
             args[i].n = self.n
             self.e.append(args[i])
 
+    @classmethod
+    def from_rows(cls, rows, rhs=None):
+        rows = [row.components if isinstance(row, vc.Vector) else row for row in rows]
+        rhs = [0] * len(rows) if rhs is None else rhs
+        assert len(rhs) == len(rows), "rows and rhs have different lengths"
+        ls = cls.__new__(cls)
+        ls.m = len(rows)
+        ls.n = max((len(row) for row in rows), default=0)
+        ls.e = [None]
+        for row, r in zip(rows, rhs):
+            if len(row) < ls.n:
+                row = list(row) + [0] * (ls.n - len(row))
+            ls.e.append(LinearEquation(row, r))
+        return ls
+
     def __repr__(self):
         output = '[\n'
         for eq in self.e[1:]:
@@ -91,14 +106,17 @@ def subtract(le1: LinearEquation, le2: LinearEquation) -> LinearEquation:
 
 
 def scalar_multiply(le: LinearEquation, s):
-    for i in range(le.n):
-        le.a.components[i] *= s
+    if isinstance(s, complex) and le.a.field == 'real':
+        # a real vector can't hold complex components
+        le.a = vc.Vector.from_sequence([x * s for x in le.a.components])
+    else:
+        for i in range(le.n):
+            le.a.components[i] *= s
     le.rhs *= s
 
 
 def solves_equation(le: LinearEquation, v: vc.Vector) -> bool:
-    w = vc.Vector(*le.a.components)
-    ans = vc.dot_product(v, w)
+    ans = vc.dot_product(v, le.a)
     return ans == le.rhs
 
 
@@ -0,0 +1,46 @@
+"""
+This file contains the documentation for lazy.py
+"""
+
+# The functions in this file build lazy expressions instead of computing their results.
+# They have the same names and arguments as the functions of matrix.py and vector.py, and take
+# Matrices, SparseMatrices, Vectors or other expressions as operands. Nothing is computed until
+# an expression is evaluated, when:
+#  * sums, differences, negations and scalar products are fused into one linear combination,
+#    computed in a single pass over the entries of its operands into one new Matrix (Vector)
+#  * chains of matrix products (optionally ending with a vector) are multiplied in the order
+#    which needs the fewest multiplications
+#  * a subexpression used more than once is only computed once
+# The operands are read when the expression is evaluated, not when it is built
+
+
+# Expr:
+#    An Expr is a node of a lazy expression
+#
+#  FIELDS:
+#   * shape: (m, n) for a matrix expression, (dim,) for a vector expression
+#   * is_vector: true if self is a vector expression
+#
+#  METHODS:
+#   * evaluate() produces the Matrix (SparseMatrix, Vector) which self represents
+#
+# Leaf(value): an Expr which is the Matrix, SparseMatrix or Vector value
+#
+# Combination(terms): an Expr which is the linear combination of the Exprs in terms, a list of
+#  (coefficient, Expr) pairs
+#
+# Product(factors): an Expr which is the product of the Exprs in factors, only the last one can
+#  be a vector expression
+
+
+# lazy(x) produces the Expr of x (x itself if it is already an Expr)
+#  requires: x is not an augmented Matrix
+
+# evaluate(x) produces the value of x if it is an Expr, and x otherwise
+
+# matrix_add(A, B), matrix_negate(A), matrix_subtract(A, B), matrix_scalar_product(A, c),
+# matrix_matrix_product(A, B) and matrix_vector_product(A, v) produce the Exprs of the
+#  corresponding functions of matrix.py
+
+# add(v, w, *args), negate(v), subtract(v, w) and scalar_multiply(v, s) produce the Exprs of the
+#  corresponding functions of vector.py
@@ -0,0 +1,240 @@
+from math import inf
+from typing import Dict, List, Tuple
+import api.backend as bk
+import api.vector as vc
+import api.matrix as mx
+
+
+class Expr:
+    """
+    Expr is a node of a lazy expression: nothing is computed until evaluate is called on it.
+    shape is (m, n) for a matrix expression, and (dim,) for a vector expression
+    """
+
+    def __init__(self, shape: Tuple):
+        self.shape = shape
+
+    @property
+    def is_vector(self) -> bool:
+        return len(self.shape) == 1
+
+    def evaluate(self):
+        return self._evaluate({})
+
+    def _evaluate(self, memo: Dict):
+        # memo maps the ids of the nodes evaluated so far to their values, so a node
+        # shared by several parts of an expression is only evaluated once
+        if id(self) not in memo:
+            memo[id(self)] = (self, self._compute(memo))
+        return memo[id(self)][1]
+
+    def _compute(self, memo: Dict):
+        raise NotImplementedError
+
+
+class Leaf(Expr):
+    def __init__(self, value):
+        super().__init__((value.dim,) if isinstance(value, vc.Vector) else (value.m, value.n))
+        self.value = value
+
+    def __repr__(self):
+        return f'{"v" if self.is_vector else "M"}{self.shape}'
+
+    def _compute(self, memo: Dict):
+        return self.value
+
+
+class Combination(Expr):
+    """
+    Combination(terms) is the linear combination of the operands in terms, a list of
+    (coefficient, Expr) pairs; sums, differences, negations and scalar products are all
+    folded into one Combination, which is evaluated in a single pass over its operands
+    """
+
+    def __init__(self, terms: List[Tuple]):
+        super().__init__(terms[0][1].shape)
+        self.terms = terms
+
+    def __repr__(self):
+        return '(' + ' + '.join(f'{c}*{x}' for c, x in self.terms) + ')'
+
+    def _compute(self, memo: Dict):
+        coefficients = [c for c, x in self.terms]
+        values = [x._evaluate(memo) for c, x in self.terms]
+        if any(isinstance(X, mx.SparseMatrix) for X in values):
+            total = mx.matrix_scalar_product(values[0], coefficients[0])
+            for c, X in zip(coefficients[1:], values[1:]):
+                total = mx.matrix_add(total, mx.matrix_scalar_product(X, c))
+            return total
+        if self.is_vector:
+            return vc.Vector.from_sequence(_combine(coefficients, [v.components for v in values], self.shape[0]))
+        m, n = self.shape
+        operands = [X.data if X.stride == X.n else list(mx._entries(X)) for X in values]
+        return mx._from_buffer(m, n, mx._buffer(_combine(coefficients, operands, m * n)))
+
+
+def _combine(coefficients: List, operands: List, size: int) -> List:
+    # the fused elementwise loop of a Combination, up to three operands are combined in one
+    # pass, and any further ones are folded into the result one at a time
+    if bk.use_numpy(size):
+        return bk.combine(coefficients, operands)
+    if len(operands) == 1:
+        c = coefficients[0]
+        return [c * a for a in operands[0]]
+    if len(operands) == 2:
+        c, d = coefficients
+        if c == 1 and d == 1:
+            return [a + b for a, b in zip(*operands)]
+        if c == 1 and d == -1:
+            return [a - b for a, b in zip(*operands)]
+        return [c * a + d * b for a, b in zip(*operands)]
+    c, d, e = coefficients[:3]
+    total = [c * a + d * b + e * x for a, b, x in zip(*operands[:3])]
+    for c, x in zip(coefficients[3:], operands[3:]):
+        total = [t + c * a for t, a in zip(total, x)]
+    return total
+
+
+class Product(Expr):
+    """
+    Product(factors) is the product of the matrix expressions in factors, where the last one
+    may be a vector expression; it is evaluated in the order which needs the fewest
+    multiplications (see _chain_order)
+    """
+
+    def __init__(self, factors: List[Expr]):
+        last = factors[-1]
+        super().__init__((factors[0].shape[0],) if last.is_vector else (factors[0].shape[0], last.shape[1]))
+        self.factors = factors
+
+    def __repr__(self):
+        return '(' + ' @ '.join(repr(x) for x in self.factors) + ')'
+
+    def _compute(self, memo: Dict):
+        values = [x._evaluate(memo) for x in self.factors]
+        dims = [x.shape[0] for x in self.factors]
+        dims.append(1 if self.is_vector else self.shape[1])
+        split = _chain_order(dims)
+
+        def multiply(i: int, j: int):
+            if i == j:
+                return values[i]
+            k = split[i][j]
+            left, right = multiply(i, k), multiply(k + 1, j)
+            if isinstance(right, vc.Vector):
+                return mx.matrix_vector_product(left, right)
+            return mx.matrix_matrix_product(left, right)
+
+        return multiply(0, len(values) - 1)
+
+
+def _chain_order(dims: List[int]) -> List[List[int]]:
+    # the matrix chain dynamic program: factor k is dims[k]*dims[k + 1], cost[i][j] is the
+    # fewest multiplications which compute the product of factors i..j, and split[i][j] is
+    # the last factor of the left part of that product
+    k = len(dims) - 1
+    cost = [[0] * k for i in range(k)]
+    split = [[0] * k for i in range(k)]
+    for length in range(1, k):
+        for i in range(k - length):
+            j = i + length
+            cost[i][j] = inf
+            for s in range(i, j):
+                c = cost[i][s] + cost[s + 1][j] + dims[i] * dims[s + 1] * dims[j + 1]
+                if c < cost[i][j]:
+                    cost[i][j], split[i][j] = c, s
+    return split
+
+
+def lazy(x) -> Expr:
+    if isinstance(x, Expr):
+        return x
+    assert isinstance(x, (vc.Vector, mx.Matrix, mx.SparseMatrix)), "Only vectors and matrices can be lazy"
+    assert isinstance(x, vc.Vector) or not x.augmented, "An augmented matrix can't be lazy"
+    return Leaf(x)
+
+
+def evaluate(x):
+    return x.evaluate() if isinstance(x, Expr) else x
+
+
+def _terms(x, c=1) -> List[Tuple]:
+    # the terms of c * x, where the terms of a Combination are spliced in
+    x = lazy(x)
+    if isinstance(x, Combination):
+        return [(c * d, y) for d, y in x.terms]
+    return [(c, x)]
+
+
+def _combination(*terms: List[Tuple]) -> Combination:
+    # joins the terms, summing the coefficients of an operand which appears more than once
+    merged = {}
+    for c, x in (t for ts in terms for t in ts):
+        key = id(x.value) if isinstance(x, Leaf) else id(x)
+        d, y = merged.get(key, (0, x))
+        merged[key] = (d + c, y)
+    return Combination(list(merged.values()))
+
+
+def _factors(x) -> List[Expr]:
+    x = lazy(x)
+    return x.factors if isinstance(x, Product) else [x]
+
+
+"""------------------------MATRIX EXPRESSIONS------------------------"""
+
+
+def matrix_add(A, B) -> Expr:
+    A, B = lazy(A), lazy(B)
+    assert not A.is_vector and A.shape == B.shape, "Matrices have different dimensions"
+    return _combination(_terms(A), _terms(B))
+
+
+def matrix_negate(A) -> Expr:
+    return _combination(_terms(A, -1))
+
+
+def matrix_subtract(A, B) -> Expr:
+    A, B = lazy(A), lazy(B)
+    assert not A.is_vector and A.shape == B.shape, "Matrices have different dimensions"
+    return _combination(_terms(A), _terms(B, -1))
+
+
+def matrix_scalar_product(A, c) -> Expr:
+    return _combination(_terms(A, c))
+
+
+def matrix_matrix_product(A, B) -> Expr:
+    A, B = lazy(A), lazy(B)
+    assert not B.is_vector and A.shape[1] == B.shape[0]
+    return Product(_factors(A) + _factors(B))
+
+
+def matrix_vector_product(A, v) -> Expr:
+    A, v = lazy(A), lazy(v)
+    assert v.is_vector and A.shape[1] == v.shape[0]
+    return Product(_factors(A) + [v])
+
+
+"""------------------------VECTOR EXPRESSIONS------------------------"""
+
+
+def add(v, w, *args) -> Expr:
+    operands = [lazy(x) for x in (v, w) + args]
+    for x in operands:
+        assert x.is_vector and x.shape == operands[0].shape, "Can't add vectors of different dimensions"
+    return _combination(*[_terms(x) for x in operands])
+
+
+def negate(v) -> Expr:
+    return _combination(_terms(v, -1))
+
+
+def subtract(v, w) -> Expr:
+    v, w = lazy(v), lazy(w)
+    assert v.is_vector and v.shape == w.shape, "Can't subtract vectors of different dimensions"
+    return _combination(_terms(v), _terms(w, -1))
+
+
+def scalar_multiply(v, s) -> Expr:
+    return _combination(_terms(v, s))
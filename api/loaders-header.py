@@ -0,0 +1,55 @@
+"""
+This file contains the documentation for loaders.py
+"""
+
+# The functions in this file open matrices stored in files. Binary files (raw doubles and
+# .npy) are memory-mapped and CSV files are indexed by the offsets of their lines, so the
+# entries are only read when they are used, and a matrix much larger than memory can be
+# multiplied by a vector or walked through one chunk of rows at a time
+
+
+# MappedMatrix(path, rows, width, offset, fortran_order):
+#    A MappedMatrix is a matrix of little-endian doubles in the file at path, starting at byte
+#    offset, stored row by row (column by column if fortran_order)
+#
+# CSVMatrix(path, delimiter, header):
+#    A CSVMatrix is a matrix stored as text, one row per (nonblank) line, with the entries
+#    separated by delimiter; the first header nonblank lines are skipped
+#
+#  FIELDS (both):
+#   * m: the number of rows
+#   * n: the number of columns
+#   * path: the path of the file
+#   * transposed: true if self is the transpose of the matrix stored in the file
+#   * augmented: always false
+#
+#  METHODS (both):
+#   * sub(i, j) produces the the value at coordinates (i,j) of the matrix
+#   * row(i) produces the ith row vector
+#   * col(i) produces the ith column vector
+#   * iter_chunks(rows) produces (i, chunk) pairs, where chunk is a Matrix of rows i..i+rows-1
+#     of self (fewer for the last chunk), defaults to CHUNK_ROWS rows
+#   * matrix_vector_product(v) produces the matrix vector product, self*v, reading the file
+#     one chunk of rows at a time
+#   * transpose() produces the transpose of self, which shares the file with self
+#   * copy() reads all of self into a Matrix
+#   * close() closes the file, of self and of all transposes of self
+#
+#  matrix_vector_product and matrix_transpose in matrix.py, and the iterative solvers of
+#  solvers.py, accept a MappedMatrix or a CSVMatrix
+
+# CHUNK_ROWS: the number of rows of a file read at a time
+
+# load_raw(path, m, n, offset) produces the MappedMatrix of the m*n row-major doubles in the
+#  file at path, starting at byte offset
+
+# load_npy(path) produces the MappedMatrix of the 2-dimensional '<f8' array in the .npy file at
+#  path (a Fortran-ordered array produces a transposed MappedMatrix)
+
+# load_csv(path, delimiter, header) produces the CSVMatrix of the file at path
+
+# load_matrix_market(path) produces the matrix in the Matrix Market file at path
+#  a coordinate file produces a SparseMatrix, assembled row by row without any dense
+#  intermediate; an array file produces a Matrix
+#  the real, integer, complex and pattern fields and the general, symmetric, skew-symmetric
+#  and hermitian symmetries are supported
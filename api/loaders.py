@@ -0,0 +1,327 @@
+import ast
+import mmap
+import os
+import struct
+import sys
+from array import array
+from copy import copy
+from typing import Iterator, List, Tuple
+import api.vector as vc
+import api.matrix as mx
+
+
+class _FileMatrix:
+    """
+    _FileMatrix is the common part of the file-backed matrices: the file holds rows rows of
+    width values each, and the matrix is either those rows, or their transpose, so entry (i, j)
+    is file entry (i, j), or (j, i) if transposed. Subclasses implement _read(start, stop),
+    which produces the (0-indexed) file rows start..stop-1 as one flat sequence
+    """
+
+    def __init__(self, rows: int, width: int):
+        assert rows > 0 and width > 0, "Invalid dimensions"
+        self._rows = rows
+        self._width = width
+        self.transposed = False
+        self.augmented = False
+
+    @property
+    def m(self) -> int:
+        return self._width if self.transposed else self._rows
+
+    @property
+    def n(self) -> int:
+        return self._rows if self.transposed else self._width
+
+    def _read(self, start: int, stop: int):
+        raise NotImplementedError
+
+    def _file_col(self, j: int) -> List:
+        # the (0-indexed) column j of the file, gathered one chunk of file rows at a time
+        values = []
+        for start in range(0, self._rows, CHUNK_ROWS):
+            stop = min(start + CHUNK_ROWS, self._rows)
+            values.extend(self._read(start, stop)[j::self._width])
+        return values
+
+    def sub(self, i: int, j: int):
+        assert 1 <= i <= self.m and 1 <= j <= self.n, "Invalid entry request"
+        if self.transposed:
+            i, j = j, i
+        return self._read(i - 1, i)[j - 1]
+
+    def row(self, i: int) -> vc.Vector:
+        assert 1 <= i <= self.m, "Invalid row request"
+        if self.transposed:
+            return vc.Vector.from_sequence(self._file_col(i - 1))
+        return vc.Vector.from_sequence(self._read(i - 1, i))
+
+    def col(self, i: int) -> vc.Vector:
+        assert 1 <= i <= self.n
+        if self.transposed:
+            return vc.Vector.from_sequence(self._read(i - 1, i))
+        return vc.Vector.from_sequence(self._file_col(i - 1))
+
+    def iter_chunks(self, rows: int = None) -> Iterator[Tuple[int, mx.Matrix]]:
+        """
+        iter_chunks(rows) produces (i, chunk) pairs, where chunk is a Matrix holding rows
+        i..i+rows-1 of self, so only one chunk is in memory at a time
+        """
+        rows = CHUNK_ROWS if rows is None else rows
+        assert rows > 0
+        for start in range(0, self.m, rows):
+            stop = min(start + rows, self.m)
+            if self.transposed:
+                # rows of the transpose are columns of the file, gathered in one pass over it
+                data = [[] for i in range(start, stop)]
+                for s in range(0, self._rows, CHUNK_ROWS):
+                    block = self._read(s, min(s + CHUNK_ROWS, self._rows))
+                    for k in range(start, stop):
+                        data[k - start].extend(block[k::self._width])
+                values = [x for r in data for x in r]
+            else:
+                values = self._read(start, stop)
+            yield start + 1, mx._from_buffer(stop - start, self.n, mx._buffer(values))
+
+    def matrix_vector_product(self, v: vc.Vector) -> vc.Vector:
+        assert self.n == v.dim
+        x = v.components
+        width = self._width
+        if self.transposed:
+            # Av = sum of v_k * (file row k), streamed one chunk of file rows at a time
+            y = [0] * width
+            for start in range(0, self._rows, CHUNK_ROWS):
+                stop = min(start + CHUNK_ROWS, self._rows)
+                block = self._read(start, stop)
+                for k in range(start, stop):
+                    xk = x[k]
+                    if xk != 0:
+                        offset = (k - start) * width
+                        y = [a + xk * b for a, b in zip(y, block[offset:offset + width])]
+            return vc.Vector.from_sequence(y)
+        y = []
+        for start in range(0, self._rows, CHUNK_ROWS):
+            stop = min(start + CHUNK_ROWS, self._rows)
+            block = self._read(start, stop)
+            for k in range(stop - start):
+                y.append(sum(a * b for a, b in zip(block[k * width:(k + 1) * width], x)))
+        return vc.Vector.from_sequence(y)
+
+    def transpose(self):
+        # the transpose shares the file, only the order in which it is read changes
+        T = copy(self)
+        T.transposed = not self.transposed
+        return T
+
+    def copy(self) -> mx.Matrix:
+        values = []
+        for start, chunk in self.iter_chunks():
+            values.extend(chunk.data)
+        return mx._from_buffer(self.m, self.n, mx._buffer(values))
+
+
+# the number of rows read from a file at a time
+CHUNK_ROWS = 1024
+
+
+class MappedMatrix(_FileMatrix):
+    """
+    MappedMatrix(path, rows, width, offset, fortran_order) is a matrix of little-endian doubles,
+    stored row-major in the file at path from byte offset (column-major if fortran_order)
+    """
+
+    def __init__(self, path: str, rows: int, width: int, offset: int = 0, fortran_order: bool = False):
+        if fortran_order:
+            rows, width = width, rows
+        super().__init__(rows, width)
+        self.path = path
+        size = rows * width * 8
+        with open(path, 'rb') as f:
+            assert os.fstat(f.fileno()).st_size >= offset + size, "The file is too short"
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._data = memoryview(self._mmap)[offset:offset + size]
+        if sys.byteorder == 'little':
+            self._data = self._data.cast('d')
+        if fortran_order:
+            self.transposed = True
+
+    def _read(self, start: int, stop: int):
+        if sys.byteorder == 'little':
+            return self._data[start * self._width:stop * self._width]
+        values = array('d')
+        values.frombytes(self._data[start * self._width * 8:stop * self._width * 8])
+        values.byteswap()
+        return values
+
+    def close(self):
+        self._data.release()
+        self._mmap.close()
+
+
+class CSVMatrix(_FileMatrix):
+    """
+    CSVMatrix(path, delimiter, header) is a matrix stored as delimited text, one row per line;
+    the file is indexed once by the offsets of its lines, and rows are parsed on demand
+    """
+
+    def __init__(self, path: str, delimiter: str = ',', header: int = 0):
+        self.path = path
+        self.delimiter = delimiter
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # _offsets[i] is the byte offset of row i, and _offsets[-1] the end of the last row
+        self._offsets = array('q')
+        pos, end = 0, len(self._mmap)
+        skipped = 0
+        while pos < end:
+            stop = self._mmap.find(b'\n', pos)
+            stop = end if stop == -1 else stop
+            if self._mmap[pos:stop].strip():
+                if skipped < header:
+                    skipped += 1
+                else:
+                    self._offsets.append(pos)
+            pos = stop + 1
+        self._offsets.append(end)
+        rows = len(self._offsets) - 1
+        assert rows > 0, "The file holds no rows"
+        super().__init__(rows, len(self._parse(0)))
+
+    def _parse(self, i: int) -> List[float]:
+        line = self._mmap[self._offsets[i]:self._offsets[i + 1]].decode()
+        return [float(x) for x in line.strip().split(self.delimiter)]
+
+    def _read(self, start: int, stop: int):
+        values = []
+        for i in range(start, stop):
+            row = self._parse(i)
+            assert len(row) == self._width, f"Row {i + 1} has {len(row)} values, not {self._width}"
+            values.extend(row)
+        return values
+
+    def close(self):
+        self._mmap.close()
+
+
+def load_raw(path: str, m: int, n: int, offset: int = 0) -> MappedMatrix:
+    return MappedMatrix(path, m, n, offset)
+
+
+def load_npy(path: str) -> MappedMatrix:
+    with open(path, 'rb') as f:
+        assert f.read(6) == b'\x93NUMPY', "Not a .npy file"
+        major = f.read(2)[0]
+        length = struct.unpack('<H' if major == 1 else '<I', f.read(2 if major == 1 else 4))[0]
+        header = ast.literal_eval(f.read(length).decode('latin1'))
+        offset = f.tell()
+    assert header['descr'] == '<f8', "Only little-endian float64 arrays are supported"
+    shape = header['shape']
+    assert len(shape) == 2, "Only 2-dimensional arrays are supported"
+    return MappedMatrix(path, shape[0], shape[1], offset, header['fortran_order'])
+
+
+def load_csv(path: str, delimiter: str = ',', header: int = 0) -> CSVMatrix:
+    return CSVMatrix(path, delimiter, header)
+
+
+def _mm_value(tokens: List[str], field: str):
+    if field == 'pattern':
+        return 1
+    if field == 'complex':
+        return complex(float(tokens[0]), float(tokens[1]))
+    if field == 'integer':
+        return int(tokens[0])
+    return float(tokens[0])
+
+
+def load_matrix_market(path: str):
+    """
+    load_matrix_market(path) reads a Matrix Market file; a coordinate file produces a
+    SparseMatrix, assembled in CSR form without a dense intermediate, and an array file a Matrix
+    """
+    with open(path, 'r') as f:
+        banner = f.readline().split()
+        assert len(banner) == 5 and banner[0] == '%%MatrixMarket' and banner[1].lower() == 'matrix', \
+            "Not a Matrix Market matrix file"
+        layout, field, symmetry = (word.lower() for word in banner[2:])
+        line = f.readline()
+        while line.startswith('%') or not line.strip():
+            line = f.readline()
+        size = [int(x) for x in line.split()]
+        m, n = size[0], size[1]
+        if layout == 'array':
+            # the entries are listed column by column (the lower triangle only, if symmetric,
+            # and without the diagonal, which is zero, if skew-symmetric)
+            grid = [[0] * n for i in range(m)]
+            tokens = [line.split() for line in f if line.strip() and not line.startswith('%')]
+            k = 0
+            for j in range(n):
+                if symmetry == 'general':
+                    first = 0
+                else:
+                    first = j + 1 if symmetry == 'skew-symmetric' else j
+                for i in range(first, m):
+                    value = _mm_value(tokens[k], field)
+                    grid[i][j] = value
+                    if symmetry != 'general' and i != j:
+                        grid[j][i] = _mirror(value, symmetry)
+                    k += 1
+            return mx.create_matrix(grid)
+        rows, cols, values = array('l'), array('l'), []
+        for line in f:
+            if line.startswith('%') or not line.strip():
+                continue
+            tokens = line.split()
+            i, j = int(tokens[0]) - 1, int(tokens[1]) - 1
+            value = _mm_value(tokens[2:], field)
+            rows.append(i)
+            cols.append(j)
+            values.append(value)
+            if symmetry != 'general' and i != j:
+                rows.append(j)
+                cols.append(i)
+                values.append(_mirror(value, symmetry))
+    return _assemble(m, n, rows, cols, values)
+
+
+def _mirror(value, symmetry: str):
+    if symmetry == 'skew-symmetric':
+        return -value
+    if symmetry == 'hermitian':
+        return value.conjugate()
+    return value
+
+
+def _assemble(m: int, n: int, rows, cols, values) -> mx.SparseMatrix:
+    # a counting sort of the COO entries by row, then each row is sorted by column, with
+    # duplicates summed and zeros dropped
+    counts = array('l', [0] * (m + 1))
+    for i in rows:
+        counts[i + 1] += 1
+    for i in range(m):
+        counts[i + 1] += counts[i]
+    order = array('l', [0] * len(rows))
+    fill = counts[:]
+    for k, i in enumerate(rows):
+        order[fill[i]] = k
+        fill[i] += 1
+    indptr, indices, data = array('l', [0]), array('l'), []
+    for i in range(m):
+        last = -1
+        for k in sorted(order[counts[i]:counts[i + 1]], key=cols.__getitem__):
+            j = cols[k]
+            if j == last:
+                data[-1] += values[k]
+            else:
+                indices.append(j)
+                data.append(values[k])
+                last = j
+        start = indptr[-1]
+        # zeros (given, or from duplicates cancelling) are dropped
+        kept = [(j, x) for j, x in zip(indices[start:], data[start:]) if x != 0]
+        del indices[start:], data[start:]
+        for j, x in kept:
+            indices.append(j)
+            data.append(x)
+        indptr.append(len(indices))
+    return mx._sparse_from_csr(m, n, indptr, indices, mx._buffer(data))
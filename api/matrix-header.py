@@ -8,11 +8,29 @@ This file contains the documentation for matrix.py
 #    :param ls: the LinearSystem representation of the matrix
 #
 #  FIELDS:
-#   * ls: the LinearSystem representation of the matrix
+#   * data: the entries of the matrix, stored row-major in a single buffer
+#           (an array of doubles for real matrices, a list otherwise, including when an
+#           entry is a Fraction or an int beyond 2**53, which a double can't hold exactly)
+#   * stride: the distance in data between the starts of consecutive rows,
+#             i.e., entry (i,j) is data[(i-1)*stride + (j-1)]
+#   * b: the augmented column, stored in a buffer of length m
+#   * ls: the LinearSystem representation of the matrix, built on request and kept until the
+#         matrix is modified
+#         note: ls is read-only, modifying it (e.g. by eq.apply_ero(A.ls, ero)) raises an
+#               AttributeError or TypeError; modify a copy and assign it back with
+#               ls = A.ls.copy(); ...; A.ls = ls (or use apply_ero(A, ero) instead)
 #   * augmented: true means this is an augmented matrix, false otherwise
 #   * m: number of rows
 #   * n: number of columns
 #
+#  CLASS METHODS (each builds the Matrix in a single pass over its entries):
+#   * Matrix.from_buffer(m, n, data, b) produces the m*n Matrix with the row-major entries in
+#     data (an array of doubles is used as the storage, without copying it), augmented with b
+#     if b is given
+#   * Matrix.from_rows(rows) produces the Matrix with the given rows (sequences or Vectors,
+#     shorter ones are padded with zeros)
+#   * Matrix.from_columns(cols) produces the Matrix with the given columns (sequences or Vectors)
+#
 #  METHODS:
 #   * copy() produces a copy of self
 #   * sub(i, j) produces the the value at coordinates (i,j) of the matrix
@@ -20,9 +38,48 @@ This file contains the documentation for matrix.py
 #   * aug(k) produces the kth component of the augmented vector
 #   * aug_set(k, value) sets the kth component of the augmented vector to value
 #   * augment_with(b) sets the augmented column to b
-#   * row(i) produces the ith row vector
-#   * col(i) produces the ith column vector
+#   * row(i) produces the ith row vector, as a VectorView of self
+#   * col(i) produces the ith column vector, as a VectorView of self
 #   * get_b() produces the vector b, which is the augmented column
+#
+#  OPERATORS:
+#   * A + B, A - B, -A, c * A (A * c), A @ B and A @ v produce matrix_add(A, B),
+#     matrix_subtract(A, B), matrix_negate(A), matrix_scalar_product(A, c),
+#     matrix_matrix_product(A, B) and matrix_vector_product(A, v); B can be a SparseMatrix,
+#     on either side
+#   * A += B, A -= B and A *= c modify the entries of A in place, without allocating (the
+#     storage is only replaced when a real A has to hold complex values); on a MatrixView
+#     they modify root
+#
+#  CACHING:
+#   Derived results (rank, consistency, RREF, pivot columns, factorizations, determinant,
+#   inverse, transpose, ...) are cached on the Matrix, so repeat queries on an unchanged Matrix
+#   are O(1). Every modification through set, aug_set, augment_with, ls, apply_ero, to_rref or
+#   a view bumps the version of the Matrix and drops its cached results
+#   note: writing into data directly bypasses this, and leaves stale results behind
+
+# VectorView(parent, start, step, dim):
+#    A VectorView is a Vector whose components are dim entries of the storage of the Matrix
+#    parent, from data[start] and step apart; nothing is copied, so it always reads the current
+#    entries of parent, and it can be passed anywhere a Vector is expected
+#    (except extend_zeros, since it can't change its dimension)
+#    components is read-only (a write through it would leave the results cached on parent
+#    behind), the components are modified with set or the in-place operators (+=, -=, *=)
+#
+#  METHODS:
+#   * copy() produces a Vector holding a copy of the components
+#   * set(k, value) sets the kth component to value, which modifies parent
+
+# MatrixView(root, offset, row_step, col_step, m, n):
+#    A MatrixView is a Matrix whose entries are stored in the Matrix root, entry (i,j) is
+#    root.data[offset + (i-1)*row_step + (j-1)*col_step]; it is produced by submatrix and
+#    matrix_transpose, and it supports all of the methods and functions a Matrix does
+#    writes through the view (set, apply_ero, to_rref, ...) modify root, and results cached on
+#    the view are dropped whenever root is modified; copy() produces an independent Matrix
+#    note: the augmented column of a view is its own, it isn't shared with root
+#          a transposed view packs its entries into a buffer when a function needs its data
+#          (once per modification of root)
+#          a view is invalid once root has changed its dimensions (by setting root.ls)
 
 # SuperAugmentedMatrix(rhs, lhs):
 #     A SuperAugmentedMatrix represents a system of linear equations with multiple
@@ -36,6 +93,87 @@ This file contains the documentation for matrix.py
 #   * m: number of rows
 #   * n: number of columns (in rhs)
 
+# LUFactorization(L, U, perm, pivots, tolerance):
+#    A LUFactorization holds the factorization PA = LU of an m*n matrix A, computed by
+#    Gaussian elimination with partial pivoting (see lu_factor)
+#    :param L: the m*m unit lower triangular factor
+#    :param U: the m*n upper triangular (row echelon) factor
+#    :param perm: the row permutation, row i of PA is row perm[i-1] of A
+#    :param pivots: the pivot columns of A, in increasing order
+#
+#  FIELDS:
+#   * L, U, perm, pivots: as above
+#   * rank: the rank of A
+#   * tolerance: the cutoff of the pivots, which residuals are also checked against
+#   * m: number of rows of A
+#   * n: number of columns of A
+#
+#  METHODS:
+#   * solve(b) produces a solution x to Ax = b, with all free variables set to 0
+#      requires: Ax = b is consistent
+#   * solve_many(B) produces the matrix X whose columns solve A(X.col(j)) = B.col(j)
+#      requires: every system is consistent
+#   * rref() produces the RREF of A
+
+# QRFactorization(R, reflectors):
+#    A QRFactorization holds the factorization A = QR of an m*n matrix A, computed by
+#    Householder reflections (see qr_factor); Q is kept implicitly as its reflectors
+#    :param R: the m*n upper triangular factor
+#    :param reflectors: the Householder vectors, as (k, v), each reflection I - 2vv* acts on
+#                       rows k+1..m (v* is the conjugate transpose of v)
+#
+#  FIELDS:
+#   * R, reflectors: as above
+#   * m: number of rows of A
+#   * n: number of columns of A
+#
+#  METHODS:
+#   * q(economy) produces the m*m unitary factor Q, or its first min(m, n) columns if economy
+#   * r(economy) produces R, or its first min(m, n) rows if economy
+#   * solve(b) produces the least squares solution x to Ax = b, i.e., ||Ax - b|| is minimal
+#      requires: A has full column rank (so m >= n)
+#   * solve_many(B) produces the matrix X whose columns are the least squares solutions to
+#      A(X.col(j)) = B.col(j)
+#      requires: A has full column rank
+
+# SparseMatrix(m, n, entries):
+#    A SparseMatrix is an m*n matrix which only stores its nonzero entries, in compressed
+#    sparse row (CSR) form, so its memory scales with the number of nonzero entries
+#    :param m: number of rows
+#    :param n: number of columns
+#    :param entries: the nonzero entries, as (i, j, value) triples (COO form)
+#                    duplicate coordinates are summed, zero values are dropped
+#
+#  FIELDS:
+#   * m: number of rows
+#   * n: number of columns
+#   * nnz: number of stored (nonzero) entries
+#   * indptr: the entries of row i are stored at positions indptr[i-1] to indptr[i] - 1
+#   * indices: indices[k] is the (0-indexed) column of the kth stored entry
+#   * values: values[k] is the value of the kth stored entry
+#   * augmented: always false
+#
+#  METHODS:
+#   * copy() produces a copy of self
+#   * entries() produces the nonzero entries of self, as (i, j, value) triples, row by row
+#   * sub(i, j) produces the the value at coordinates (i,j) of the matrix
+#   * row(i) produces the ith row vector
+#   * col(i) produces the ith column vector
+#
+#  matrix_equal, matrix_add, matrix_negate, matrix_subtract, matrix_scalar_product,
+#  matrix_vector_product, matrix_matrix_product and matrix_transpose accept a SparseMatrix
+#  for any of their Matrix arguments. Operations on only SparseMatrix operands produce a
+#  SparseMatrix, operations which mix in a Matrix produce a Matrix
+#  to_rref, rank, is_consistent, nullity, rref, pivot_columns, lu_factor, qr_factor, qr,
+#  lstsq, determinant, inverse, condition_number and homogeneous accept a SparseMatrix too:
+#  they work on its dense form (converted once, and cached on it like their results), to_rref
+#  stores the RREF back into the SparseMatrix, and homogeneous produces an augmented Matrix
+#  the structured matrices of structured.py are accepted the same way (see structured-header.py)
+
+# matrix_to_sparse(A) produces the SparseMatrix with the same entries as the Matrix A
+
+# sparse_to_matrix(S) produces the (dense) Matrix with the same entries as the SparseMatrix S
+
 # zero_matrix(m, n) produces an m*n zero matrix
 
 # matrix_equal(A, B) produces true if A and B are identical matrices
@@ -44,28 +182,91 @@ This file contains the documentation for matrix.py
 
 # matrix_negate(A) produces -A
 
-# matrix_subtract(A, B) produces A - B
+# matrix_subtract(A, B) produces A - B, in one pass over A and B
 
 # matrix_scalar_product(A, c) produces cA
 
-# create_matrix(grid) produces a matrix with the coordinates given in grid (2d-array)
+# create_matrix(grid) produces a matrix with the coordinates given in grid (2d-array),
+#  i.e., Matrix.from_rows(grid)
 
-# matrix_from_columns(cols) produces a matrix composed of the column vectors given in cols
+# matrix_from_columns(cols) produces a matrix composed of the column vectors given in cols,
+#  i.e., Matrix.from_columns(cols)
 
 # apply_ero(A, ero) applies ero to matrix A, modifies A
 
-# to_rref(A) uses the Canonical-Gauss-Jordan algorithm to convert A into its RREF
-#  requires: the first column is not the zero vector
+# lu_factor(A) produces the LUFactorization of the coefficient matrix of A
+#  a pivot is taken as zero at or below TOLERANCE, scaled down by the largest entry of A when
+#  that is below 1 (so e.g. 1e-5 * I is invertible); to_rref uses the same cutoff
+#  the factorization is cached on A until A is modified (through set, aug_set, augment_with,
+#  apply_ero or to_rref), so it must not be modified
+
+# qr_factor(A) produces the QRFactorization of the coefficient matrix of A
+#  the factorization is cached on A in the same way as lu_factor
+
+# qr(A, economy) produces (Q, R), where A = QR, Q is unitary and R is upper triangular
+#  if economy, Q is m*min(m, n) with orthonormal columns, and R is min(m, n)*n
+
+# lstsq(A, b) produces the least squares solution x to Ax = b, solved by QR, without
+#  forming the normal equations; if b is a Matrix, each of its columns is solved for
+#  a structured A (see structured.py) solves Ax = b with its own kernel
+#  requires: A has full column rank
 
-# rank(A) produces the rank of A
+# determinant(A, exact) produces the determinant of A
+#  if exact, it is computed without rounding (see to_rref), as an int or a Fraction
+#  requires: A is square
 
-# is_consistent(A) produces true if A is consistent
+# inverse(A) produces the inverse of A
+#  the same Matrix is produced by repeat calls, unless A or the inverse have been modified
+#  a structured A (see structured.py) produces its own inverse, and determinant(A, exact) its
+#  own determinant
+#  requires: A is square and invertible
 
-# nullity(A) produces the nullity of A
+# condition_number(A) produces the condition number of A in the 1-norm, ||A|| * ||inv(A)||,
+#  or inf if A is singular
+#  requires: A is square
+
+#  note: determinant, inverse and condition_number share the cached LU factorization of A, so
+#        only the first of them costs an elimination, and their results are cached as well
+
+# to_rref(A) uses the Canonical-Gauss-Jordan algorithm to convert A into its RREF, modifies A
+#  the elimination runs in place on the storage of A, with partial pivoting
+#  if A is a SuperAugmentedMatrix, A.lhs is factored once and every column of A.rhs is
+#  reduced against that factorization
+#  if exact, the entries are taken as ints and Fractions (a double is converted exactly) and
+#  no tolerance is involved: each row is scaled to integers and reduced by fraction-free
+#  (Bareiss) Gauss-Jordan elimination, whose divisions are all exact, then every entry is
+#  divided once by the common pivot. A holds ints and Fractions afterwards
+#  requires: the entries of A are real, if exact
+
+# rank(A, exact) produces the rank of A
+#  if A is augmented, the augmented column is included
+#  if exact, the rank is certified by fraction-free elimination (see to_rref)
+
+# is_consistent(A, exact) produces true if A is consistent
+
+# rref(A) produces the RREF of A, without modifying A
+#  the same Matrix is produced by repeat calls, unless A or the RREF have been modified
+
+# pivot_columns(A) produces the pivot columns of the coefficient matrix of A, in increasing order
+
+# nullity(A, exact) produces the nullity of A
+
+#  note: the exact echelon form of A is cached on A, and shared by rank, is_consistent,
+#        nullity and determinant when exact is true
 
 # homogeneous(A) produces the equivalent homogeneous system of A
 
 # matrix_vector_product(A, v) produces the matrix vector product, Av
+#  any other A with a matrix_vector_product(v) method (e.g. the file-backed matrices of
+#  loaders.py) computes the product itself
+
+# matrix_matrix_product(A, B) produces the matrix product, AB
+#  the product is computed over TILE_SIZE*TILE_SIZE blocks, working along the rows of B;
+#  identity and zero operands are answered without any arithmetic
+#  a structured A or B (see structured.py) computes the product with its own kernels
+#  requires: A.n == B.m
+
+# TILE_SIZE: the block size used by matrix_matrix_product
 
 # col_space(A) produces the column space of A, i.e., Col(A)
 
@@ -74,4 +275,13 @@ This file contains the documentation for matrix.py
 
 # identity(n) produces the identity matrix in n*n space
 
-# matrix_transpose(A) produces the transpose of A
+# matrix_transpose(A) produces the transpose of A, as a MatrixView of A (nothing is copied)
+#  each call produces a new view, the entries packed for a transposed view are kept on A (until
+#  A is modified) and shared by every transpose of A
+#  a SparseMatrix produces a new SparseMatrix
+#  any other A with a transpose() method (e.g. the file-backed matrices of loaders.py and the
+#  structured matrices of structured.py) produces its own transpose
+
+# submatrix(A, i1, i2, j1, j2) produces the entries of A in rows i1..i2 and columns j1..j2,
+#  as a MatrixView of A (nothing is copied)
+#  requires: 1 <= i1 <= i2 <= A.m and 1 <= j1 <= j2 <= A.n
@@ -1,16 +1,52 @@
 
+from array import array
+from bisect import bisect_left
+from fractions import Fraction
+from itertools import chain
+from math import lcm, sqrt
+from numbers import Number
 from typing import List
+import api.backend as bk
 import api.equation as eq
 import api.vector as vc
 import api.space as sp
 
+# the block size used by the tiled loops of matrix_matrix_product
+TILE_SIZE = 64
+
+
+def _buffer(values):
+    # real entries are packed into a contiguous array of doubles, anything else (complex
+    # entries, or ones a double can't hold exactly, like Fractions and large ints) falls back
+    # to a plain list, so nothing is rounded before an exact computation sees it
+    if not hasattr(values, '__len__'):
+        # an iterator is used up by a failed attempt at packing it
+        values = list(values)
+    if isinstance(values, array) and values.typecode == 'd' or vc._packable(values):
+        return array('d', values)
+    return list(values)
+
+
+def _from_buffer(m: int, n: int, data, b=None):
+    # produces an m*n Matrix which takes ownership of the row-major buffer data
+    A = Matrix.__new__(Matrix)
+    A._version = 0
+    A._cache = {}
+    A.augmented = False
+    A.m = m
+    A.n = n
+    A.stride = n
+    A.data = data
+    A.b = _buffer([0] * m) if b is None else b
+    return A
+
 
 class Matrix:
     def __init__(self, ls: eq.LinearSystem):
-        self.ls = ls
+        self._version = 0
+        self._cache = {}
         self.augmented = False
-        self.m = ls.m
-        self.n = ls.n
+        self.ls = ls
 
     def __repr__(self):
         width = 6
@@ -23,6 +59,8 @@ class Matrix:
                     output += f'{0:^{width}.{decimals}g}'
                 elif isinstance(self.sub(i, j), complex):
                     output += f'{vc.format_complex(self.sub(i, j)):^{width}}'
+                elif isinstance(self.sub(i, j), Fraction):
+                    output += f'{str(self.sub(i, j)):^{width}}'
                 else:
                     output += f'{self.sub(i, j):^{width}.{decimals}g}'
             if self.augmented:
@@ -30,55 +68,431 @@ class Matrix:
                     output += f' | {0:^{width}.{decimals}g}'
                 elif isinstance(self.aug(i), complex):
                     output += f' | {vc.format_complex(self.aug(i)):^{width}}'
+                elif isinstance(self.aug(i), Fraction):
+                    output += f' | {str(self.aug(i)):^{width}}'
                 else:
                     output += f' | {self.aug(i):^{width}.{decimals}g}'
             output += ' ]\n'
         return output
 
+    @classmethod
+    def from_buffer(cls, m: int, n: int, data, b=None):
+        # an array of doubles becomes the storage as it is, anything else is packed
+        assert len(data) == m * n, f"Expected {m * n} entries, got {len(data)}"
+        assert b is None or len(b) == m, f"Expected {m} augmented entries, got {len(b)}"
+        if not (isinstance(data, array) and data.typecode == 'd'):
+            data = _buffer(data)
+        A = _from_buffer(m, n, data, None if b is None else _buffer(b))
+        A.augmented = b is not None
+        return A
+
+    @classmethod
+    def from_rows(cls, rows):
+        rows = [row.components if isinstance(row, vc.Vector) else row for row in rows]
+        n = max((len(row) for row in rows), default=0)
+        values = []
+        for row in rows:
+            values.extend(row)
+            if len(row) < n:
+                # short rows are padded with zeros, as in a LinearSystem
+                values.extend([0] * (n - len(row)))
+        return _from_buffer(len(rows), n, _buffer(values))
+
+    @classmethod
+    def from_columns(cls, cols):
+        cols = [col.components if isinstance(col, vc.Vector) else col for col in cols]
+        assert len(cols) > 0, "Given empty list of vectors"
+        m, n = len(cols[0]), len(cols)
+        values = [0] * (m * n)
+        for j, col in enumerate(cols):
+            assert len(col) == m, "Inconsistent dimensions of given cols"
+            values[j::n] = col
+        return _from_buffer(m, n, _buffer(values))
+
+    @property
+    def ls(self) -> eq.LinearSystem:
+        # a read-only LinearSystem of the entries, built once per version of self: a change is
+        # made to ls.copy(), and assigned back with self.ls = ls
+        return _cached(self, 'ls', _frozen_system)
+
+    @ls.setter
+    def ls(self, ls: eq.LinearSystem):
+        self.m = ls.m
+        self.n = ls.n
+        self.stride = ls.n
+        self.data = _buffer([c for le in ls.e[1:] for c in le.a.components])
+        self.b = _buffer([le.rhs for le in ls.e[1:]])
+        self._touch()
+
+    def _touch(self):
+        # every modification of self invalidates the results cached on it
+        self._version += 1
+        self._cache.clear()
+
+    def _admit(self, value):
+        # promotes the storage to lists when value can't be held (exactly) as a double
+        if not vc._packable([value]):
+            if isinstance(self.data, array):
+                self.data = list(self.data)
+            if isinstance(self.b, array):
+                self.b = list(self.b)
+
     def copy(self):
-        return Matrix(self.ls.copy())
+        B = _from_buffer(self.m, self.n, self.data[:], self.b[:])
+        B.augmented = self.augmented
+        B.stride = self.stride
+        return B
 
     def sub(self, i: int, j: int):
-        row = self.ls.e[i]
-        assert isinstance(row, eq.LinearEquation)
-        return row.a.sub(j)
+        assert 1 <= i <= self.m and 1 <= j <= self.n, "Invalid entry request"
+        return self.data[(i - 1) * self.stride + j - 1]
 
     def set(self, i: int, j: int, value):
-        row = self.ls.e[i]
-        assert isinstance(row, eq.LinearEquation)
-        row.a.components[j - 1] = value
+        assert 1 <= i <= self.m and 1 <= j <= self.n, "Invalid entry request"
+        self._admit(value)
+        self.data[(i - 1) * self.stride + j - 1] = value
+        self._touch()
 
     def aug(self, k: int):
         assert self.augmented
-        row = self.ls.e[k]
-        assert isinstance(row, eq.LinearEquation)
-        return row.rhs
+        return self.b[k - 1]
 
     def aug_set(self, k: int, value):
         assert self.augmented
-        row = self.ls.e[k]
-        assert isinstance(row, eq.LinearEquation)
-        row.rhs = value
+        self._admit(value)
+        self.b[k - 1] = value
+        self._touch()
 
     def augment_with(self, b: vc.Vector):
         assert b.dim == self.m
         self.augmented = True
-        for i in range(1, self.m + 1):
-            self.aug_set(i, b.sub(i))
+        self.b = _buffer(b.components)
+        self._touch()
 
     def row(self, i: int):
         assert 1 <= i <= self.m, "Invalid row request"
-        return self.ls.e[i].a.copy()
+        return VectorView(self, (i - 1) * self.stride, 1, self.n)
 
     def col(self, i: int):
         assert 1 <= i <= self.n
-        li = [self.sub(r, i) for r in range(1, self.m + 1)]
-        return vc.Vector(*li)
+        return VectorView(self, i - 1, self.stride, self.m)
 
     def get_b(self):
         assert self.augmented
-        li = [self.ls.e[i].rhs for i in range(1, self.m + 1)]
-        return vc.Vector(*li)
+        return vc.Vector.from_sequence(self.b)
+
+    def __add__(self, B):
+        if not isinstance(B, (Matrix, SparseMatrix)):
+            return NotImplemented
+        return matrix_add(self, B)
+
+    def __radd__(self, B):
+        if not isinstance(B, SparseMatrix):
+            return NotImplemented
+        return matrix_add(B, self)
+
+    def __sub__(self, B):
+        if not isinstance(B, (Matrix, SparseMatrix)):
+            return NotImplemented
+        return matrix_subtract(self, B)
+
+    def __rsub__(self, B):
+        if not isinstance(B, SparseMatrix):
+            return NotImplemented
+        return matrix_subtract(B, self)
+
+    def __mul__(self, c):
+        if not isinstance(c, Number):
+            return NotImplemented
+        return matrix_scalar_product(self, c)
+
+    __rmul__ = __mul__
+
+    def __matmul__(self, X):
+        if isinstance(X, vc.Vector):
+            return matrix_vector_product(self, X)
+        if not isinstance(X, (Matrix, SparseMatrix)):
+            return NotImplemented
+        return matrix_matrix_product(self, X)
+
+    def __rmatmul__(self, A):
+        if not isinstance(A, SparseMatrix):
+            return NotImplemented
+        return matrix_matrix_product(A, self)
+
+    def __neg__(self):
+        return matrix_negate(self)
+
+    def __iadd__(self, B):
+        if not isinstance(B, (Matrix, SparseMatrix)) and not _is_structured(B):
+            return NotImplemented
+        _add_into(self, B)
+        return self
+
+    def __isub__(self, B):
+        if not isinstance(B, (Matrix, SparseMatrix)) and not _is_structured(B):
+            return NotImplemented
+        _add_into(self, B, -1)
+        return self
+
+    def __imul__(self, c):
+        if not isinstance(c, Number):
+            return NotImplemented
+        for v in _storage(self):
+            vc._scale_into(v, c)
+        return self
+
+
+class _Window:
+    # a zero-copy window onto a list, entry k is data[start + k * step]
+    __slots__ = ('data', 'start', 'length', 'step', 'writable')
+
+    def __init__(self, data: List, start: int, length: int, step: int, writable: bool = True):
+        self.data = data
+        self.start = start
+        self.length = length
+        self.step = step
+        self.writable = writable
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        return map(self.data.__getitem__, range(self.start, self.start + self.length * self.step, self.step))
+
+    def _index(self, k: int) -> int:
+        if k < 0:
+            k += self.length
+        if not 0 <= k < self.length:
+            raise IndexError('window index out of range')
+        return self.start + k * self.step
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [self.data[self.start + i * self.step] for i in range(*k.indices(self.length))]
+        return self.data[self._index(k)]
+
+    def __setitem__(self, k, value):
+        if not self.writable:
+            raise TypeError('cannot modify read-only memory')
+        if isinstance(k, slice):
+            for i, x in zip(range(*k.indices(self.length)), value):
+                self.data[self.start + i * self.step] = x
+        else:
+            self.data[self._index(k)] = value
+
+
+def _window(data, start: int, length: int, step: int = 1, writable: bool = True):
+    # produces the length entries of data from start, step apart, without copying them
+    if isinstance(data, array):
+        window = memoryview(data)[start:start + (length - 1) * step + 1:step]
+        return window if writable else window.toreadonly()
+    return _Window(data, start, length, step, writable)
+
+
+class VectorView(vc.Vector):
+    """
+    VectorView(parent, start, step, dim) is a Vector whose components are entries of the
+    storage of the Matrix parent, so reads always see the current entries of parent
+    """
+    __slots__ = ('_parent', '_start', '_step')
+
+    def __init__(self, parent: Matrix, start: int, step: int, dim: int):
+        self._parent = parent
+        self._start = start
+        self._step = step
+        self.dim = dim
+
+    @property
+    def components(self):
+        # read-only, since a write through it would leave stale results cached on parent;
+        # components are modified with set, or the in-place operators
+        return _window(self._parent.data, self._start, self.dim, self._step, writable=False)
+
+    def _writable(self):
+        return _window(self._parent.data, self._start, self.dim, self._step)
+
+    @property
+    def field(self) -> str:
+        if isinstance(self._parent.data, list) and any(isinstance(x, complex) for x in self.components):
+            return 'complex'
+        return 'real'
+
+    def copy(self):
+        return vc.Vector.from_sequence(self.components)
+
+    def set(self, k: int, value):
+        assert 1 <= k <= self.dim, "Invalid component request"
+        self._parent._admit(value)
+        self._parent.data[self._start + (k - 1) * self._step] = value
+        self._parent._touch()
+
+    def _admit(self, value):
+        self._parent._admit(value)
+
+    def _touch(self):
+        self._parent._touch()
+
+
+_READ_ONLY = "The LinearSystem of a Matrix is read-only, modify ls.copy() and assign it back"
+
+
+class _FrozenVector(vc.Vector):
+    # the coefficients of an equation of Matrix.ls, which can't be modified
+    __slots__ = ()
+
+    def copy(self):
+        return vc.Vector.from_sequence(self.components)
+
+    def _admit(self, value):
+        raise TypeError(_READ_ONLY)
+
+    def _writable(self):
+        raise TypeError(_READ_ONLY)
+
+
+class _FrozenEquation(eq.LinearEquation):
+    def __init__(self, loc, rhs):
+        a = _FrozenVector.from_sequence(loc)
+        a.components = memoryview(a.components).toreadonly() if isinstance(a.components, array) else tuple(a.components)
+        object.__setattr__(self, 'n', a.dim)
+        object.__setattr__(self, 'a', a)
+        object.__setattr__(self, 'rhs', rhs)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(_READ_ONLY)
+
+
+class _FrozenSystem(eq.LinearSystem):
+    def __setattr__(self, name, value):
+        raise AttributeError(_READ_ONLY)
+
+
+def _frozen_system(A: Matrix) -> eq.LinearSystem:
+    # produces the LinearSystem of the entries of A, whose equations (a tuple), coefficients
+    # and right-hand sides can't be modified
+    ls = _FrozenSystem.__new__(_FrozenSystem)
+    rows = (A.data[i * A.stride:i * A.stride + A.n] for i in range(A.m))
+    equations = (_FrozenEquation(row, r) for row, r in zip(rows, A.b))
+    object.__setattr__(ls, 'm', A.m)
+    object.__setattr__(ls, 'n', A.n)
+    object.__setattr__(ls, 'e', (None, *equations))
+    return ls
+
+
+class MatrixView(Matrix):
+    """
+    MatrixView is an m*n window onto the storage of a Matrix root, entry (i, j) of the view
+    is root.data[offset + (i - 1) * row_step + (j - 1) * col_step]; see submatrix and
+    matrix_transpose
+    """
+
+    def __init__(self, root: Matrix, offset: int, row_step: int, col_step: int, m: int, n: int):
+        self._root = root
+        self._offset = offset
+        self._row_step = row_step
+        self._col_step = col_step
+        self._own = {}
+        self._seen = root._version
+        self._version = 0
+        self.augmented = False
+        self.m = m
+        self.n = n
+        self.b = _buffer([0] * m)
+
+    @property
+    def _cache(self) -> dict:
+        # results cached on the view are dropped whenever the root changes
+        if self._seen != self._root._version:
+            self._seen = self._root._version
+            self._own.clear()
+        return self._own
+
+    @property
+    def data(self):
+        # rows of the root are shared as they are, a transposed view is packed once per change of
+        # the root, and the packed entries are kept on the root for every view of the same window
+        if self._col_step == 1:
+            return _window(self._root.data, self._offset, (self.m - 1) * self._row_step + self.n)
+        cache = self._root._cache
+        key = ('data', self._offset, self._row_step, self._col_step, self.m, self.n)
+        if key not in cache:
+            cache[key] = _buffer([x for i in range(1, self.m + 1) for x in self.row(i).components])
+        return cache[key]
+
+    @property
+    def stride(self) -> int:
+        return self._row_step if self._col_step == 1 else self.n
+
+    @property
+    def ls(self) -> eq.LinearSystem:
+        return Matrix.ls.fget(self)
+
+    @ls.setter
+    def ls(self, ls: eq.LinearSystem):
+        assert ls.m == self.m and ls.n == self.n, "A view can't change its dimensions"
+        _assign(self, Matrix(ls))
+        self.b = _buffer([le.rhs for le in ls.e[1:]])
+
+    def _index(self, i: int, j: int) -> int:
+        return self._offset + (i - 1) * self._row_step + (j - 1) * self._col_step
+
+    def _touch(self):
+        self._version += 1
+        self._root._touch()
+
+    def _admit(self, value):
+        self._root._admit(value)
+        if isinstance(value, (complex, Fraction)) and isinstance(self.b, array):
+            self.b = list(self.b)
+
+    def copy(self):
+        B = _from_buffer(self.m, self.n, _buffer([x for i in range(1, self.m + 1) for x in self.row(i).components]), self.b[:])
+        B.augmented = self.augmented
+        return B
+
+    def sub(self, i: int, j: int):
+        assert 1 <= i <= self.m and 1 <= j <= self.n, "Invalid entry request"
+        return self._root.data[self._index(i, j)]
+
+    def set(self, i: int, j: int, value):
+        assert 1 <= i <= self.m and 1 <= j <= self.n, "Invalid entry request"
+        self._admit(value)
+        self._root.data[self._index(i, j)] = value
+        self._touch()
+
+    def row(self, i: int):
+        assert 1 <= i <= self.m, "Invalid row request"
+        return VectorView(self._root, self._index(i, 1), self._col_step, self.n)
+
+    def col(self, i: int):
+        assert 1 <= i <= self.n
+        return VectorView(self._root, self._index(1, i), self._row_step, self.m)
+
+
+def _view(A: Matrix, i: int, j: int, m: int, n: int, transposed: bool = False) -> MatrixView:
+    # produces the m*n view of A from entry (i, j), or of its transpose
+    if isinstance(A, MatrixView):
+        root, offset, row_step, col_step = A._root, A._index(i, j), A._row_step, A._col_step
+    else:
+        root, offset, row_step, col_step = A, (i - 1) * A.stride + j - 1, A.stride, 1
+    if transposed:
+        row_step, col_step = col_step, row_step
+    return MatrixView(root, offset, row_step, col_step, m, n)
+
+
+def _assign(A: Matrix, B: Matrix):
+    # overwrites the entries of A with those of B, where B is a new Matrix of the same size
+    if isinstance(A, MatrixView):
+        for i in range(1, A.m + 1):
+            for j in range(1, A.n + 1):
+                x = B.data[(i - 1) * B.stride + j - 1]
+                A._root._admit(x)
+                A._root.data[A._index(i, j)] = x
+    else:
+        A.data = B.data
+        A.stride = B.stride
+    A._touch()
 
 
 class SuperAugmentedMatrix:
@@ -111,229 +525,1006 @@ class SuperAugmentedMatrix:
         return output
 
 
+class LUFactorization:
+    def __init__(self, L: Matrix, U: Matrix, perm: List[int], pivots: List[int], tolerance=vc.TOLERANCE):
+        self.tolerance = tolerance
+        self.L = L
+        self.U = U
+        self.perm = perm
+        self.pivots = pivots
+        self.rank = len(pivots)
+        self.m = U.m
+        self.n = U.n
+
+    def __repr__(self):
+        return f'L =\n{self.L}U =\n{self.U}perm = {self.perm}'
+
+    def _forward(self, b) -> List:
+        # solves Ly = Pb by forward substitution
+        m, L = self.m, self.L.data
+        y = [b[p - 1] for p in self.perm]
+        for k in range(self.rank):
+            yk = y[k]
+            if yk != 0:
+                for i in range(k + 1, m):
+                    y[i] -= L[i * m + k] * yk
+        return y
+
+    def _reduce(self, b) -> List:
+        # produces the augmented column of the RREF of (A | b): the values of the
+        # pivot variables (with the free variables set to 0), followed by the residuals
+        y = self._forward(b)
+        n, U = self.n, self.U.data
+        for k in range(self.rank - 1, -1, -1):
+            row = k * n
+            total = y[k]
+            for j in range(k + 1, self.rank):
+                total -= U[row + self.pivots[j] - 1] * y[j]
+            y[k] = total / U[row + self.pivots[k] - 1]
+        return y
+
+    def _is_consistent(self, c) -> bool:
+        return all(abs(c[i]) <= self.tolerance for i in range(self.rank, self.m))
+
+    def solve(self, b: vc.Vector) -> vc.Vector:
+        assert b.dim == self.m, "b has the wrong dimension"
+        c = self._reduce(b.components)
+        assert self._is_consistent(c), "The system is inconsistent"
+        x = [0] * self.n
+        for k in range(self.rank):
+            x[self.pivots[k] - 1] = c[k]
+        return vc.Vector.from_sequence(x)
+
+    def solve_many(self, B: Matrix) -> Matrix:
+        assert B.m == self.m, "B has the wrong number of rows"
+        X = [0] * (self.n * B.n)
+        for j in range(B.n):
+            c = self._reduce(B.data[j::B.stride])
+            assert self._is_consistent(c), f"The system for column {j + 1} is inconsistent"
+            for k in range(self.rank):
+                X[(self.pivots[k] - 1) * B.n + j] = c[k]
+        return _from_buffer(self.n, B.n, _buffer(X))
+
+    def rref(self) -> Matrix:
+        # back-eliminates U into the RREF of A
+        n, r = self.n, self.rank
+        R = self.U.data[:]
+        for c in range(r * n, self.m * n):
+            R[c] = 0
+        for k in range(r - 1, -1, -1):
+            row, q = k * n, self.pivots[k] - 1
+            pivot = R[row + q]
+            for c in range(row + q + 1, row + n):
+                R[c] /= pivot
+            R[row + q] = 1
+            for i in range(k):
+                f = R[i * n + q]
+                if f != 0:
+                    _row_axpy(R, i * n + q + 1, row + q + 1, n - q - 1, f)
+                    R[i * n + q] = 0
+        return _from_buffer(self.m, n, R)
+
+
+class QRFactorization:
+    def __init__(self, R: Matrix, reflectors: List):
+        self.R = R
+        self.reflectors = reflectors
+        self.m = R.m
+        self.n = R.n
+
+    def __repr__(self):
+        return f'Q =\n{self.q()}R =\n{self.R}'
+
+    def _apply(self, b) -> List:
+        # produces (Q^H)b, by applying the Householder reflectors in order
+        y = list(b)
+        for k, v in self.reflectors:
+            s = 2 * sum(a.conjugate() * y[k + i] for i, a in enumerate(v))
+            if s != 0:
+                for i, a in enumerate(v):
+                    y[k + i] -= s * a
+        return y
+
+    def _back(self, y) -> List:
+        # solves the leading n*n block of Rx = y by back substitution
+        n, R = self.n, self.R.data
+        x = [0] * n
+        for k in range(n - 1, -1, -1):
+            row = k * n
+            total = y[k] - sum(R[row + j] * x[j] for j in range(k + 1, n))
+            x[k] = total / R[row + k]
+        return x
+
+    def _check_rank(self):
+        assert self.m >= self.n, "A has more columns than rows"
+        for k in range(self.n):
+            assert abs(self.R.data[k * self.n + k]) > vc.TOLERANCE, "A does not have full column rank"
+
+    def q(self, economy: bool = False) -> Matrix:
+        m = self.m
+        p = min(m, self.n) if economy else m
+        Q = _buffer([0] * (m * p))
+        if isinstance(self.R.data, list):
+            Q = list(Q)
+        for i in range(p):
+            Q[i * p + i] = 1
+        # Q = H1 H2 ... Hk is applied to the first p columns of the identity, last reflector first
+        for k, v in reversed(self.reflectors):
+            for j in range(k, p):
+                s = 2 * sum(a.conjugate() * Q[(k + i) * p + j] for i, a in enumerate(v))
+                if s != 0:
+                    for i, a in enumerate(v):
+                        Q[(k + i) * p + j] -= s * a
+        return _from_buffer(m, p, Q)
+
+    def r(self, economy: bool = False) -> Matrix:
+        p = min(self.m, self.n) if economy else self.m
+        return _from_buffer(p, self.n, self.R.data[:p * self.n])
+
+    def solve(self, b: vc.Vector) -> vc.Vector:
+        assert b.dim == self.m, "b has the wrong dimension"
+        self._check_rank()
+        return vc.Vector.from_sequence(self._back(self._apply(b.components)))
+
+    def solve_many(self, B: Matrix) -> Matrix:
+        assert B.m == self.m, "B has the wrong number of rows"
+        self._check_rank()
+        X = [self._back(self._apply(B.data[j::B.stride])) for j in range(B.n)]
+        return _from_buffer(self.n, B.n, _buffer([X[j][i] for i in range(self.n) for j in range(B.n)]))
+
+
+class SparseMatrix:
+    def __init__(self, m: int, n: int, entries=()):
+        assert m > 0 and n > 0, "Invalid dimensions"
+        self._version = 0
+        self._cache = {}
+        self.augmented = False
+        self.m = m
+        self.n = n
+        # duplicate coordinates are summed, explicit zeros are dropped
+        coo = {}
+        for i, j, value in entries:
+            assert 1 <= i <= m and 1 <= j <= n, "Invalid entry coordinates"
+            coo[(i, j)] = coo.get((i, j), 0) + value
+        keys = sorted(k for k in coo if coo[k] != 0)
+        self.indptr = array('l', [0] * (m + 1))
+        for i, j in keys:
+            self.indptr[i] += 1
+        for i in range(m):
+            self.indptr[i + 1] += self.indptr[i]
+        self.indices = array('l', [j - 1 for i, j in keys])
+        self.values = _buffer([coo[k] for k in keys])
+        self.nnz = len(keys)
+
+    def __repr__(self):
+        output = f'SparseMatrix({self.m}x{self.n}, nnz={self.nnz})\n'
+        for i in range(self.m):
+            for k in range(self.indptr[i], self.indptr[i + 1]):
+                output += f'  ({i + 1}, {self.indices[k] + 1}): {self.values[k]}\n'
+        return output
+
+    def _touch(self):
+        self._version += 1
+        self._cache.clear()
+
+    def copy(self):
+        return _sparse_from_csr(self.m, self.n, self.indptr[:], self.indices[:], self.values[:])
+
+    def entries(self):
+        for i in range(self.m):
+            for k in range(self.indptr[i], self.indptr[i + 1]):
+                yield i + 1, self.indices[k] + 1, self.values[k]
+
+    def sub(self, i: int, j: int):
+        assert 1 <= i <= self.m and 1 <= j <= self.n, "Invalid entry request"
+        lo, hi = self.indptr[i - 1], self.indptr[i]
+        k = bisect_left(self.indices, j - 1, lo, hi)
+        if k < hi and self.indices[k] == j - 1:
+            return self.values[k]
+        return 0
+
+    def row(self, i: int):
+        assert 1 <= i <= self.m, "Invalid row request"
+        li = [0] * self.n
+        for k in range(self.indptr[i - 1], self.indptr[i]):
+            li[self.indices[k]] = self.values[k]
+        return vc.Vector.from_sequence(li)
+
+    def col(self, i: int):
+        assert 1 <= i <= self.n
+        return vc.Vector.from_sequence([self.sub(r, i) for r in range(1, self.m + 1)])
+
+
+def _sparse_from_csr(m: int, n: int, indptr, indices, values) -> SparseMatrix:
+    S = SparseMatrix.__new__(SparseMatrix)
+    S._version = 0
+    S._cache = {}
+    S.augmented = False
+    S.m = m
+    S.n = n
+    S.indptr = indptr
+    S.indices = indices
+    S.values = values
+    S.nnz = len(indices)
+    return S
+
+
+def _sparse_from_rows(m: int, n: int, rows) -> SparseMatrix:
+    # rows[i] is a dict {column: value} (0-indexed) of the nonzero entries of row i
+    indptr = array('l', [0])
+    indices = array('l')
+    values = []
+    for r in rows:
+        for j in sorted(r):
+            if r[j] != 0:
+                indices.append(j)
+                values.append(r[j])
+        indptr.append(len(indices))
+    return _sparse_from_csr(m, n, indptr, indices, _buffer(values))
+
+
+def _sparse_row(S: SparseMatrix, i: int) -> dict:
+    # the nonzero entries of (0-indexed) row i, as a dict {column: value}
+    return {S.indices[k]: S.values[k] for k in range(S.indptr[i], S.indptr[i + 1])}
+
+
+def matrix_to_sparse(A: Matrix) -> SparseMatrix:
+    rows = []
+    for i in range(A.m):
+        start = i * A.stride
+        rows.append({j: x for j, x in enumerate(A.data[start:start + A.n]) if x != 0})
+    return _sparse_from_rows(A.m, A.n, rows)
+
+
+def sparse_to_matrix(S: SparseMatrix) -> Matrix:
+    data = [0] * (S.m * S.n)
+    for i in range(S.m):
+        for k in range(S.indptr[i], S.indptr[i + 1]):
+            data[i * S.n + S.indices[k]] = S.values[k]
+    return _from_buffer(S.m, S.n, _buffer(data))
+
+
 def zero_matrix(m: int, n: int) -> Matrix:
-    return matrix_from_columns([
-        vc.Vector(*list([0] * m)) for i in range(n)
-    ])
+    return Matrix.from_buffer(m, n, array('d', bytes(8 * m * n)))
+
+
+def _entries(A: Matrix):
+    # produces the entries of A in row-major order, without copying its storage
+    if A.stride == A.n and not isinstance(A, MatrixView):
+        return A.data
+    return chain.from_iterable(A.row(i).components for i in range(1, A.m + 1))
+
+
+def _storage(A: Matrix) -> List[VectorView]:
+    # the entries of A as views of its storage: one for all of them if it is packed, and
+    # one per row otherwise
+    if A.stride == A.n and not isinstance(A, MatrixView):
+        return [VectorView(A, 0, 1, A.m * A.n)]
+    return [A.row(i) for i in range(1, A.m + 1)]
+
+
+def _root(A: Matrix) -> Matrix:
+    # the Matrix which holds the storage of A
+    return A._root if isinstance(A, MatrixView) else A
+
+
+def _add_into(A: Matrix, B, t=1):
+    # A += t * B, in place
+    assert A.n == B.n and A.m == B.m, "Matrices have different dimensions"
+    B = _plain(B)
+    if isinstance(B, SparseMatrix):
+        for i, j, value in B.entries():
+            A.set(i, j, A.sub(i, j) + t * value)
+        return
+    if B is not A and _root(B) is _root(A):
+        # B shares the storage of A (e.g. B is a transpose of A), so its entries would change
+        # while they are being read
+        B = B.copy()
+    targets, sources = _storage(A), _storage(B)
+    if len(targets) != len(sources):
+        targets, sources = [A.row(i) for i in range(1, A.m + 1)], [B.row(i) for i in range(1, B.m + 1)]
+    for v, w in zip(targets, sources):
+        vc._add_into(v, w, t)
 
 
 def matrix_equal(A: Matrix, B: Matrix) -> bool:
     if not (A.m == B.m and A.n == B.n):
         return False
+    A, B = _plain(A), _plain(B)
     assert A.augmented == B.augmented, "One Matrix is augmented, the other is not"
-    if A.augmented and vc.is_equal(A.get_b(), B.get_b()):
+    if isinstance(A, SparseMatrix) or isinstance(B, SparseMatrix):
+        return all(vc.is_equal(A.row(i), B.row(i)) for i in range(1, A.m + 1))
+    if A.augmented and not vc.is_equal(A.get_b(), B.get_b()):
         return False
-    for i in range(1, A.n + 1):
-        if not vc.is_equal(A.col(i), B.col(i)):
+    for a, b in zip(_entries(A), _entries(B)):
+        if abs(a - b) > vc.TOLERANCE:
             return False
     return True
 
 
 def matrix_add(A: Matrix, B: Matrix) -> Matrix:
     assert A.n == B.n and A.m == B.m, "Matrices have different dimensions"
-    cols = []
-    for i in range(1, B.n + 1):
-        cols.append(vc.add(A.col(i), B.col(i)))
-    return matrix_from_columns(cols)
+    A, B = _plain(A), _plain(B)
+    if isinstance(A, SparseMatrix) and isinstance(B, SparseMatrix):
+        rows = []
+        for i in range(A.m):
+            r = _sparse_row(A, i)
+            for k in range(B.indptr[i], B.indptr[i + 1]):
+                r[B.indices[k]] = r.get(B.indices[k], 0) + B.values[k]
+            rows.append(r)
+        return _sparse_from_rows(A.m, A.n, rows)
+    if isinstance(A, SparseMatrix):
+        A, B = B, A
+    if isinstance(B, SparseMatrix):
+        C = A.copy()
+        for i, j, value in B.entries():
+            C.set(i, j, C.sub(i, j) + value)
+        return C
+    if bk.use_numpy(A.m * A.n):
+        return _from_buffer(A.m, A.n, _buffer(bk.add(A.data, B.data) if A.stride == B.stride == A.n
+                                              else bk.add(list(_entries(A)), list(_entries(B)))))
+    return _from_buffer(A.m, A.n, _buffer([a + b for a, b in zip(_entries(A), _entries(B))]))
 
 
 def matrix_negate(A: Matrix) -> Matrix:
-    cols = []
-    for i in range(1, A.n + 1):
-        cols.append(vc.negate(A.col(i)))
-    return matrix_from_columns(cols)
+    A = _plain(A)
+    if isinstance(A, SparseMatrix):
+        return matrix_scalar_product(A, -1)
+    return _from_buffer(A.m, A.n, _buffer([-x for x in _entries(A)]))
 
 
 def matrix_subtract(A: Matrix, B: Matrix) -> Matrix:
-    return matrix_add(A, matrix_negate(B))
+    assert A.n == B.n and A.m == B.m, "Matrices have different dimensions"
+    A, B = _plain(A), _plain(B)
+    if isinstance(A, SparseMatrix) or isinstance(B, SparseMatrix):
+        return matrix_add(A, matrix_negate(B))
+    # one pass over both operands, without a negated copy of B
+    if bk.use_numpy(A.m * A.n):
+        operands = (A.data, B.data) if A.stride == B.stride == A.n else (list(_entries(A)), list(_entries(B)))
+        return _from_buffer(A.m, A.n, _buffer(bk.combine((1, -1), operands)))
+    return _from_buffer(A.m, A.n, _buffer([a - b for a, b in zip(_entries(A), _entries(B))]))
 
 
 def matrix_scalar_product(A: Matrix, c) -> Matrix:
-    cols = []
-    for i in range(1, A.n + 1):
-        cols.append(vc.scalar_multiply(A.col(i), c))
-    return matrix_from_columns(cols)
+    A = _plain(A)
+    if isinstance(A, SparseMatrix):
+        if c == 0:
+            return SparseMatrix(A.m, A.n)
+        return _sparse_from_csr(A.m, A.n, A.indptr[:], A.indices[:], _buffer([x * c for x in A.values]))
+    return _from_buffer(A.m, A.n, _buffer([x * c for x in _entries(A)]))
 
 
 def create_matrix(grid) -> Matrix:
-    system = eq.LinearSystem()
-    for row in grid:
-        system = eq.include_equation(
-            system,
-            eq.LinearEquation(row, rhs=0)
-        )
-    return Matrix(system)
+    return Matrix.from_rows(grid)
 
 
 def matrix_from_columns(cols: List[vc.Vector]) -> Matrix:
-    assert len(cols) > 0, "Given empty list of vectors"
-    n = len(cols)
-    m = cols[0].dim
-    grid = []
-    for i in range(1, m + 1):
-        row = []
-        for v in cols:
-            assert v.dim == m, "Inconsistent dimensions of given cols"
-            row.append(v.sub(i))
-        grid.append(row)
-    return create_matrix(grid)
+    return Matrix.from_columns(cols)
 
 
 def apply_ero(A: Matrix, ero):
-    eq.apply_ero(A.ls, ero)
-
-
-def to_rref(A: Matrix):
-    if isinstance(A, SuperAugmentedMatrix):
-        rhs_col_vectors = []
-        for i in range(1, A.lhs.n + 1):
-            matrix = A.lhs.copy()
-            matrix.augment_with(A.rhs.col(i))
-            to_rref(matrix)
-            rhs_col_vectors.append(matrix.get_b())
-        to_rref(A.lhs)
-        A.rhs = matrix_from_columns(rhs_col_vectors)
+    if isinstance(A, MatrixView):
+        # the row operations run on a packed copy, which is written back through the view
+        B = A.copy()
+        apply_ero(B, ero)
+        A.b = B.b
+        _assign(A, B)
+        return
+    A._touch()
+    s = A.stride
+    if ero.t == 1:
+        i, j = ero.instr
+        p, q = (i - 1) * s, (j - 1) * s
+        A.data[p:p + A.n], A.data[q:q + A.n] = A.data[q:q + A.n], A.data[p:p + A.n]
+        A.b[i - 1], A.b[j - 1] = A.b[j - 1], A.b[i - 1]
+    elif ero.t == 2:
+        i, k = ero.instr
+        A._admit(k)
+        p = (i - 1) * s
+        for c in range(p, p + A.n):
+            A.data[c] *= k
+        A.b[i - 1] *= k
     else:
-        assert(not A.col(1).is_zero())
-
-        def next_pivot(i, j):
-            """
-            next_pivot(i, j) produces the coordinates of the next pivot, after (i,j)
-            modifies A so that it has a pivot at (i+1, q) if it exists, and transforms
-            other entries along column q to zero
-            :param i: row index
-            :param j: column index
-            :return: tuple(i+1, q), the next pivot, or (0,0) if it doesn't exist
-            """
-            # Step 4
-            k = 0
-            q = 0
-            for col in range(j + 1, A.n + 1):
-                for row in range(i + 1, A.m + 1):
-                    if abs(A.sub(row, col)) > vc.TOLERANCE:
-                        k = row
-                        q = col
-                        break
-                if k > 0:
-                    break
-            if k == 0 or q == 0:
-                return 0, 0
-            if k != i + 1:
-                apply_ero(A, eq.ERO(1, [i + 1, k]))
-            # Step 5
-            apply_ero(A, eq.ERO(2, [i + 1, 1 / A.sub(i + 1, q)]))
-            # Step 6
-            for m in range(1, A.m + 1):
-                if m != i + 1:
-                    apply_ero(A, eq.ERO(3, [m, i + 1, -1 * A.sub(m, q)]))
-            return i + 1, q
-
-        # Step 1, obtain a pivot in the (1,1) position
-        i = 1
-        while A.sub(i, 1) == 0:
-            i += 1
-        if 1 < i:
-            apply_ero(A, eq.ERO(1, [1, i]))
-        assert A.sub(1, 1) != 0
-        # Step 2, scale row 1 by 1 / A.sub(1, 1)
-        apply_ero(A, eq.ERO(2, [1, 1 / A.sub(1, 1)]))
-        # Step 3, transform other entries in column 1 to zero
-        for m in range(2, A.m + 1):
-            apply_ero(A, eq.ERO(3, [m, 1, -1 * A.sub(m, 1)]))
-        t, r = 1, 1
-        while True:
-            tempt, tempr = next_pivot(t, r)
-            if tempt != 0:
-                t, r = tempt, tempr
-            else:
-                break
-
-
-def rank(A: Matrix) -> int:
-    B = A.copy()
-    to_rref(B)
+        i, j, c = ero.instr
+        A._admit(c)
+        p, q = (i - 1) * s, (j - 1) * s
+        for k in range(A.n):
+            A.data[p + k] += c * A.data[q + k]
+        A.b[i - 1] += c * A.b[j - 1]
+
+
+def _row_axpy(data, dst: int, src: int, length: int, f):
+    # data[dst:dst+length] -= f * data[src:src+length], fused into one pass
+    new = [x - f * y for x, y in zip(data[dst:dst + length], data[src:src + length])]
+    data[dst:dst + length] = array('d', new) if isinstance(data, array) else new
+
+
+def _cutoff(values) -> float:
+    # the magnitude at or below which a pivot is taken as zero: TOLERANCE, scaled down with
+    # the largest entry when that is below 1, so a small-scale matrix (e.g. 1e-5 * I) isn't
+    # taken as singular
+    return vc.TOLERANCE * min(max(map(abs, values), default=0), 1)
+
+
+def _gauss_jordan(data, b, m: int, n: int, stride: int) -> List[int]:
+    """
+    _gauss_jordan(data, b, m, n, stride) reduces the m*n row-major buffer data to its RREF
+    in place, using partial pivoting; the augmented column b is carried along
+    :return: the (0-indexed) pivot columns
+    """
+    if stride == n:
+        cutoff = _cutoff(data[:m * n])
+    else:
+        cutoff = _cutoff(x for i in range(m) for x in data[i * stride:i * stride + n])
+    pivots = []
     r = 0
-    for m in range(1, A.m + 1):
-        if A.augmented:
-            if not eq.is_trivial_equation(B.ls.e[m]):
-                r += 1
-            else:
-                break
+    for q in range(n):
+        if r == m:
+            break
+        k, best = r, abs(data[r * stride + q])
+        for i in range(r + 1, m):
+            mag = abs(data[i * stride + q])
+            if mag > best:
+                k, best = i, mag
+        if best <= cutoff:
+            continue
+        p = r * stride
+        if k != r:
+            o = k * stride
+            data[p:p + n], data[o:o + n] = data[o:o + n], data[p:p + n]
+            b[r], b[k] = b[k], b[r]
+        pivot = data[p + q]
+        for c in range(p + q + 1, p + n):
+            data[c] /= pivot
+        data[p + q] = 1
+        b[r] /= pivot
+        for i in range(m):
+            if i == r:
+                continue
+            o = i * stride
+            f = data[o + q]
+            if f != 0:
+                _row_axpy(data, o + q + 1, p + q + 1, n - q - 1, f)
+                data[o + q] = 0
+                b[i] -= f * b[r]
+        pivots.append(q)
+        r += 1
+    return pivots
+
+
+def _is_structured(A) -> bool:
+    # the structured matrices of structured.py (which imports this module) have a dense form
+    return not isinstance(A, (Matrix, SparseMatrix)) and hasattr(A, '_dense')
+
+
+def _plain(A):
+    # a structured matrix as its dense Matrix (cached on it), anything else as it is
+    return A._dense() if _is_structured(A) else A
+
+
+def _dense(A):
+    # the kernels work on dense storage, a SparseMatrix is converted once per version, and a
+    # structured matrix once
+    if not isinstance(A, SparseMatrix):
+        return _plain(A)
+    if 'dense' not in A._cache:
+        A._cache['dense'] = sparse_to_matrix(A)
+    return A._cache['dense']
+
+
+def _cached(A: Matrix, key: str, compute):
+    # produces compute(A), computed at most once per version of A
+    if key not in A._cache:
+        A._cache[key] = compute(_dense(A))
+    return A._cache[key]
+
+
+def _cached_matrix(A: Matrix, key: str, compute) -> Matrix:
+    # like _cached, for a Matrix which is handed out as is, so it is recomputed if it was
+    # modified since
+    cached = A._cache.get(key)
+    if cached is None or cached[0]._version != cached[1]:
+        B = compute(_dense(A))
+        cached = A._cache[key] = (B, B._version)
+    return cached[0]
+
+
+def lu_factor(A: Matrix) -> LUFactorization:
+    return _cached(A, 'lu', _lu_factor)
+
+
+def _lu_factor(A: Matrix) -> LUFactorization:
+    m, n = A.m, A.n
+    U = _buffer([A.data[i * A.stride + j] for i in range(m) for j in range(n)])
+    L = _buffer([0] * (m * m))
+    if isinstance(U, list):
+        L = list(L)
+    for i in range(m):
+        L[i * m + i] = 1
+    perm = list(range(1, m + 1))
+    cutoff = _cutoff(U)
+    pivots = []
+    r = 0
+    for q in range(n):
+        if r == m:
+            break
+        k, best = r, abs(U[r * n + q])
+        for i in range(r + 1, m):
+            mag = abs(U[i * n + q])
+            if mag > best:
+                k, best = i, mag
+        if best <= cutoff:
+            continue
+        p = r * n
+        if k != r:
+            o = k * n
+            U[p:p + n], U[o:o + n] = U[o:o + n], U[p:p + n]
+            L[r * m:r * m + r], L[k * m:k * m + r] = L[k * m:k * m + r], L[r * m:r * m + r]
+            perm[r], perm[k] = perm[k], perm[r]
+        pivot = U[p + q]
+        for i in range(r + 1, m):
+            o = i * n
+            f = U[o + q] / pivot
+            if f != 0:
+                L[i * m + r] = f
+                _row_axpy(U, o + q + 1, p + q + 1, n - q - 1, f)
+                U[o + q] = 0
+        pivots.append(q + 1)
+        r += 1
+    return LUFactorization(_from_buffer(m, m, L), _from_buffer(m, n, U), perm, pivots, cutoff)
+
+
+def _exact(x):
+    # produces x as an int or a Fraction, without any rounding
+    assert not isinstance(x, complex), "exact mode requires real entries"
+    if isinstance(x, float):
+        return int(x) if x.is_integer() else Fraction(x)
+    return x
+
+
+def _integer_rows(A: Matrix, columns: List):
+    """
+    _integer_rows(A, columns) produces the rows of (A | columns) as lists of ints, with each
+    row scaled by the least common multiple of its denominators, and the product of the scales
+    """
+    rows = []
+    scale = 1
+    for i in range(A.m):
+        row = [_exact(x) for x in A.row(i + 1).components]
+        row.extend(_exact(c[i]) for c in columns)
+        d = 1
+        for x in row:
+            if isinstance(x, Fraction):
+                d = lcm(d, x.denominator)
+        rows.append([int(x * d) for x in row])
+        scale *= d
+    return rows, scale
+
+
+def _bareiss(M: List[List[int]], limit: int, jordan: bool = False):
+    """
+    _bareiss(M, limit, jordan) reduces the integer matrix M in place by fraction-free (Bareiss)
+    elimination, with pivots taken from the first limit columns; every division is exact, so
+    the entries stay integers bounded by minors of M. If jordan, the rows above each pivot are
+    eliminated as well, and all pivots end up equal to the last one
+    :return: the (0-indexed) pivot columns, and the sign of the row permutation
+    """
+    m, width = len(M), len(M[0])
+    pivots = []
+    sign = 1
+    prev = 1
+    r = 0
+    for q in range(limit):
+        if r == m:
+            break
+        k = next((i for i in range(r, m) if M[i][q] != 0), None)
+        if k is None:
+            continue
+        if k != r:
+            M[r], M[k] = M[k], M[r]
+            sign = -sign
+        top = M[r]
+        p = top[q]
+        for i in range(0 if jordan else r + 1, m):
+            if i == r:
+                continue
+            row = M[i]
+            f = row[q]
+            # the rows below r are zero left of q, the rows above (jordan) are scaled there too
+            for j in range(0 if i < r else q + 1, width):
+                row[j] = (row[j] * p - f * top[j]) // prev
+            row[q] = 0
+        prev = p
+        pivots.append(q)
+        r += 1
+    return pivots, sign
+
+
+def _exact_echelon(A: Matrix):
+    # the fraction-free echelon form of (A | b), where a pivot in column n means inconsistency
+    M, scale = _integer_rows(A, [A.b])
+    pivots, sign = _bareiss(M, A.n + 1)
+    return M, scale, pivots, sign
+
+
+def _exact_rref(A: Matrix, columns: List) -> List[List]:
+    # produces the rows of the RREF of (A | columns), pivoting only in the columns of A
+    M, scale = _integer_rows(A, columns)
+    pivots, sign = _bareiss(M, A.n, jordan=True)
+    if not pivots:
+        return M
+    # all pivots are equal to the last one, d, so a single division per entry remains
+    d = M[len(pivots) - 1][pivots[-1]]
+    return [[_reduced(x, d) for x in row] for row in M]
+
+
+def _reduced(x: int, d: int):
+    # produces x / d, as an int where that is exact
+    q, rem = divmod(x, d)
+    return q if rem == 0 else Fraction(x, d)
+
+
+def to_rref(A: Matrix, exact: bool = False):
+    assert not _is_structured(A), "A structured matrix can't be modified, use rref(A) instead"
+    if isinstance(A, SparseMatrix):
+        # reduced densely, the RREF replaces the entries of A in CSR form
+        R = sparse_to_matrix(A)
+        to_rref(R, exact)
+        S = matrix_to_sparse(R)
+        A.indptr, A.indices, A.values, A.nnz = S.indptr, S.indices, S.values, S.nnz
+        A._touch()
+    elif exact:
+        lhs = A.lhs if isinstance(A, SuperAugmentedMatrix) else A
+        if isinstance(A, SuperAugmentedMatrix):
+            columns = [A.rhs.col(j).components for j in range(1, A.rhs.n + 1)]
         else:
-            if not B.ls.e[m].a.is_zero():
-                r += 1
-            else:
-                break
+            columns = [A.b]
+        R = _exact_rref(lhs, columns)
+        n = lhs.n
+        _assign(lhs, _from_buffer(lhs.m, n, [x for row in R for x in row[:n]]))
+        if isinstance(A, SuperAugmentedMatrix):
+            A.rhs = _from_buffer(A.m, A.rhs.n, [x for row in R for x in row[n:]])
+        else:
+            A.b = [row[n] for row in R]
+    elif isinstance(A, SuperAugmentedMatrix):
+        F = lu_factor(A.lhs)
+        rhs = A.rhs
+        C = [F._reduce(rhs.data[j::rhs.stride]) for j in range(rhs.n)]
+        _assign(A.lhs, F.rref())
+        A.rhs = _from_buffer(A.m, rhs.n, _buffer([C[j][i] for i in range(A.m) for j in range(rhs.n)]))
+    elif isinstance(A, MatrixView):
+        B = A.copy()
+        to_rref(B)
+        A.b = B.b
+        _assign(A, B)
+    else:
+        if isinstance(A.data, list) and isinstance(A.b, array):
+            A.b = list(A.b)
+        _gauss_jordan(A.data, A.b, A.m, A.n, A.stride)
+        A._touch()
+
+
+def rank(A: Matrix, exact: bool = False) -> int:
+    if exact:
+        M, scale, pivots, sign = _cached(A, 'exact_echelon', _exact_echelon)
+        return sum(1 for q in pivots if q < A.n) + (1 if A.augmented and A.n in pivots else 0)
+    return _cached(A, 'rank', _rank)
+
+
+def _rank(A: Matrix) -> int:
+    r = lu_factor(A).rank
+    if A.augmented and not is_consistent(A):
+        r += 1
     return r
 
 
-def is_consistent(A: Matrix) -> bool:
-    B = A.copy()
-    B.augmented = not A.augmented
-    return rank(A) == rank(B)
+def is_consistent(A: Matrix, exact: bool = False) -> bool:
+    if exact:
+        return A.n not in _cached(A, 'exact_echelon', _exact_echelon)[2]
+    return _cached(A, 'consistent', _is_consistent)
+
+
+def _is_consistent(A: Matrix) -> bool:
+    F = lu_factor(A)
+    return F._is_consistent(F._forward(A.b))
+
+
+def rref(A: Matrix) -> Matrix:
+    return _cached_matrix(A, 'rref', _rref)
+
+
+def _rref(A: Matrix) -> Matrix:
+    R = A.copy()
+    to_rref(R)
+    return R
+
+
+def pivot_columns(A: Matrix) -> List[int]:
+    return list(lu_factor(A).pivots)
+
+
+def _permutation_sign(perm: List[int]) -> int:
+    sign = 1
+    seen = [False] * len(perm)
+    for start in range(len(perm)):
+        length = 0
+        i = start
+        while not seen[i]:
+            seen[i] = True
+            i = perm[i] - 1
+            length += 1
+        if length > 0 and length % 2 == 0:
+            sign = -sign
+    return sign
+
+
+def _determinant(A: Matrix):
+    F = lu_factor(A)
+    if F.rank < A.n:
+        return 0
+    det = _permutation_sign(F.perm)
+    for k in range(A.n):
+        det *= F.U.data[k * A.n + k]
+    return det
+
+
+def _exact_determinant(A: Matrix):
+    M, scale, pivots, sign = _cached(A, 'exact_echelon', _exact_echelon)
+    if sum(1 for q in pivots if q < A.n) < A.n:
+        return 0
+    # the last Bareiss pivot is the determinant of the row-scaled matrix
+    return _reduced(sign * M[A.n - 1][A.n - 1], scale)
+
+
+def determinant(A: Matrix, exact: bool = False):
+    assert A.m == A.n, "A is not a square matrix"
+    if not isinstance(A, (Matrix, SparseMatrix)):
+        # a structured matrix has its own determinant, e.g. the product of a triangular diagonal
+        return A.determinant(exact)
+    if exact:
+        return _cached(A, 'exact_determinant', _exact_determinant)
+    return _cached(A, 'determinant', _determinant)
+
+
+def inverse(A: Matrix) -> Matrix:
+    assert A.m == A.n, "A is not a square matrix"
+    if not isinstance(A, (Matrix, SparseMatrix)):
+        return A.inverse()
+    return _cached_matrix(A, 'inverse', _inverse)
+
 
+def _inverse(A: Matrix) -> Matrix:
+    F = lu_factor(A)
+    assert F.rank == A.n, "A is not invertible"
+    return F.solve_many(identity(A.n))
 
-def nullity(A: Matrix) -> int:
-    return A.n - rank(A)
+
+def _one_norm(A: Matrix) -> float:
+    return max(sum(abs(x) for x in A.data[j::A.stride]) for j in range(A.n))
+
+
+def _condition_number(A: Matrix) -> float:
+    if lu_factor(A).rank < A.n:
+        return float('inf')
+    return _one_norm(A) * _one_norm(inverse(A))
+
+
+def condition_number(A: Matrix) -> float:
+    assert A.m == A.n, "A is not a square matrix"
+    return _cached(A, 'condition_number', _condition_number)
+
+
+def qr_factor(A: Matrix) -> QRFactorization:
+    return _cached(A, 'qr', _qr_factor)
+
+
+def _qr_factor(A: Matrix) -> QRFactorization:
+    m, n = A.m, A.n
+    R = _buffer([A.data[i * A.stride + j] for i in range(m) for j in range(n)])
+    reflectors = []
+    for k in range(min(m - 1, n)):
+        x = R[k * n + k::n]
+        size = sqrt(sum(abs(a) ** 2 for a in x))
+        if size == 0:
+            continue
+        # alpha takes the opposite phase to x[0], so that v = x - alpha*e1 does not cancel
+        alpha = -size if x[0] == 0 else -size * x[0] / abs(x[0])
+        v = list(x)
+        v[0] -= alpha
+        size = sqrt(sum(abs(a) ** 2 for a in v))
+        v = [a / size for a in v]
+        # (I - 2vv^H) is applied to the remaining columns one row of w = (v^H)R at a time
+        length = n - k - 1
+        w = [0] * length
+        for i, a in enumerate(v):
+            start = (k + i) * n + k + 1
+            a = a.conjugate()
+            w = [wj + a * r for wj, r in zip(w, R[start:start + length])]
+        for i, a in enumerate(v):
+            start = (k + i) * n + k + 1
+            f = 2 * a
+            for j in range(length):
+                R[start + j] -= f * w[j]
+            R[(k + i) * n + k] = 0
+        R[k * n + k] = alpha
+        reflectors.append((k, v))
+    return QRFactorization(_from_buffer(m, n, R), reflectors)
+
+
+def qr(A: Matrix, economy: bool = False):
+    F = qr_factor(A)
+    return F.q(economy), F.r(economy)
+
+
+def lstsq(A: Matrix, b):
+    # a structured matrix (see structured.py) is square, and solves by its own substitution
+    # or elimination
+    F = qr_factor(A) if isinstance(A, (Matrix, SparseMatrix)) else A
+    if isinstance(b, Matrix):
+        return F.solve_many(b)
+    return F.solve(b)
+
+
+def nullity(A: Matrix, exact: bool = False) -> int:
+    return A.n - rank(A, exact)
 
 
 def homogeneous(A: Matrix) -> Matrix:
-    B = A.copy()
-    ze = A.get_b().zero_vector()
-    B.augment_with(ze)
+    # a SparseMatrix can't be augmented, so it produces a (dense) Matrix
+    B = sparse_to_matrix(A) if isinstance(A, SparseMatrix) else A.copy()
+    B.augment_with(vc.Vector.from_sequence([0] * A.m))
     return B
 
 
 def matrix_vector_product(A: Matrix, v: vc.Vector) -> vc.Vector:
     assert not A.augmented
     assert A.n == v.dim
-    cols = []
-    for i in range(1, v.dim + 1):
-        cols.append(vc.scalar_multiply(
-            A.col(i), v.sub(i)
-        ))
-    assert len(cols) > 0
-    if len(cols) == 1:
-        return cols[0]
+    if not isinstance(A, (Matrix, SparseMatrix)):
+        # anything else providing the product itself, e.g. a matrix backed by a file
+        return A.matrix_vector_product(v)
+    if isinstance(A, SparseMatrix):
+        x, indices, values = v.components, A.indices, A.values
+        return vc.Vector.from_sequence([
+            sum(values[k] * x[indices[k]] for k in range(A.indptr[i], A.indptr[i + 1]))
+            for i in range(A.m)
+        ])
+    if bk.use_numpy(A.m * A.n):
+        return vc.Vector.from_sequence(bk.matvec(A.data, A.m, A.n, A.stride, v.components))
+    x = v.components
+    return vc.Vector.from_sequence([
+        sum(a * b for a, b in zip(A.data[i * A.stride:i * A.stride + A.n], x))
+        for i in range(A.m)
+    ])
+
+
+def _is_identity(A: Matrix) -> bool:
+    if A.m != A.n:
+        return False
+    for i in range(A.m):
+        start = i * A.stride
+        for j in range(A.n):
+            if A.data[start + j] != (1 if i == j else 0):
+                return False
+    return True
+
+
+def _is_zero(A: Matrix) -> bool:
+    for i in range(A.m):
+        start = i * A.stride
+        for x in A.data[start:start + A.n]:
+            if x != 0:
+                return False
+    return True
+
+
+def _gemm(a, m: int, n: int, a_stride: int, b, p: int, b_stride: int, tile: int) -> List:
+    # row-major C = AB, computed over tile*tile blocks of the shared dimension and of the
+    # columns of B, so the inner loop streams a contiguous slice of a row of B into a row of C
+    c = [0] * (m * p)
+    for kk in range(0, n, tile):
+        k_end = min(kk + tile, n)
+        for jj in range(0, p, tile):
+            j_end = min(jj + tile, p)
+            for i in range(m):
+                row = i * a_stride
+                acc = c[i * p + jj:i * p + j_end]
+                for k in range(kk, k_end):
+                    aik = a[row + k]
+                    if aik != 0:
+                        start = k * b_stride
+                        acc = [x + aik * y for x, y in zip(acc, b[start + jj:start + j_end])]
+                c[i * p + jj:i * p + j_end] = acc
+    return c
+
+
+def _sparse_matrix_product(A, B):
+    # at least one of A and B is a SparseMatrix; only the nonzero entries are visited
+    if isinstance(A, SparseMatrix) and isinstance(B, SparseMatrix):
+        rows = []
+        for i in range(A.m):
+            r = {}
+            for k in range(A.indptr[i], A.indptr[i + 1]):
+                a, row = A.values[k], A.indices[k]
+                for t in range(B.indptr[row], B.indptr[row + 1]):
+                    r[B.indices[t]] = r.get(B.indices[t], 0) + a * B.values[t]
+            rows.append(r)
+        return _sparse_from_rows(A.m, B.n, rows)
+    c = [0] * (A.m * B.n)
+    if isinstance(A, SparseMatrix):
+        for i in range(A.m):
+            acc = c[i * B.n:(i + 1) * B.n]
+            for k in range(A.indptr[i], A.indptr[i + 1]):
+                a, start = A.values[k], A.indices[k] * B.stride
+                acc = [x + a * y for x, y in zip(acc, B.data[start:start + B.n])]
+            c[i * B.n:(i + 1) * B.n] = acc
     else:
-        return vc.add(cols[0], cols[1], *cols[2:])
+        for i in range(A.m):
+            for k in range(A.n):
+                a = A.data[i * A.stride + k]
+                if a != 0:
+                    for t in range(B.indptr[k], B.indptr[k + 1]):
+                        c[i * B.n + B.indices[t]] += a * B.values[t]
+    return _from_buffer(A.m, B.n, _buffer(c))
 
 
 def matrix_matrix_product(A: Matrix, B: Matrix):
     assert not A.augmented and not B.augmented
     assert A.n == B.m
-    transformed = []
-    for i in range(1, B.n + 1):
-        basis = B.col(i)
-        transformed_basis = matrix_vector_product(A, basis)
-        transformed.append(transformed_basis)
-    return matrix_from_columns(transformed)
+    if not isinstance(A, (Matrix, SparseMatrix)) or not isinstance(B, (Matrix, SparseMatrix)):
+        # a structured operand (see structured.py) computes the product with its own kernels
+        return A @ B
+    if isinstance(A, SparseMatrix) or isinstance(B, SparseMatrix):
+        return _sparse_matrix_product(A, B)
+    if _is_identity(A):
+        return B.copy()
+    if _is_identity(B):
+        return A.copy()
+    if _is_zero(A) or _is_zero(B):
+        return _from_buffer(A.m, B.n, _buffer([0] * (A.m * B.n)))
+    if bk.use_numpy(max(A.m * A.n, B.m * B.n)):
+        return _from_buffer(A.m, B.n, _buffer(bk.matmul(A.data, A.m, A.n, A.stride, B.data, B.n, B.stride)))
+    c = _gemm(A.data, A.m, A.n, A.stride, B.data, B.n, B.stride, TILE_SIZE)
+    return _from_buffer(A.m, B.n, _buffer(c))
 
 
 def col_space(A: Matrix) -> sp.Span:
-    return sp.Span(*[A.col(i) for i in range(1, A.n + 1)])
+    return sp.Span(*[A.col(i).copy() for i in range(1, A.n + 1)])
 
 
 def has_solution(A: Matrix, b: vc.Vector) -> bool:
     if A.m != b.dim:
         return False
+    if isinstance(A, Matrix):
+        # the basis of Col(A) is kept until A changes, so repeated queries cost O(rank * m)
+        return sp.contained_in_span(b, _cached(A, 'col_space', col_space))
     return sp.contained_in_span(b, col_space(A))  # doesn't the abstraction here make you smile :)
 
 
 def identity(n: int) -> Matrix:
-    grid = []
-    for i in range(n):
-        row = [0] * n
-        row[i] = 1
-        grid.append(row)
-    return create_matrix(grid)
+    data = array('d', bytes(8 * n * n))
+    data[::n + 1] = array('d', [1] * n)
+    return Matrix.from_buffer(n, n, data)
 
 
 def matrix_transpose(A: Matrix) -> Matrix:
-    grid = []
-    for i in range(1, A.n + 1):
-        grid.append(A.col(i).components)
-    return create_matrix(grid)
+    if not isinstance(A, (Matrix, SparseMatrix)):
+        return A.transpose()
+    if isinstance(A, SparseMatrix):
+        rows = [{} for j in range(A.n)]
+        for i in range(A.m):
+            for k in range(A.indptr[i], A.indptr[i + 1]):
+                rows[A.indices[k]][i] = A.values[k]
+        return _sparse_from_rows(A.n, A.m, rows)
+    return _transpose(A)
+
+
+def _transpose(A: Matrix) -> MatrixView:
+    return _view(A, 1, 1, A.n, A.m, transposed=True)
+
+
+def submatrix(A: Matrix, i1: int, i2: int, j1: int, j2: int) -> MatrixView:
+    assert 1 <= i1 <= i2 <= A.m and 1 <= j1 <= j2 <= A.n, "Invalid submatrix request"
+    return _view(A, i1, j1, i2 - i1 + 1, j2 - j1 + 1)
 
 
 
@@ -0,0 +1,27 @@
+"""
+This file contains the documentation for parallel.py
+"""
+
+# The functions in this file solve many independent linear systems at once, in a pool of
+# worker processes. Each system is sent to the workers in the binary format of serialize.py,
+# in chunks of chunksize systems, and is solved by to_rref; the solutions are sent back the same way
+#  :param systems: an iterable of LinearSystems and/or augmented Matrices, it is consumed lazily
+#  :param workers: the number of worker processes, defaults to the number of CPUs;
+#                  0 or 1 solves in the calling process
+#  :param chunksize: the number of systems sent to a worker at a time
+
+
+# Solution(consistent, rank, x):
+#    A Solution holds the outcome of solving one system
+#
+#  FIELDS:
+#   * consistent: true if the system has a solution
+#   * rank: the rank of the augmented matrix of the system (see rank in matrix.py)
+#   * x: a solution, with all free variables set to 0, or None if the system is inconsistent
+
+
+# solve_stream(systems, workers, chunksize) produces (index, Solution) pairs, where index is the
+#  (0-indexed) position of the system in systems, as soon as each chunk is solved, so they are
+#  not necessarily in order; at most two chunks per worker are in flight at a time
+
+# solve_batch(systems, workers, chunksize) produces the list of Solutions of systems, in order
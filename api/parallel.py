@@ -0,0 +1,96 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Iterable, Iterator, List, Tuple
+import api.equation as eq
+import api.vector as vc
+import api.matrix as mx
+import api.serialize as sr
+
+
+class Solution:
+    def __init__(self, consistent: bool, rank: int, x: vc.Vector):
+        self.consistent = consistent
+        self.rank = rank
+        self.x = x
+
+    def __repr__(self):
+        if not self.consistent:
+            return f'inconsistent (rank {self.rank})'
+        return f'x = {self.x} (rank {self.rank})'
+
+
+def _decode(payload: bytes) -> mx.Matrix:
+    # a system travels to the workers in the format of serialize.py
+    system = sr.loads(payload)
+    A = mx.Matrix(system) if isinstance(system, eq.LinearSystem) else system
+    A.augmented = True
+    return A
+
+
+def _solve(A: mx.Matrix) -> Tuple:
+    # reduces A to its RREF and reads off the solution with the free variables set to 0,
+    # produced as (consistent, rank, serialized x) so that it travels back compactly
+    mx.to_rref(A)
+    x = [0] * A.n
+    r = 0
+    for i in range(A.m):
+        row = A.data[i * A.stride:i * A.stride + A.n]
+        q = next((j for j, a in enumerate(row) if abs(a) > vc.TOLERANCE), None)
+        if q is None:
+            if abs(A.b[i]) > vc.TOLERANCE:
+                return False, r + 1, None
+            continue
+        x[q] = A.b[i]
+        r += 1
+    return True, r, sr.dumps(vc.Vector.from_sequence(x))
+
+
+def _solve_chunk(chunk: List[bytes]) -> List[Tuple]:
+    return [_solve(_decode(payload)) for payload in chunk]
+
+
+def _solution(result: Tuple) -> Solution:
+    consistent, rank, x = result
+    return Solution(consistent, rank, None if x is None else sr.loads(x))
+
+
+def solve_stream(systems: Iterable, workers: int = None, chunksize: int = 256) -> Iterator[Tuple[int, Solution]]:
+    """
+    solve_stream(systems, workers, chunksize) solves each of the systems in a pool of worker
+    processes, and produces (index, Solution) pairs as the chunks finish, i.e., not in order
+    """
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    assert workers >= 0 and chunksize > 0
+    systems = iter(systems)
+    if workers <= 1:
+        index = 0
+        for system in systems:
+            yield index, _solution(_solve(_decode(sr.dumps(system))))
+            index += 1
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = {}
+        start = 0
+        while True:
+            # keeps two chunks in flight per worker, so the input is consumed lazily
+            while len(pending) < 2 * workers:
+                chunk = [sr.dumps(system) for system in islice(systems, chunksize)]
+                if not chunk:
+                    break
+                pending[pool.submit(_solve_chunk, chunk)] = start
+                start += len(chunk)
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                first = pending.pop(future)
+                for k, result in enumerate(future.result()):
+                    yield first + k, _solution(result)
+
+
+def solve_batch(systems: Iterable, workers: int = None, chunksize: int = 256) -> List[Solution]:
+    solutions = {}
+    for index, solution in solve_stream(systems, workers, chunksize):
+        solutions[index] = solution
+    return [solutions[k] for k in range(len(solutions))]
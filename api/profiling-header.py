@@ -0,0 +1,56 @@
+"""
+This file contains the documentation for profiling.py
+"""
+
+# The functions in this file profile the public functions of vector.py, equation.py and
+# matrix.py. While profiling is enabled, each of those functions is replaced by a wrapper which
+# counts its calls, cumulative time, estimated floating point operations and the objects
+# (Vectors, LinearEquations, LinearSystems, Matrices, ...) allocated during its calls. The
+# counts of a function include the functions it calls, e.g. the time of rank includes the
+# time of the lu_factor call it makes. Nothing is replaced while profiling is
+# disabled, so it costs nothing then
+# note: only calls made through the modules are counted (e.g. mx.to_rref(A)), not calls
+#       through a reference to a function taken before profiling was enabled
+
+# ENVIRONMENT_VARIABLE: profiling is enabled on import if this environment variable is '1'
+
+# MODULES: the profiled modules, by the prefix of the names of their functions
+
+# ALLOCATORS: the places where objects are created, which count allocations
+
+# FLOPS: the estimated floating point operations of a call, by function name
+
+
+# Stat:
+#    A Stat holds the counters of one function
+#
+#  FIELDS:
+#   * calls: the number of calls
+#   * time: the cumulative time of the calls, in seconds
+#   * flops: the estimated floating point operations of the calls (0 for the functions which
+#            aren't in FLOPS)
+#   * allocations: the number of objects allocated during the calls
+
+
+# is_enabled() produces true if profiling is enabled
+
+# enable() enables profiling
+
+# disable() disables profiling, the counters are kept
+
+# reset() clears the counters
+
+# profile(clear) is a context manager which enables profiling for the duration of a with
+#  statement (clearing the counters first, if clear), and produces the dict of Stats, by
+#  function name, e.g. 'matrix.to_rref'
+#  profiling is disabled afterwards, unless it was already enabled
+
+# summary() produces the counters as a dict: 'functions' maps each function name to its
+#  counters, and 'allocations' maps each class name to the number of objects allocated
+
+# to_json(indent) produces the summary as JSON
+
+# to_prometheus(prefix) produces the counters in the Prometheus text exposition format, as the
+#  counters prefix_calls_total, prefix_seconds_total, prefix_flops_total and
+#  prefix_allocations_total, labelled by function, and prefix_objects_allocated_total,
+#  labelled by class
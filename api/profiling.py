@@ -0,0 +1,229 @@
+import json
+import os
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from typing import Dict
+import api.equation as eq
+import api.vector as vc
+import api.matrix as mx
+
+# setting this environment variable to 1 enables profiling when the package is imported
+ENVIRONMENT_VARIABLE = 'LINEAR_ALGEBRA_PROFILE'
+
+MODULES = {'vector': vc, 'equation': eq, 'matrix': mx}
+
+# the places where the objects of the package are created, as (owner, attribute, class name):
+# the constructors, and the helpers which create objects without calling them
+ALLOCATORS = (
+    (vc.Vector, '__init__', 'Vector'),
+    (vc.Vector, 'from_sequence', 'Vector'),
+    (vc, '_wrap', 'Vector'),
+    (mx.VectorView, '__init__', 'VectorView'),
+    (eq.LinearEquation, '__init__', 'LinearEquation'),
+    (eq.LinearSystem, '__init__', 'LinearSystem'),
+    (mx.Matrix, '__init__', 'Matrix'),
+    (mx, '_from_buffer', 'Matrix'),
+    (mx.MatrixView, '__init__', 'MatrixView'),
+    (mx.SparseMatrix, '__init__', 'SparseMatrix'),
+    (mx, '_sparse_from_csr', 'SparseMatrix'),
+)
+
+
+def _gauss(A) -> int:
+    return 2 * A.m * A.n * min(A.m, A.n)
+
+
+def _cube(A) -> int:
+    return 2 * A.n ** 3 // 3
+
+
+def _qr(A, *args) -> int:
+    return max(2 * A.m * A.n ** 2 - 2 * A.n ** 3 // 3, 0)
+
+
+# estimates of the number of floating point operations of a call, from its arguments
+FLOPS = {
+    'vector.add': lambda v, w, *args: v.dim * (1 + len(args)),
+    'vector.subtract': lambda v, w: v.dim,
+    'vector.negate': lambda v: v.dim,
+    'vector.scalar_multiply': lambda v, s: v.dim,
+    'vector.dot_product': lambda v, w: 2 * v.dim,
+    'vector.inner_product': lambda w, z: 2 * w.dim,
+    'vector.norm': lambda v: 2 * v.dim,
+    'vector.normalize': lambda v: 3 * v.dim,
+    'vector.proj': lambda v, w: 6 * v.dim,
+    'vector.perp': lambda v, w: 7 * v.dim,
+    'vector.cross_product': lambda u, v: 9,
+    'equation.add': lambda le1, le2, *args: (le1.n + 1) * (1 + len(args)),
+    'equation.subtract': lambda le1, le2: 2 * (le1.n + 1),
+    'equation.scalar_multiply': lambda le, s: le.n + 1,
+    'matrix.matrix_add': lambda A, B: A.m * A.n,
+    'matrix.matrix_subtract': lambda A, B: A.m * A.n,
+    'matrix.matrix_negate': lambda A: A.m * A.n,
+    'matrix.matrix_scalar_product': lambda A, c: A.m * A.n,
+    'matrix.matrix_vector_product': lambda A, v: 2 * A.m * A.n,
+    'matrix.matrix_matrix_product': lambda A, B: 2 * A.m * A.n * B.n,
+    'matrix.to_rref': lambda A, exact=False: _gauss(A),
+    'matrix.rank': lambda A, exact=False: _gauss(A),
+    'matrix.rref': _gauss,
+    'matrix.lu_factor': _cube,
+    'matrix.determinant': lambda A, exact=False: _cube(A),
+    'matrix.inverse': lambda A: 3 * _cube(A),
+    'matrix.qr_factor': _qr,
+    'matrix.lstsq': _qr,
+}
+
+
+class Stat:
+    """
+    Stat holds the counters of one function: its number of calls, and the cumulative time,
+    estimated floating point operations and allocated objects of those calls (including the
+    calls they make themselves)
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.time = 0.0
+        self.flops = 0
+        self.allocations = 0
+
+    def __repr__(self):
+        return f'{self.calls} calls, {self.time:.3g}s, {self.flops} flops, {self.allocations} allocations'
+
+
+_stats: Dict[str, Stat] = {}
+_allocations: Dict[str, int] = {}
+# the number of objects allocated while profiling, at any of the ALLOCATORS
+_allocated = 0
+_originals: Dict = {}
+
+
+def _instrument(key: str, f):
+    estimate = FLOPS.get(key)
+
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        stat = _stats.get(key)
+        if stat is None:
+            stat = _stats[key] = Stat()
+        if estimate is not None:
+            try:
+                stat.flops += estimate(*args, **kwargs)
+            except (AttributeError, TypeError):
+                pass
+        allocated = _allocated
+        start = perf_counter()
+        try:
+            return f(*args, **kwargs)
+        finally:
+            stat.time += perf_counter() - start
+            stat.calls += 1
+            stat.allocations += _allocated - allocated
+
+    return wrapper
+
+
+def _counting(name: str, f):
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        global _allocated
+        _allocated += 1
+        _allocations[name] = _allocations.get(name, 0) + 1
+        return f(*args, **kwargs)
+
+    return wrapper
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
+
+
+def enable():
+    # the public functions of MODULES are replaced by counting wrappers, and calls between
+    # them go through the wrappers too, since they are looked up in the module; nothing is
+    # replaced while profiling is disabled, so it costs nothing then
+    if is_enabled():
+        return
+    for prefix, module in MODULES.items():
+        for name, f in list(vars(module).items()):
+            if not name.startswith('_') and callable(f) and getattr(f, '__module__', None) == module.__name__ \
+                    and not isinstance(f, type):
+                _originals[module, name] = f
+                setattr(module, name, _instrument(f'{prefix}.{name}', f))
+    for owner, attribute, name in ALLOCATORS:
+        f = vars(owner)[attribute]
+        _originals[owner, attribute] = f
+        if isinstance(f, classmethod):
+            setattr(owner, attribute, classmethod(_counting(name, f.__func__)))
+        else:
+            setattr(owner, attribute, _counting(name, f))
+
+
+def disable():
+    for (owner, attribute), f in _originals.items():
+        setattr(owner, attribute, f)
+    _originals.clear()
+
+
+def reset():
+    global _allocated
+    _stats.clear()
+    _allocations.clear()
+    _allocated = 0
+
+
+@contextmanager
+def profile(clear: bool = True):
+    """
+    profile(clear) enables profiling for the duration of a with statement (after resetting
+    the counters if clear), and restores the previous state afterwards
+    """
+    enabled = is_enabled()
+    if clear:
+        reset()
+    enable()
+    try:
+        yield _stats
+    finally:
+        if not enabled:
+            disable()
+
+
+def summary() -> Dict:
+    return {
+        'functions': {key: vars(stat).copy() for key, stat in sorted(_stats.items())},
+        'allocations': dict(sorted(_allocations.items())),
+    }
+
+
+def to_json(indent: int = None) -> str:
+    return json.dumps(summary(), indent=indent)
+
+
+def _escape(label: str) -> str:
+    return label.replace('\\', '\\\\').replace('"', '\\"')
+
+
+def to_prometheus(prefix: str = 'linear_algebra') -> str:
+    metrics = [
+        ('calls_total', 'calls', 'The number of calls of a function'),
+        ('seconds_total', 'time', 'The cumulative time spent in a function'),
+        ('flops_total', 'flops', 'The estimated floating point operations of a function'),
+        ('allocations_total', 'allocations', 'The objects allocated by a function'),
+    ]
+    lines = []
+    for metric, field, description in metrics:
+        lines.append(f'# HELP {prefix}_{metric} {description}')
+        lines.append(f'# TYPE {prefix}_{metric} counter')
+        for key, stat in sorted(_stats.items()):
+            lines.append(f'{prefix}_{metric}{{function="{_escape(key)}"}} {getattr(stat, field)}')
+    lines.append(f'# HELP {prefix}_objects_allocated_total The objects allocated, by class')
+    lines.append(f'# TYPE {prefix}_objects_allocated_total counter')
+    for name, count in sorted(_allocations.items()):
+        lines.append(f'{prefix}_objects_allocated_total{{class="{_escape(name)}"}} {count}')
+    return '\n'.join(lines) + '\n'
+
+
+if os.environ.get(ENVIRONMENT_VARIABLE) == '1':
+    enable()
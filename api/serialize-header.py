@@ -0,0 +1,34 @@
+"""
+This file contains the documentation for serialize.py
+"""
+
+# The functions in this file store Vectors, Matrices, SuperAugmentedMatrices and LinearSystems
+# in a compact binary format, which round-trips their entries exactly:
+#  * a header: MAGIC, VERSION, the kind of object, the dtype of the payload, flags (whether a
+#    Matrix is augmented) and the dimensions, as little-endian unsigned 64-bit integers
+#  * a payload: all of the entries, in one contiguous block, in row-major order
+#    - a Vector: its components
+#    - a Matrix: its entries, then b if it is augmented
+#    - a SuperAugmentedMatrix: the entries of lhs, then those of rhs
+#    - a LinearSystem: the coefficients of its equations, then their right-hand-sides
+#
+# The dtype of the payload is REAL (little-endian doubles), COMPLEX (pairs of doubles, the real
+# then the imaginary part) or RATIONAL (exact values as text: Fractions as 'p/q', ints as their
+# digits and floats by their repr), which is used whenever a value can't be held exactly by a
+# double (a Fraction, or an int beyond 2**53), so every value is loaded back with its type
+#
+# pickle and copy use this format for all of these objects; a VectorView or a MatrixView is
+# stored as a copy of its entries, and is loaded as a Vector or a Matrix
+# note: the cached results of a Matrix are not stored
+
+# MAGIC: the bytes that a serialized object starts with
+
+# VERSION: the version of the format
+
+# dumps(obj) produces the bytes of obj
+
+# loads(data) produces the object stored in the bytes-like data
+
+# save(obj, path) writes the bytes of obj to the file at path
+
+# load(path) produces the object stored in the file at path
@@ -0,0 +1,183 @@
+import copyreg
+import struct
+import sys
+from array import array
+from fractions import Fraction
+from typing import List, Tuple
+import api.equation as eq
+import api.vector as vc
+import api.matrix as mx
+
+MAGIC = b'LATB'
+VERSION = 1
+
+# magic, version, kind, dtype, flags, number of dimensions; followed by the dimensions
+_HEADER = struct.Struct('<4sBBcBB')
+
+VECTOR, MATRIX, SUPER_AUGMENTED_MATRIX, LINEAR_SYSTEM = 1, 2, 3, 4
+
+# the dtypes of the payload: doubles, complex numbers as (real, imaginary) doubles, or exact
+# values as text separated by spaces (fractions as 'p/q', ints as digits and floats by their
+# repr), for the values a double can't hold exactly, so each comes back as it was
+REAL, COMPLEX, RATIONAL = b'd', b'z', b'q'
+
+_AUGMENTED = 1
+
+
+def _dtype(values) -> bytes:
+    if isinstance(values, array):
+        return REAL
+    if any(isinstance(x, complex) for x in values):
+        return COMPLEX
+    if not vc._packable(values):
+        return RATIONAL
+    return REAL
+
+
+def _text(x) -> str:
+    if isinstance(x, Fraction):
+        # always with a denominator, so a Fraction isn't read back as an int
+        return f'{x.numerator}/{x.denominator}'
+    if isinstance(x, float):
+        return repr(x)
+    return str(int(x))
+
+
+def _value(token: str):
+    if '/' in token:
+        return Fraction(token)
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+
+def _pack(values, dtype: bytes) -> bytes:
+    if dtype == RATIONAL:
+        text = ' '.join(_text(x) for x in values).encode()
+        return struct.pack('<Q', len(text)) + text
+    if dtype == COMPLEX:
+        values = array('d', [p for z in values for p in (complex(z).real, complex(z).imag)])
+    elif not isinstance(values, array):
+        values = array('d', values)
+    if sys.byteorder != 'little':
+        values = array('d', values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _unpack(view: memoryview, dtype: bytes, count: int):
+    if dtype == RATIONAL:
+        length = struct.unpack_from('<Q', view)[0]
+        values = [_value(x) for x in bytes(view[8:8 + length]).decode().split()]
+        assert len(values) == count, "The payload is truncated"
+        return values
+    width = 16 if dtype == COMPLEX else 8
+    assert len(view) >= count * width, "The payload is truncated"
+    values = array('d')
+    values.frombytes(view[:count * width])
+    if sys.byteorder != 'little':
+        values.byteswap()
+    if dtype == COMPLEX:
+        return [complex(values[k], values[k + 1]) for k in range(0, len(values), 2)]
+    return values
+
+
+def _rows(A: mx.Matrix) -> List:
+    # the entries of A as one section per row, or as its whole storage if that is packed
+    if isinstance(A, mx.MatrixView) or A.stride != A.n:
+        return [A.row(i).components for i in range(1, A.m + 1)]
+    return [A.data]
+
+
+def _parts(obj) -> Tuple[int, int, Tuple, List]:
+    # produces (kind, flags, dimensions, payload sections) for obj
+    if isinstance(obj, vc.Vector):
+        return VECTOR, 0, (obj.dim,), [obj.components]
+    if isinstance(obj, mx.Matrix):
+        sections = _rows(obj)
+        if obj.augmented:
+            sections.append(obj.b)
+        return MATRIX, _AUGMENTED if obj.augmented else 0, (obj.m, obj.n), sections
+    if isinstance(obj, mx.SuperAugmentedMatrix):
+        return SUPER_AUGMENTED_MATRIX, 0, (obj.m, obj.n, obj.rhs.n), _rows(obj.lhs) + _rows(obj.rhs)
+    if isinstance(obj, eq.LinearSystem):
+        sections = [le.a.components for le in obj.e[1:]]
+        sections.append([le.rhs for le in obj.e[1:]])
+        return LINEAR_SYSTEM, 0, (obj.m, obj.n), sections
+    raise TypeError(f"Can't serialize {type(obj).__name__}")
+
+
+def _flatten(sections: List):
+    # real sections are joined into one array of doubles without unpacking them, anything
+    # else into a list
+    if all(isinstance(s, (array, memoryview)) for s in sections):
+        if len(sections) == 1 and isinstance(sections[0], array):
+            return sections[0]
+        values = array('d')
+        for s in sections:
+            values.frombytes(s.tobytes())
+        return values
+    return [x for s in sections for x in s]
+
+
+def dumps(obj) -> bytes:
+    kind, flags, dims, sections = _parts(obj)
+    values = _flatten(sections)
+    dtype = _dtype(values)
+    header = _HEADER.pack(MAGIC, VERSION, kind, dtype, flags, len(dims)) + struct.pack(f'<{len(dims)}Q', *dims)
+    return header + _pack(values, dtype)
+
+
+def loads(data):
+    view = memoryview(data)
+    magic, version, kind, dtype, flags, rank = _HEADER.unpack_from(view)
+    assert magic == MAGIC, "Not a serialized object"
+    assert version == VERSION, f"Unsupported version: {version}"
+    dims = struct.unpack_from(f'<{rank}Q', view, _HEADER.size)
+    view = view[_HEADER.size + 8 * rank:]
+    if kind == VECTOR:
+        return vc.Vector.from_sequence(_unpack(view, dtype, dims[0]))
+    if kind == MATRIX:
+        m, n = dims
+        augmented = bool(flags & _AUGMENTED)
+        values = _unpack(view, dtype, m * n + (m if augmented else 0))
+        A = mx._from_buffer(m, n, values[:m * n], values[m * n:] if augmented else None)
+        A.augmented = augmented
+        return A
+    if kind == SUPER_AUGMENTED_MATRIX:
+        m, n, p = dims
+        values = _unpack(view, dtype, m * (n + p))
+        return mx.SuperAugmentedMatrix(mx._from_buffer(m, n, values[:m * n]), mx._from_buffer(m, p, values[m * n:]))
+    if kind == LINEAR_SYSTEM:
+        m, n = dims
+        values = _unpack(view, dtype, m * n + m)
+        return eq.LinearSystem(*[_equation(values[i * n:(i + 1) * n], values[m * n + i]) for i in range(m)])
+    raise ValueError(f"Unknown kind: {kind}")
+
+
+def _equation(coefficients, rhs) -> eq.LinearEquation:
+    # the equations of a system are stored in one payload, so the real equations of a complex
+    # system are made real again
+    if not isinstance(rhs, complex) or any(x.imag != 0 for x in coefficients) or rhs.imag != 0:
+        return eq.LinearEquation(coefficients, rhs)
+    return eq.LinearEquation([x.real for x in coefficients], rhs.real)
+
+
+def save(obj, path: str):
+    with open(path, 'wb') as f:
+        f.write(dumps(obj))
+
+
+def load(path: str):
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def _reduce(obj):
+    return loads, (dumps(obj),)
+
+
+# pickle and copy use the format above; views are stored as copies of their entries
+for cls in (vc.Vector, mx.VectorView, mx.Matrix, mx.MatrixView, mx.SuperAugmentedMatrix, eq.LinearSystem):
+    copyreg.pickle(cls, _reduce)
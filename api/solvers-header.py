@@ -0,0 +1,39 @@
+
+"""
+This file contains the documentation for solvers.py
+"""
+
+# The solvers in this file find x such that Ax = b iteratively. A can be a Matrix, a
+# SparseMatrix, or any operator which exposes matrix_vector_product(v). Each solver stops
+# once the residual ||b - Ax|| is at most tol * max(||b||, 1), or after max_iter iterations
+#  :param A: the coefficient matrix (or operator)
+#  :param b: the right-hand-side vector
+#  :param x0: the initial guess, defaults to the zero vector
+#  :param tol: the relative tolerance on the residual
+#  :param max_iter: the iteration limit
+
+
+# SolverResult(x, converged, iterations, residuals):
+#    A SolverResult holds the outcome of an iterative solve
+#
+#  FIELDS:
+#   * x: the final approximation of the solution
+#   * converged: true if the residual reached the tolerance
+#   * iterations: the number of iterations performed
+#   * residuals: the norm of the residual before the first iteration, and after each iteration
+
+
+# conjugate_gradient(A, b, x0, tol, max_iter) solves Ax = b with the Conjugate Gradient method
+#  requires: A is symmetric (Hermitian) positive definite
+
+# gmres(A, b, x0, tol, restart, max_iter) solves Ax = b with GMRES, restarted every restart
+#  iterations
+#  note: the residuals recorded inside a cycle are the estimates from the Arnoldi process,
+#        the last residual of each cycle is recomputed from x
+
+# jacobi(A, b, x0, tol, max_iter) solves Ax = b with Jacobi iteration
+#  requires: A has no zeros on its diagonal (convergence needs e.g. diagonal dominance)
+#            A exposes its entries, i.e., it is a Matrix, a SparseMatrix, or has row(i)
+
+# gauss_seidel(A, b, x0, tol, max_iter) solves Ax = b with Gauss-Seidel iteration
+#  requires: same as jacobi
@@ -0,0 +1,199 @@
+from math import sqrt
+from typing import Callable, List
+import api.vector as vc
+import api.matrix as mx
+
+
+class SolverResult:
+    def __init__(self, x: vc.Vector, converged: bool, iterations: int, residuals: List[float]):
+        self.x = x
+        self.converged = converged
+        self.iterations = iterations
+        self.residuals = residuals
+
+    def __repr__(self):
+        status = 'converged' if self.converged else 'did not converge'
+        return f'{status} after {self.iterations} iterations, residual {self.residuals[-1]:.3g}: x = {self.x}'
+
+
+def _operator(A) -> Callable:
+    # produces a function which maps the components of x to the components of Ax
+    if hasattr(A, 'matrix_vector_product'):
+        return lambda x: list(A.matrix_vector_product(vc.Vector.from_sequence(x)).components)
+    return lambda x: list(mx.matrix_vector_product(A, vc.Vector.from_sequence(x)).components)
+
+
+def _rows(A) -> List[List]:
+    # produces the nonzero entries of each row of A, as lists of (0-indexed column, value)
+    if isinstance(A, mx.SparseMatrix):
+        return [
+            [(A.indices[k], A.values[k]) for k in range(A.indptr[i], A.indptr[i + 1])]
+            for i in range(A.m)
+        ]
+    if isinstance(A, mx.Matrix):
+        rows = []
+        for i in range(A.m):
+            start = i * A.stride
+            rows.append([(j, a) for j, a in enumerate(A.data[start:start + A.n]) if a != 0])
+        return rows
+    return [
+        [(j, a) for j, a in enumerate(A.row(i).components) if a != 0]
+        for i in range(1, A.m + 1)
+    ]
+
+
+def _inner(x: List, y: List):
+    return sum(a * b.conjugate() for a, b in zip(x, y))
+
+
+def _norm(x: List) -> float:
+    return sqrt(sum(abs(a) ** 2 for a in x))
+
+
+def _start(b: vc.Vector, x0: vc.Vector) -> List:
+    if x0 is None:
+        return [0] * b.dim
+    assert x0.dim == b.dim, "x0 and b have different dimensions"
+    return list(x0.components)
+
+
+def conjugate_gradient(A, b: vc.Vector, x0: vc.Vector = None, tol: float = 1e-8,
+                       max_iter: int = None) -> SolverResult:
+    matvec = _operator(A)
+    x = _start(b, x0)
+    max_iter = b.dim * 10 if max_iter is None else max_iter
+    target = tol * max(_norm(b.components), 1)
+    r = [bi - ai for bi, ai in zip(b.components, matvec(x))]
+    p = r[:]
+    rr = _inner(r, r).real
+    residuals = [sqrt(rr)]
+    k = 0
+    while residuals[-1] > target and k < max_iter:
+        Ap = matvec(p)
+        pAp = _inner(Ap, p)
+        assert abs(pAp) > 0, "A is not positive definite"
+        alpha = rr / pAp
+        x = [xi + alpha * pi for xi, pi in zip(x, p)]
+        r = [ri - alpha * api for ri, api in zip(r, Ap)]
+        rr_next = _inner(r, r).real
+        p = [ri + (rr_next / rr) * pi for ri, pi in zip(r, p)]
+        rr = rr_next
+        residuals.append(sqrt(rr))
+        k += 1
+    return SolverResult(vc.Vector.from_sequence(x), residuals[-1] <= target, k, residuals)
+
+
+def _givens(a, b):
+    # produces (c, s) so that the rotation [[c, s], [-conj(s), c]] maps (a, b) to (r, 0)
+    if b == 0:
+        return 1, 0
+    if a == 0:
+        return 0, 1
+    t = sqrt(abs(a) ** 2 + abs(b) ** 2)
+    return abs(a) / t, (a / abs(a)) * b.conjugate() / t
+
+
+def gmres(A, b: vc.Vector, x0: vc.Vector = None, tol: float = 1e-8, restart: int = 20,
+          max_iter: int = None) -> SolverResult:
+    matvec = _operator(A)
+    n = b.dim
+    x = _start(b, x0)
+    max_iter = n * 10 if max_iter is None else max_iter
+    target = tol * max(_norm(b.components), 1)
+    r = [bi - ai for bi, ai in zip(b.components, matvec(x))]
+    beta = _norm(r)
+    residuals = [beta]
+    k = 0
+    while beta > target and k < max_iter:
+        # one cycle of Arnoldi iterations, with the least squares problem kept
+        # upper triangular by Givens rotations
+        Q = [[ri / beta for ri in r]]
+        H = []
+        rotations = []
+        g = [beta]
+        for j in range(min(restart, n)):
+            w = matvec(Q[j])
+            h = []
+            for q in Q:
+                hij = _inner(w, q)
+                w = [wi - hij * qi for wi, qi in zip(w, q)]
+                h.append(hij)
+            norm_w = _norm(w)
+            h.append(norm_w)
+            for i, (c, s) in enumerate(rotations):
+                h[i], h[i + 1] = c * h[i] + s * h[i + 1], -s.conjugate() * h[i] + c * h[i + 1]
+            c, s = _givens(h[j], h[j + 1])
+            rotations.append((c, s))
+            h[j], h[j + 1] = c * h[j] + s * h[j + 1], 0
+            g.append(-s.conjugate() * g[j])
+            g[j] = c * g[j]
+            H.append(h)
+            k += 1
+            residuals.append(abs(g[j + 1]))
+            # a zero norm_w means the Krylov space is invariant, so the solution is in it
+            if residuals[-1] <= target or k >= max_iter or norm_w == 0:
+                break
+            Q.append([wi / norm_w for wi in w])
+        # back substitution for the coefficients y, then x += Qy
+        size = len(H)
+        y = [0] * size
+        for i in range(size - 1, -1, -1):
+            total = g[i] - sum(H[j][i] * y[j] for j in range(i + 1, size))
+            y[i] = total / H[i][i] if H[i][i] != 0 else 0
+        for j in range(size):
+            x = [xi + y[j] * qi for xi, qi in zip(x, Q[j])]
+        r = [bi - ai for bi, ai in zip(b.components, matvec(x))]
+        beta = _norm(r)
+        residuals[-1] = beta
+    return SolverResult(vc.Vector.from_sequence(x), beta <= target, k, residuals)
+
+
+def _diagonal(rows: List[List]) -> List:
+    diagonal = []
+    for i, row in enumerate(rows):
+        d = next((a for j, a in row if j == i), 0)
+        assert d != 0, f"A has a zero on its diagonal, in row {i + 1}"
+        diagonal.append(d)
+    return diagonal
+
+
+def jacobi(A, b: vc.Vector, x0: vc.Vector = None, tol: float = 1e-8,
+           max_iter: int = None) -> SolverResult:
+    rows = _rows(A)
+    assert len(rows) == b.dim, "A and b have different dimensions"
+    diagonal = _diagonal(rows)
+    x = _start(b, x0)
+    max_iter = b.dim * 100 if max_iter is None else max_iter
+    target = tol * max(_norm(b.components), 1)
+    residuals = []
+    k = 0
+    while True:
+        r = [bi - sum(a * x[j] for j, a in row) for bi, row in zip(b.components, rows)]
+        residuals.append(_norm(r))
+        if residuals[-1] <= target or k >= max_iter:
+            break
+        x = [xi + ri / d for xi, ri, d in zip(x, r, diagonal)]
+        k += 1
+    return SolverResult(vc.Vector.from_sequence(x), residuals[-1] <= target, k, residuals)
+
+
+def gauss_seidel(A, b: vc.Vector, x0: vc.Vector = None, tol: float = 1e-8,
+                 max_iter: int = None) -> SolverResult:
+    rows = _rows(A)
+    assert len(rows) == b.dim, "A and b have different dimensions"
+    diagonal = _diagonal(rows)
+    x = _start(b, x0)
+    max_iter = b.dim * 100 if max_iter is None else max_iter
+    target = tol * max(_norm(b.components), 1)
+
+    def residual():
+        return _norm([bi - sum(a * x[j] for j, a in row) for bi, row in zip(b.components, rows)])
+
+    residuals = [residual()]
+    k = 0
+    while residuals[-1] > target and k < max_iter:
+        for i, row in enumerate(rows):
+            x[i] += (b.components[i] - sum(a * x[j] for j, a in row)) / diagonal[i]
+        residuals.append(residual())
+        k += 1
+    return SolverResult(vc.Vector.from_sequence(x), residuals[-1] <= target, k, residuals)
@@ -10,7 +10,15 @@ This file contains the documentation for space.py
 #    :param args: the spanning vectors
 #
 #  FIELDS:
-#   * vectors: the normalized vectors which define the span
+#   * vectors: the spanning vectors, in the order they were added
+#   * basis: an orthonormal basis of the span, maintained by modified Gram-Schmidt
+#   * dim: the dimension of the span, i.e., len(basis)
+#   * n: the dimension of the space containing the span
+#   * field: the field of the span
+#
+#  METHODS:
+#   * add(v): adds v to the spanning vectors, extending the basis if v is not already in the span
+#             requires: v.dim == n
 
 
 # Line(v, w):
@@ -46,7 +54,9 @@ This file contains the documentation for space.py
 
 # span_is_equal(S, U) produces true if S and U are equal Spans
 
-# contained_in_span(v, S) produces true if v is in the Span S
+# contained_in_span(v, S) produces true if v is in the Span S, i.e., if the residual of v
+#  after projecting onto S.basis is within TOLERANCE (relative to the length of v)
+#  time: O(S.dim * S.n)
 
 # line_passing_through(v, w) produces a Line which passes through the terminal points
 #  of v and w
@@ -1,16 +1,51 @@
 
+from math import sqrt
 import api.vector as vc
-import api.matrix as mx
+
+
+def _inner(x, y):
+    return sum(a * b.conjugate() for a, b in zip(x, y))
+
+
+def _norm(x) -> float:
+    return sqrt(sum(abs(a) ** 2 for a in x))
 
 
 class Span:
     def __init__(self, *args: vc.Vector):
         assert 0 < len(args), "must have at least 1 vector in the span"
-        normalized = []
+        self.n = args[0].dim
+        self.field = 'real'
+        self.vectors = []
+        self.basis = []
+        self.dim = 0
         for v in args:
-            normalized.append(vc.normalize(v))
-        self.vectors = set(normalized)
-        # TODO: Reduce the linear combinations in the span
+            self.add(v)
+
+    def __repr__(self):
+        return 'Span{' + ', '.join(f'{v}' for v in self.vectors) + '}'
+
+    def _residual(self, x, passes: int = 1):
+        # removes the projection of x onto the span, by modified Gram-Schmidt
+        r = list(x)
+        for p in range(passes):
+            for q in self.basis:
+                c = _inner(r, q.components)
+                if c != 0:
+                    r = [a - c * b for a, b in zip(r, q.components)]
+        return r
+
+    def add(self, v: vc.Vector):
+        assert v.dim == self.n, "all vectors in the span must be of the same dimension"
+        if v.field == 'complex':
+            self.field = 'complex'
+        self.vectors.append(v)
+        # a second pass of Gram-Schmidt keeps the basis orthonormal to working precision
+        r = self._residual(v.components, passes=2)
+        size = _norm(r)
+        if size > vc.TOLERANCE * max(1, _norm(v.components)):
+            self.basis.append(vc.Vector.from_sequence([a / size for a in r]))
+            self.dim += 1
 
 
 class Line:
@@ -37,29 +72,25 @@ class Plane:
         self.v = v
         self.w = w
         self.field = v.field
+        self.span = Span(v, w)
 
     def __repr__(self):
         return '{' + f'{self.p} + s{self.v} + t{self.w}: s,t e {self.field}' + '}'
 
 
 def span_is_equal(S: Span, U: Span) -> bool:
-    # TODO: this is currently incorrect
-    if len(S.vectors) != len(U.vectors):
+    if S.n != U.n or S.dim != U.dim:
         return False
-    for v in S.vectors:
-        matched = False
-        for w in U.vectors:
-            if vc.is_equal(v, w):
-                matched = True
-                break
-        if not matched:
+    for q in S.basis:
+        if not contained_in_span(q, U):
             return False
     return True
 
 
 def contained_in_span(v: vc.Vector, S: Span) -> bool:
-    # TODO...
-    return True
+    if v.dim != S.n:
+        return False
+    return _norm(S._residual(v.components)) <= vc.TOLERANCE * max(1, _norm(v.components))
 
 
 def line_passing_through(v: vc.Vector, w: vc.Vector) -> Line:
@@ -85,17 +116,11 @@ def plane_passing_through(p: vc.Vector, r: vc.Vector, q: vc.Vector) -> Plane:
 
 
 def lies_on_plane(P: Plane, v: vc.Vector) -> bool:
-    return contained_in_span(
-        vc.subtract(v, P.p),
-        Span(P.v, P.w)
-    )
+    return contained_in_span(vc.subtract(v, P.p), P.span)
 
 
 def plane_is_equal(P: Plane, Y: Plane) -> bool:
-    return lies_on_plane(P, Y.p) and span_is_equal(
-        Span(P.v, P.w),
-        Span(Y.v, Y.w)
-    )
+    return lies_on_plane(P, Y.p) and span_is_equal(P.span, Y.span)
 
 
 
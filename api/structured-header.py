@@ -0,0 +1,89 @@
+
+"""
+This file contains the documentation for structured.py
+"""
+
+# The classes in this file are square matrices with a known structure, which only store the
+# entries the structure allows to be nonzero, and compute with kernels that only touch those
+# entries. They can be passed to matrix_vector_product, matrix_matrix_product (on either side),
+# matrix_transpose, determinant, inverse and lstsq of matrix.py, which hand them to the kernels
+# below, and they support the @ operator with Matrices, SparseMatrices and Vectors
+# The other functions of matrix.py (matrix_equal, matrix_add, matrix_subtract, matrix_negate,
+# matrix_scalar_product, rank, nullity, is_consistent, condition_number, rref, ...) work on the
+# dense form of a structured matrix (built once, and cached on it), and produce a Matrix; so do
+# the operators +, - and * (A + B, A - B, -A, c * A), and A += B with a Matrix A
+# to_rref modifies its argument, so it rejects a structured matrix: use rref instead
+#
+#  COMMON FIELDS:
+#   * m, n: number of rows and columns (always equal)
+#   * augmented: always false
+#
+#  COMMON METHODS:
+#   * sub(i, j) produces the value at coordinates (i,j) of the matrix
+#   * row(i), col(i) produce the ith row and column vectors
+#   * to_dense() produces the (dense) Matrix with the same entries
+#   * matrix_vector_product(v) produces the product with the vector v
+#   * solve(b) produces the solution x to self x = b
+#      requires: self is invertible
+#   * solve_many(B) produces the matrix X whose columns solve self X.col(j) = B.col(j)
+#   * determinant(exact) produces the determinant of self
+#      if exact, it is computed without rounding (see determinant in matrix.py), as an int or
+#      a Fraction
+#   * transpose() produces the transpose of self, with the same structure
+#   * inverse() produces the inverse of self
+#  products with a Matrix produce a Matrix, computed a column (row) of the other operand at a
+#  time with matrix_vector_product
+#  a structured matrix isn't modified once built, so its factorization is computed on the first
+#  solve or determinant, and cached on it: solve_many, inverse and lstsq reuse it for every
+#  right-hand side, and repeat calls of inverse produce the same result
+
+# DiagonalMatrix(diagonal):
+#    A DiagonalMatrix stores only its diagonal (a sequence or a Vector)
+#    matrix_vector_product, solve and determinant are O(n); transpose is self, the inverse and
+#    the product of two DiagonalMatrices are DiagonalMatrices
+#
+#  FIELDS:
+#   * diagonal: the diagonal entries
+
+# TriangularMatrix(grid, lower):
+#    A TriangularMatrix is the upper (lower if lower) triangular matrix grid (a 2d-array or a
+#    Matrix), stored packed row by row in n(n+1)/2 entries
+#    matrix_vector_product is O(n^2/2), solve is back (forward) substitution in O(n^2/2), the
+#    determinant is the product of the diagonal, the transpose is the lower (upper)
+#    TriangularMatrix, and the inverse is a TriangularMatrix of the same kind
+#    requires: the entries of grid outside of the triangle are zero
+#
+#  FIELDS:
+#   * lower: true for a lower triangular matrix
+#   * data: the packed entries of the triangle
+
+# BandedMatrix(grid, lower_bandwidth, upper_bandwidth):
+#    A BandedMatrix is the matrix grid (a 2d-array or a Matrix) whose nonzero entries lie
+#    within lower_bandwidth diagonals below the main diagonal and upper_bandwidth above it;
+#    each row stores the width = lower_bandwidth + upper_bandwidth + 1 entries of its band,
+#    so entry (i,j) is data[(i-1)*width + j - i + lower_bandwidth]
+#    matrix_vector_product is O(n*width); Gaussian elimination with partial pivoting within the
+#    band runs once, in O(n*lower_bandwidth*width), after which each solve is O(n*width) and
+#    the determinant O(n); the transpose swaps the bandwidths, and the inverse is a (dense)
+#    Matrix
+#    requires: the entries of grid outside of the band are zero
+#
+#  FIELDS:
+#   * lower_bandwidth, upper_bandwidth, width: as above
+#   * data: the entries of the band, row by row
+
+# SymmetricMatrix(grid):
+#    A SymmetricMatrix is the symmetric matrix grid (a 2d-array or a Matrix), of which only the
+#    upper triangle is stored, packed row by row in n(n+1)/2 entries
+#    matrix_vector_product reads each stored entry once; solve and determinant use the
+#    Cholesky factorization when self is positive definite (each solve is then two triangular
+#    substitutions), and the LU factorization of the dense matrix otherwise; transpose is self,
+#    and the inverse is a SymmetricMatrix
+#    requires: grid is symmetric (within TOLERANCE)
+#
+#  FIELDS:
+#   * data: the packed entries of the upper triangle
+
+# identity(n) produces the identity matrix in n*n space, as a DiagonalMatrix
+
+# to_dense(A) produces the (dense) Matrix with the same entries as A
@@ -0,0 +1,489 @@
+from numbers import Number
+from typing import List
+import api.vector as vc
+import api.matrix as mx
+
+
+def _rows(grid) -> List[List]:
+    # the rows of grid (a Matrix, or a sequence of sequences) as lists
+    if isinstance(grid, mx.Matrix):
+        return [list(grid.row(i).components) for i in range(1, grid.m + 1)]
+    return [list(row) for row in grid]
+
+
+def _product(values, exact: bool):
+    # the product of values, taken as ints and Fractions (without rounding) if exact
+    total = 1
+    for x in values:
+        total *= mx._exact(x) if exact else x
+    return total
+
+
+def _cached(A, key: str, compute):
+    # like _cached of matrix.py, for a result of the kernels of A, which work on A itself rather
+    # than on its dense form
+    if key not in A._cache:
+        A._cache[key] = compute(A)
+    return A._cache[key]
+
+
+def _cached_matrix(A, key: str, compute) -> mx.Matrix:
+    # like _cached, for a Matrix which is handed out as is (see _cached_matrix of matrix.py)
+    cached = A._cache.get(key)
+    if cached is None or cached[0]._version != cached[1]:
+        B = compute(A)
+        cached = A._cache[key] = (B, B._version)
+    return cached[0]
+
+
+class _Structured:
+    """
+    _Structured is the common part of the square structured matrices: they are read with
+    sub, row and col like a Matrix, multiply with @ (on either side of a Matrix, SparseMatrix
+    or Vector), and solve with solve and solve_many like a factorization; subclasses provide
+    sub, matrix_vector_product, solve, determinant, transpose and inverse
+    a structured matrix isn't modified once built, so its factorization (and any other derived
+    result) is cached on it, like the results cached on a Matrix
+    """
+
+    def __init__(self, n: int):
+        assert n > 0, "Invalid dimensions"
+        self._version = 0
+        self._cache = {}
+        self.m = n
+        self.n = n
+        self.augmented = False
+
+    def __repr__(self):
+        return repr(self.to_dense())
+
+    def _check(self, i: int, j: int):
+        assert 1 <= i <= self.n and 1 <= j <= self.n, "Invalid entry request"
+
+    def row(self, i: int) -> vc.Vector:
+        assert 1 <= i <= self.n, "Invalid row request"
+        return vc.Vector.from_sequence([self.sub(i, j) for j in range(1, self.n + 1)])
+
+    def col(self, i: int) -> vc.Vector:
+        assert 1 <= i <= self.n
+        return vc.Vector.from_sequence([self.sub(j, i) for j in range(1, self.n + 1)])
+
+    def to_dense(self) -> mx.Matrix:
+        return mx.Matrix.from_rows([[self.sub(i, j) for j in range(1, self.n + 1)] for i in range(1, self.n + 1)])
+
+    def _dense(self) -> mx.Matrix:
+        # the dense Matrix of self, for the computations without a structured kernel; results
+        # cached on it (e.g. its lu_factor) are shared by repeat calls
+        return _cached_matrix(self, 'dense', _Structured.to_dense)
+
+    def solve_many(self, B: mx.Matrix) -> mx.Matrix:
+        assert B.m == self.n, "B has the wrong number of rows"
+        return mx.Matrix.from_columns([self.solve(B.col(j)) for j in range(1, B.n + 1)])
+
+    def __add__(self, B):
+        if not isinstance(B, (mx.Matrix, mx.SparseMatrix, _Structured)):
+            return NotImplemented
+        return mx.matrix_add(self, B)
+
+    def __radd__(self, B):
+        if not isinstance(B, (mx.Matrix, mx.SparseMatrix)):
+            return NotImplemented
+        return mx.matrix_add(B, self)
+
+    def __sub__(self, B):
+        if not isinstance(B, (mx.Matrix, mx.SparseMatrix, _Structured)):
+            return NotImplemented
+        return mx.matrix_subtract(self, B)
+
+    def __rsub__(self, B):
+        if not isinstance(B, (mx.Matrix, mx.SparseMatrix)):
+            return NotImplemented
+        return mx.matrix_subtract(B, self)
+
+    def __mul__(self, c):
+        if not isinstance(c, Number):
+            return NotImplemented
+        return mx.matrix_scalar_product(self, c)
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return mx.matrix_negate(self)
+
+    def __matmul__(self, X):
+        if isinstance(X, vc.Vector):
+            return self.matrix_vector_product(X)
+        if not isinstance(X, (mx.Matrix, mx.SparseMatrix, _Structured)):
+            return NotImplemented
+        assert X.m == self.n and not X.augmented
+        # column j of the product is self times column j of X
+        return mx.Matrix.from_columns([self.matrix_vector_product(X.col(j)) for j in range(1, X.n + 1)])
+
+    def __rmatmul__(self, A):
+        if not isinstance(A, (mx.Matrix, mx.SparseMatrix)):
+            return NotImplemented
+        assert A.n == self.n and not A.augmented
+        # row i of the product is the transpose of self times row i of A
+        T = self.transpose()
+        return mx.Matrix.from_rows([T.matrix_vector_product(A.row(i)) for i in range(1, A.m + 1)])
+
+
+class DiagonalMatrix(_Structured):
+    """
+    DiagonalMatrix(diagonal) is the square matrix with the given diagonal, only the diagonal
+    is stored
+    """
+
+    def __init__(self, diagonal):
+        self.diagonal = mx._buffer(diagonal.components if isinstance(diagonal, vc.Vector) else diagonal)
+        super().__init__(len(self.diagonal))
+
+    def sub(self, i: int, j: int):
+        self._check(i, j)
+        return self.diagonal[i - 1] if i == j else 0
+
+    def matrix_vector_product(self, v: vc.Vector) -> vc.Vector:
+        assert v.dim == self.n
+        return vc.Vector.from_sequence([d * x for d, x in zip(self.diagonal, v.components)])
+
+    def solve(self, b: vc.Vector) -> vc.Vector:
+        assert b.dim == self.n, "b has the wrong dimension"
+        assert all(d != 0 for d in self.diagonal), "The matrix is singular"
+        return vc.Vector.from_sequence([x / d for d, x in zip(self.diagonal, b.components)])
+
+    def determinant(self, exact: bool = False):
+        return _product(self.diagonal, exact)
+
+    def transpose(self):
+        return self
+
+    def inverse(self):
+        assert all(d != 0 for d in self.diagonal), "The matrix is singular"
+        return DiagonalMatrix([1 / d for d in self.diagonal])
+
+    def __matmul__(self, X):
+        if isinstance(X, DiagonalMatrix):
+            assert X.n == self.n
+            return DiagonalMatrix([a * b for a, b in zip(self.diagonal, X.diagonal)])
+        return super().__matmul__(X)
+
+
+class TriangularMatrix(_Structured):
+    """
+    TriangularMatrix(grid, lower) is the upper (lower if lower) triangular part of the square
+    grid, which is stored packed row by row, i.e., only n(n+1)/2 entries
+    """
+
+    def __init__(self, grid, lower: bool = False):
+        rows = _rows(grid)
+        super().__init__(len(rows))
+        self.lower = lower
+        values = []
+        for i, row in enumerate(rows):
+            assert len(row) == self.n, "The grid is not square"
+            assert all(x == 0 for x in (row[i + 1:] if lower else row[:i])), "The grid is not triangular"
+            values.extend(row[:i + 1] if lower else row[i:])
+        self.data = mx._buffer(values)
+
+    @classmethod
+    def _from_packed(cls, n: int, data, lower: bool):
+        T = cls.__new__(cls)
+        _Structured.__init__(T, n)
+        T.lower = lower
+        T.data = data
+        return T
+
+    def _start(self, i: int) -> int:
+        # the offset of (0-indexed) row i in data, and of its first stored column
+        if self.lower:
+            return i * (i + 1) // 2
+        return i * self.n - i * (i - 1) // 2
+
+    def _row(self, i: int):
+        # the stored entries of (0-indexed) row i, and the column of the first one
+        start = self._start(i)
+        if self.lower:
+            return self.data[start:start + i + 1], 0
+        return self.data[start:start + self.n - i], i
+
+    def sub(self, i: int, j: int):
+        self._check(i, j)
+        if (j > i) if self.lower else (j < i):
+            return 0
+        return self.data[self._start(i - 1) + (j - 1 if self.lower else j - i)]
+
+    def _diagonal(self) -> List:
+        return [self.sub(i, i) for i in range(1, self.n + 1)]
+
+    def matrix_vector_product(self, v: vc.Vector) -> vc.Vector:
+        assert v.dim == self.n
+        x = v.components
+        y = []
+        for i in range(self.n):
+            row, first = self._row(i)
+            y.append(sum(a * b for a, b in zip(row, x[first:first + len(row)])))
+        return vc.Vector.from_sequence(y)
+
+    def solve(self, b: vc.Vector) -> vc.Vector:
+        # forward substitution for a lower triangular matrix, back substitution for an upper one
+        assert b.dim == self.n, "b has the wrong dimension"
+        x = [0] * self.n
+        order = range(self.n) if self.lower else range(self.n - 1, -1, -1)
+        for i in order:
+            row, first = self._row(i)
+            d = row[-1] if self.lower else row[0]
+            assert d != 0, "The matrix is singular"
+            if self.lower:
+                total = sum(a * c for a, c in zip(row[:-1], x[:i]))
+            else:
+                total = sum(a * c for a, c in zip(row[1:], x[i + 1:]))
+            x[i] = (b.components[i] - total) / d
+        return vc.Vector.from_sequence(x)
+
+    def determinant(self, exact: bool = False):
+        return _product(self._diagonal(), exact)
+
+    def transpose(self):
+        # the rows of the transpose are the columns of self, packed in the other triangle
+        n = self.n
+        if self.lower:
+            values = [self.data[self._start(j) + i] for i in range(n) for j in range(i, n)]
+        else:
+            values = [self.data[self._start(j) + i - j] for i in range(n) for j in range(i + 1)]
+        return TriangularMatrix._from_packed(n, mx._buffer(values), not self.lower)
+
+    def inverse(self):
+        return _cached(self, 'inverse', TriangularMatrix._inverse)
+
+    def _inverse(self):
+        # column k of the inverse solves self x = e_k, and is zero outside the triangle
+        n = self.n
+        columns = []
+        for k in range(n):
+            e = [0] * n
+            e[k] = 1
+            columns.append(self.solve(vc.Vector.from_sequence(e)).components)
+        if self.lower:
+            values = [columns[j][i] for i in range(n) for j in range(i + 1)]
+        else:
+            values = [columns[j][i] for i in range(n) for j in range(i, n)]
+        return TriangularMatrix._from_packed(n, mx._buffer(values), self.lower)
+
+
+class BandedMatrix(_Structured):
+    """
+    BandedMatrix(grid, lower_bandwidth, upper_bandwidth) is the band of the square grid with
+    lower_bandwidth diagonals below the main one and upper_bandwidth above it; each row stores
+    the lower_bandwidth + upper_bandwidth + 1 entries of the band (padded with zeros at the
+    edges), so entry (i, j) is data[(i - 1) * width + j - i + lower_bandwidth]
+    """
+
+    def __init__(self, grid, lower_bandwidth: int, upper_bandwidth: int):
+        rows = _rows(grid)
+        super().__init__(len(rows))
+        assert lower_bandwidth >= 0 and upper_bandwidth >= 0, "Invalid bandwidths"
+        self.lower_bandwidth = lower_bandwidth
+        self.upper_bandwidth = upper_bandwidth
+        self.width = lower_bandwidth + upper_bandwidth + 1
+        values = []
+        for i, row in enumerate(rows):
+            assert len(row) == self.n, "The grid is not square"
+            first, last = i - lower_bandwidth, i + upper_bandwidth
+            assert all(x == 0 for j, x in enumerate(row) if not first <= j <= last), \
+                f"Row {i + 1} has entries outside of the band"
+            values.extend(row[j] if 0 <= j < self.n else 0 for j in range(first, last + 1))
+        self.data = mx._buffer(values)
+
+    def sub(self, i: int, j: int):
+        self._check(i, j)
+        if not -self.lower_bandwidth <= j - i <= self.upper_bandwidth:
+            return 0
+        return self.data[(i - 1) * self.width + j - i + self.lower_bandwidth]
+
+    def _band(self, i: int) -> dict:
+        # the entries of the band in (0-indexed) row i, by (0-indexed) column
+        start = i * self.width
+        return {
+            j: self.data[start + j - i + self.lower_bandwidth]
+            for j in range(max(i - self.lower_bandwidth, 0), min(i + self.upper_bandwidth + 1, self.n))
+        }
+
+    def matrix_vector_product(self, v: vc.Vector) -> vc.Vector:
+        assert v.dim == self.n
+        x = v.components
+        return vc.Vector.from_sequence([sum(a * x[j] for j, a in self._band(i).items()) for i in range(self.n)])
+
+    def _factor(self):
+        return _cached(self, 'factor', BandedMatrix._eliminate)
+
+    def _eliminate(self):
+        # Gaussian elimination with partial pivoting, which stays within the band: a pivot is
+        # chosen among the lower_bandwidth rows below, so the upper bandwidth grows to at most
+        # lower_bandwidth + upper_bandwidth; produces the rows of U, the steps (k, p, the
+        # multipliers (i, f) of row k subtracted from the rows i below) which reduce a
+        # right-hand side the same way, and the sign of the permutation (0 if singular)
+        rows = [self._band(i) for i in range(self.n)]
+        steps = []
+        sign = 1
+        for k in range(self.n):
+            last = min(k + self.lower_bandwidth, self.n - 1)
+            p = max(range(k, last + 1), key=lambda i: abs(rows[i].get(k, 0)))
+            if rows[p].get(k, 0) == 0:
+                return rows, steps, 0
+            if p != k:
+                rows[k], rows[p] = rows[p], rows[k]
+                sign = -sign
+            pivot = rows[k][k]
+            multipliers = []
+            for i in range(k + 1, last + 1):
+                f = rows[i].get(k, 0) / pivot
+                if f != 0:
+                    for j, a in rows[k].items():
+                        rows[i][j] = rows[i].get(j, 0) - f * a
+                    del rows[i][k]
+                    multipliers.append((i, f))
+            steps.append((k, p, multipliers))
+        return rows, steps, sign
+
+    def solve(self, b: vc.Vector) -> vc.Vector:
+        # the elimination is done once, each right-hand side only replays its steps
+        assert b.dim == self.n, "b has the wrong dimension"
+        rows, steps, sign = self._factor()
+        assert sign != 0, "The matrix is singular"
+        c = list(b.components)
+        for k, p, multipliers in steps:
+            c[k], c[p] = c[p], c[k]
+            for i, f in multipliers:
+                c[i] -= f * c[k]
+        x = [0] * self.n
+        for i in range(self.n - 1, -1, -1):
+            x[i] = (c[i] - sum(a * x[j] for j, a in rows[i].items() if j > i)) / rows[i][i]
+        return vc.Vector.from_sequence(x)
+
+    def determinant(self, exact: bool = False):
+        if exact:
+            return mx.determinant(self._dense(), exact=True)
+        rows, steps, sign = self._factor()
+        if sign == 0:
+            return 0
+        return sign * _product([rows[i][i] for i in range(self.n)], False)
+
+    def transpose(self):
+        T = BandedMatrix.__new__(BandedMatrix)
+        _Structured.__init__(T, self.n)
+        T.lower_bandwidth, T.upper_bandwidth, T.width = self.upper_bandwidth, self.lower_bandwidth, self.width
+        T.data = mx._buffer([
+            self.sub(j, i) if 1 <= j <= self.n else 0
+            for i in range(1, self.n + 1)
+            for j in range(i - T.lower_bandwidth, i + T.upper_bandwidth + 1)
+        ])
+        return T
+
+    def inverse(self) -> mx.Matrix:
+        # the inverse of a banded matrix is dense in general; it is handed out as is, so it is
+        # cached like the inverse of a Matrix
+        return _cached_matrix(self, 'inverse', lambda S: S.solve_many(mx.identity(S.n)))
+
+
+class SymmetricMatrix(_Structured):
+    """
+    SymmetricMatrix(grid) is the symmetric square grid, of which only the upper triangle is
+    stored, packed row by row
+    """
+
+    def __init__(self, grid):
+        rows = _rows(grid)
+        super().__init__(len(rows))
+        values = []
+        for i, row in enumerate(rows):
+            assert len(row) == self.n, "The grid is not square"
+            for j in range(i):
+                assert abs(row[j] - rows[j][i]) <= vc.TOLERANCE, "The grid is not symmetric"
+            values.extend(row[i:])
+        self.data = mx._buffer(values)
+
+    def _index(self, i: int, j: int) -> int:
+        # the offset of (0-indexed) entry (i, j) of the upper triangle, i <= j
+        return i * self.n - i * (i - 1) // 2 + j - i
+
+    def sub(self, i: int, j: int):
+        self._check(i, j)
+        if i > j:
+            i, j = j, i
+        return self.data[self._index(i - 1, j - 1)]
+
+    def matrix_vector_product(self, v: vc.Vector) -> vc.Vector:
+        # each stored entry above the diagonal contributes to two entries of the product
+        assert v.dim == self.n
+        x = v.components
+        y = [0] * self.n
+        for i in range(self.n):
+            start = self._index(i, i)
+            y[i] += self.data[start] * x[i]
+            for k, a in enumerate(self.data[start + 1:start + self.n - i], i + 1):
+                y[i] += a * x[k]
+                y[k] += a * x[i]
+        return vc.Vector.from_sequence(y)
+
+    def _cholesky(self):
+        # the lower triangular L with self = LL^T, as the TriangularMatrices L and L^T, or None
+        # if self isn't positive definite
+        n = self.n
+        L = [[0] * (i + 1) for i in range(n)]
+        for i in range(n):
+            for j in range(i + 1):
+                total = self.data[self._index(j, i)] - sum(L[i][k] * L[j][k] for k in range(j))
+                if i == j:
+                    if isinstance(total, complex) or total <= 0:
+                        return None
+                    L[i][i] = total ** 0.5
+                else:
+                    L[i][j] = total / L[j][j]
+        lower = TriangularMatrix._from_packed(n, mx._buffer([a for row in L for a in row]), True)
+        return lower, lower.transpose()
+
+    def _factor(self):
+        # the Cholesky factors when self is positive definite, and None otherwise (then the
+        # LU factorization of the dense matrix, cached on it, is used instead)
+        return _cached(self, 'cholesky', SymmetricMatrix._cholesky)
+
+    def solve(self, b: vc.Vector) -> vc.Vector:
+        assert b.dim == self.n, "b has the wrong dimension"
+        factors = self._factor()
+        if factors is None:
+            return mx.lu_factor(self._dense()).solve(b)
+        lower, upper = factors
+        return upper.solve(lower.solve(b))
+
+    def solve_many(self, B: mx.Matrix) -> mx.Matrix:
+        if self._factor() is None:
+            return mx.lu_factor(self._dense()).solve_many(B)
+        return super().solve_many(B)
+
+    def determinant(self, exact: bool = False):
+        factors = self._factor()
+        if exact or factors is None:
+            return mx.determinant(self._dense(), exact)
+        return _product(factors[0]._diagonal(), False) ** 2
+
+    def transpose(self):
+        return self
+
+    def inverse(self):
+        return _cached(self, 'inverse', SymmetricMatrix._inverse)
+
+    def _inverse(self):
+        inv = self.solve_many(mx.identity(self.n))
+        S = SymmetricMatrix.__new__(SymmetricMatrix)
+        _Structured.__init__(S, self.n)
+        # the upper triangle of the computed inverse, which is symmetric up to rounding
+        S.data = mx._buffer([inv.sub(i, j) for i in range(1, self.n + 1) for j in range(i, self.n + 1)])
+        return S
+
+
+def identity(n: int) -> DiagonalMatrix:
+    return DiagonalMatrix([1] * n)
+
+
+def to_dense(A) -> mx.Matrix:
+    return A.to_dense()
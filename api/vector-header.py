@@ -16,9 +16,16 @@ This file contains the documentation for vector.py
 #    :param args: the coordinates of the Vector
 #
 #  FIELDS:
-#   * components: the list of the components of the vector
-#   * field: the field of the vector
+#   * components: the components of the vector, packed into an array of doubles for a real
+#                 vector, or a list for a complex vector (and for components a double can't
+#                 hold exactly, i.e., Fractions and ints beyond 2**53, which are kept as they are)
+#   * field: the field of the vector, detected once on construction
 #   * dim: the dimension of the vector
+#   note: Vector uses __slots__, so no other attributes can be set on it
+#
+#  CLASS METHODS:
+#   * Vector.from_sequence(seq) produces the Vector with the components in seq (a sequence
+#     or buffer), without unpacking it into arguments
 #
 #  METHODS:
 #   * zero_vector() produces the zero_vector in the same dimension as self
@@ -26,6 +33,13 @@ This file contains the documentation for vector.py
 #   * copy() produces a copy of self
 #   * sub(n) produces the nth component of self
 #
+#  OPERATORS:
+#   * v + w, v - w, -v, s * v (v * s) and v @ w produce add(v, w), subtract(v, w), negate(v),
+#     scalar_multiply(v, s) and dot_product(v, w)
+#   * v += w, v -= w and v *= s modify the components of v in place, without allocating
+#     (the components are only replaced when a real v has to hold complex values); on a
+#     VectorView they modify the parent Matrix
+#
 
 
 # is_equal(v, w) produces true if v equals w
@@ -73,3 +87,49 @@ This file contains the documentation for vector.py
 # extend_zeros(v, n) adds n zeros of "padding" onto the tail of v, modifies v
 
 
+# VectorBatch(*args):
+#    A VectorBatch holds N vectors of the same dimension d, stored contiguously in a single
+#    buffer, so the batch_ functions below can process all of them in one pass (dispatched to
+#    NumPy by the backend for large batches)
+#    :param args: the vectors of the batch
+#    requires: all vectors in args are in the same dimension
+#
+#  FIELDS:
+#   * data: the components of all vectors, vector after vector, in an array of doubles for a
+#           real batch, or a list for a complex batch
+#   * count: the number of vectors, N
+#   * dim: the dimension of the vectors, d
+#   * field: the field of the vectors
+#
+#  CLASS METHODS:
+#   * VectorBatch.from_buffer(count, dim, data) produces the VectorBatch holding the count
+#     vectors stored one after the other in data
+#
+#  METHODS:
+#   * copy() produces a copy of self
+#   * vector(k) produces the kth vector of self
+#   * len(batch) produces the number of vectors in the batch
+
+# In the batch_ functions below, b is either a VectorBatch with as many vectors as a, or a
+# single Vector, which is then used against every vector of a. The functions which produce
+# scalars produce one per vector of a, in a flat array (or a list for complex values)
+
+# batch_dot(a, b) produces the dot products of the vectors of a and b
+
+# batch_norm(a) produces the norms of the vectors of a
+
+# batch_normalize(a) produces the batch of the vectors of a normalized
+
+# batch_add(a, b, *args) produces the batch of the sums of the vectors of a, b and args
+
+# batch_scalar_multiply(a, s) produces the batch of the vectors of a scaled by s
+#  s is either a single scalar, or a sequence with one scalar per vector of a
+
+# batch_proj(a, b) produces the batch of the projections of the vectors of a along b
+
+# batch_perp(a, b) produces the batch of the perps of the vectors of a along b
+
+# batch_cross_product(a, b) produces the batch of the cross products of the vectors of a and b
+#  requires: a and b are real, in R^3
+
+# batch_angle(a, b) produces the angles, in radians [0, pi], between the vectors of a and b
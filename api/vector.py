@@ -1,5 +1,10 @@
 
+from array import array
 from math import acos, cos, sqrt
+from numbers import Number
+from operator import add as _add, mul as _mul
+from typing import List
+import api.backend as bk
 
 
 def conj(z: complex) -> complex:
@@ -31,38 +36,143 @@ def format_complex(z: complex) -> str:
 TOLERANCE = 0.0001
 
 
+def _format_component(x) -> str:
+    # real components are stored as doubles, integral ones are shown without the '.0'
+    if isinstance(x, float) and x.is_integer() and abs(x) < 1e16:
+        return f'{int(x)}'
+    return f'{x}'
+
+
+# the ints of at most this size are held exactly by a double
+_EXACT_INT = 2 ** 53
+
+
+def _packable(values) -> bool:
+    # true if an array of doubles holds every one of values exactly, i.e., they are floats, or
+    # ints a double represents without rounding (anything else, e.g. a Fraction, is kept as is)
+    kinds = set(map(type, values))
+    if kinds <= {float}:
+        return True
+    if not all(issubclass(kind, (float, int)) for kind in kinds):
+        return False
+    ints = values if kinds == {int} else [x for x in values if not isinstance(x, float)]
+    return -_EXACT_INT <= min(ints) and max(ints) <= _EXACT_INT
+
+
 class Vector:
+    __slots__ = ('components', 'field', 'dim')
+
     def __init__(self, *args):
-        self.components = []
-        self.field = 'real'
-        for i in args:
-            self.components.append(i)
-            if isinstance(i, complex):
-                self.field = 'complex'
+        self._load(args)
+
+    @classmethod
+    def from_sequence(cls, seq):
+        v = cls.__new__(cls)
+        v._load(seq)
+        return v
+
+    def _load(self, seq):
+        # real vectors are packed into an array of doubles, complex ones (and ones with
+        # components a double can't hold exactly, like Fractions) are kept in a list
+        if not hasattr(seq, '__len__'):
+            # an iterator is used up by a failed attempt at packing it
+            seq = list(seq)
+        if isinstance(seq, array) and seq.typecode == 'd' or _packable(seq):
+            self.components = array('d', seq)
+            self.field = 'real'
+        else:
+            self.components = list(seq)
+            self.field = 'complex' if any(isinstance(i, complex) for i in self.components) else 'real'
         self.dim = len(self.components)
         assert self.dim > 0, "Empty Coordinates List"
 
     def __repr__(self):
-        output = f'[{self.components[0]}'
-        for i in range(1, self.dim):
-            output += f', {self.components[i]}'
-        output += ']'
-        return output
+        return '[' + ', '.join(_format_component(x) for x in self.components) + ']'
 
     def zero_vector(self):
-        zeros = [0] * self.dim
-        return Vector(*zeros)
+        return _wrap(array('d', bytes(8 * self.dim)), 'real')
 
     def is_zero(self):
-        return is_equal(self, self.zero_vector())
+        for x in self.components:
+            if abs(x) > TOLERANCE:
+                return False
+        return True
 
     def copy(self):
-        return Vector(*self.components)
+        return _wrap(self.components[:], self.field)
 
     def sub(self, n):
         assert 1 <= n <= self.dim, "Invalid component request"
         return self.components[n - 1]
 
+    def _admit(self, value):
+        # promotes the components to a list when value can't be held as a double
+        if isinstance(value, complex):
+            if isinstance(self.components, array):
+                self.components = list(self.components)
+            self.field = 'complex'
+
+    def _touch(self):
+        pass
+
+    def _writable(self):
+        # the components, for a modification which is followed by _touch
+        return self.components
+
+    def __add__(self, w):
+        if not isinstance(w, Vector):
+            return NotImplemented
+        return add(self, w)
+
+    def __sub__(self, w):
+        if not isinstance(w, Vector):
+            return NotImplemented
+        return subtract(self, w)
+
+    def __mul__(self, s):
+        if not isinstance(s, Number):
+            return NotImplemented
+        return scalar_multiply(self, s)
+
+    __rmul__ = __mul__
+
+    def __matmul__(self, w):
+        if not isinstance(w, Vector):
+            return NotImplemented
+        return dot_product(self, w)
+
+    def __neg__(self):
+        return negate(self)
+
+    def __iadd__(self, w):
+        if not isinstance(w, Vector):
+            return NotImplemented
+        _add_into(self, w)
+        return self
+
+    def __isub__(self, w):
+        if not isinstance(w, Vector):
+            return NotImplemented
+        _add_into(self, w, -1)
+        return self
+
+    def __imul__(self, s):
+        if not isinstance(s, Number):
+            return NotImplemented
+        if isinstance(s, complex):
+            assert self.field == 'complex', "Can't multiply a real vector by a complex number"
+        _scale_into(self, s)
+        return self
+
+
+def _wrap(components, field: str) -> Vector:
+    # produces a Vector which takes ownership of components, without checking them
+    v = Vector.__new__(Vector)
+    v.components = components
+    v.field = field
+    v.dim = len(components)
+    return v
+
 
 def is_equal(v: Vector, w: Vector) -> bool:
     if v.dim == w.dim:
@@ -75,34 +185,67 @@ def is_equal(v: Vector, w: Vector) -> bool:
 
 def add(v: Vector, w: Vector, *args: Vector) -> Vector:
     assert v.dim == w.dim, "Can't add vectors of different dimensions"
-    new_vector = v.zero_vector()
-    for i in range(v.dim):
-        new_vector.components[i] = v.components[i] + w.components[i]
-        if isinstance(new_vector.components[i], complex):
-            new_vector.field = 'complex'
     for vector in args:
-        new_vector = add(new_vector, vector)
-    return new_vector
+        assert vector.dim == v.dim, "Can't add vectors of different dimensions"
+    if bk.use_numpy(v.dim):
+        return Vector.from_sequence(bk.add(v.components, w.components, *[u.components for u in args]))
+    if not args:
+        return Vector.from_sequence([a + b for a, b in zip(v.components, w.components)])
+    return Vector.from_sequence([
+        sum(t) for t in zip(v.components, w.components, *[u.components for u in args])
+    ])
 
 
 def negate(v: Vector) -> Vector:
-    new_vector = v.zero_vector()
-    for i in range(v.dim):
-        new_vector.components[i] -= v.components[i]
-    return new_vector
+    return Vector.from_sequence([-x for x in v.components])
 
 
 def subtract(v: Vector, w: Vector) -> Vector:
-    return add(v, negate(w))
+    assert v.dim == w.dim, "Can't subtract vectors of different dimensions"
+    if bk.use_numpy(v.dim):
+        return Vector.from_sequence(bk.combine((1, -1), (v.components, w.components)))
+    return Vector.from_sequence([a - b for a, b in zip(v.components, w.components)])
 
 
 def scalar_multiply(v: Vector, s) -> Vector:
     if isinstance(s, complex):
         assert v.field == 'complex', "Can't multiply a real vector by a complex number"
-    new_vector = v.copy()
-    for i in range(v.dim):
-        new_vector.components[i] *= s
-    return new_vector
+    if bk.use_numpy(v.dim):
+        return Vector.from_sequence(bk.scale(v.components, s))
+    return Vector.from_sequence([x * s for x in v.components])
+
+
+def _contiguous(values) -> bool:
+    # true if values is a buffer of doubles that NumPy can modify in place
+    return isinstance(values, array) or isinstance(values, memoryview) and values.contiguous
+
+
+def _add_into(v: Vector, w: Vector, t=1):
+    # v += t * w, in place: the components of v are only replaced if they have to become complex
+    assert v.dim == w.dim, "Can't add vectors of different dimensions"
+    if w.field == 'complex':
+        v._admit(1j)
+    c, d = v._writable(), w.components
+    if bk.use_numpy(v.dim) and _contiguous(c):
+        bk.add_into(c, d, t)
+    elif t == 1:
+        for k in range(v.dim):
+            c[k] += d[k]
+    else:
+        for k in range(v.dim):
+            c[k] += t * d[k]
+    v._touch()
+
+
+def _scale_into(v: Vector, s):
+    v._admit(s)
+    c = v._writable()
+    if bk.use_numpy(v.dim) and _contiguous(c) and isinstance(s, (int, float)):
+        bk.scale_into(c, s)
+    else:
+        for k in range(v.dim):
+            c[k] *= s
+    v._touch()
 
 
 def is_scalar_multiple(v: Vector, w: Vector) -> bool:
@@ -126,6 +269,8 @@ def is_scalar_multiple(v: Vector, w: Vector) -> bool:
 
 def dot_product(v: Vector, w: Vector):
     assert v.dim == w.dim, "Can't dot vectors of different dimensions"
+    if bk.use_numpy(v.dim):
+        return bk.dot(v.components, w.components)
     result = 0
     for i in range(v.dim):
         result += v.components[i] * w.components[i]
@@ -133,6 +278,8 @@ def dot_product(v: Vector, w: Vector):
 
 
 def norm(v: Vector) -> float:
+    if bk.use_numpy(v.dim):
+        return bk.norm(v.components)
     if v.field == 'complex':
         arg = inner_product(v, v)
         assert arg.imag == 0
@@ -178,10 +325,9 @@ def perp(v: Vector, w: Vector) -> Vector:
 
 
 def vector_conj(v: Vector) -> Vector:
-    new_vector = v.copy()
-    for i in range(new_vector.dim):
-        new_vector.components[i] = conj(new_vector.components[i])
-    return new_vector
+    if v.field == 'real':
+        return v.copy()
+    return Vector.from_sequence([conj(z) for z in v.components])
 
 
 def inner_product(w: Vector, z: Vector) -> complex:
@@ -191,6 +337,8 @@ def inner_product(w: Vector, z: Vector) -> complex:
 def cross_product(u: Vector, v: Vector) -> Vector:
     assert u.field == 'real' and v.field == 'real', "u and v must be real vectors"
     assert u.dim == 3 and v.dim == 3, "u and v must be in 3-dimensions"
+    if bk.use_numpy(u.dim):
+        return Vector.from_sequence(bk.cross(u.components, v.components))
     return Vector(
         u.sub(2) * v.sub(3) - u.sub(3) * v.sub(2),
         -(u.sub(1) * v.sub(3) - u.sub(3) * v.sub(1)),
@@ -199,15 +347,169 @@ def cross_product(u: Vector, v: Vector) -> Vector:
 
 
 def extend_zeros(v: Vector, n: int):
-    v.components += [0] * n
+    v.components.extend([0] * n)
     v.dim = len(v.components)
 
 
+"""------------------------BATCH STUFF------------------------"""
+
 
+def _flat(values):
+    # real values are packed into an array of doubles, complex ones are kept in a list
+    try:
+        return array('d', values)
+    except TypeError:
+        return list(values)
 
 
+class VectorBatch:
+    __slots__ = ('data', 'count', 'dim', 'field')
 
+    def __init__(self, *args: Vector):
+        assert len(args) > 0, "Empty list of vectors"
+        for v in args:
+            assert v.dim == args[0].dim, "Vectors of different dimensions"
+        self._load(len(args), args[0].dim, [x for v in args for x in v.components])
 
+    @classmethod
+    def from_buffer(cls, count: int, dim: int, data):
+        batch = cls.__new__(cls)
+        batch._load(count, dim, data)
+        return batch
 
+    def _load(self, count: int, dim: int, data):
+        assert count > 0 and dim > 0, "Empty batch"
+        self.data = _flat(data)
+        assert len(self.data) == count * dim, "data doesn't hold count * dim values"
+        self.count = count
+        self.dim = dim
+        if isinstance(self.data, list) and any(isinstance(x, complex) for x in self.data):
+            self.field = 'complex'
+        else:
+            self.field = 'real'
 
+    def __len__(self):
+        return self.count
 
+    def __repr__(self):
+        return '[\n' + ''.join(f'\t{self.vector(k)}\n' for k in range(1, self.count + 1)) + ']'
+
+    def copy(self):
+        return VectorBatch.from_buffer(self.count, self.dim, self.data[:])
+
+    def vector(self, k: int) -> Vector:
+        assert 1 <= k <= self.count, "Invalid vector request"
+        return Vector.from_sequence(self.data[(k - 1) * self.dim:k * self.dim])
+
+
+def _operand(a: VectorBatch, b):
+    # produces the flat data of b, where a single Vector is repeated for every vector of a
+    if isinstance(b, Vector):
+        assert b.dim == a.dim, "Vectors of different dimensions"
+        c = b.components
+        if not isinstance(c, (array, list)):
+            # the components of a VectorView are a window onto the storage of its parent
+            c = array('d', c) if isinstance(c, memoryview) else list(c)
+        return c * a.count
+    assert b.count == a.count, "Batches of different sizes"
+    assert b.dim == a.dim, "Vectors of different dimensions"
+    return b.data
+
+
+def _row_sums(values, count: int, dim: int) -> List:
+    # sums each run of dim values, one strided pass per coordinate
+    sums = values[0::dim]
+    for i in range(1, dim):
+        sums = list(map(_add, sums, values[i::dim]))
+    return list(sums)
+
+
+def _row_scale(a: VectorBatch, scalars) -> VectorBatch:
+    # scales the kth vector of a by scalars[k]
+    if bk.use_numpy(a.count * a.dim):
+        return VectorBatch.from_buffer(a.count, a.dim, bk.row_scale(a.data, scalars, a.count, a.dim))
+    result = list(a.data)
+    for i in range(a.dim):
+        result[i::a.dim] = list(map(_mul, a.data[i::a.dim], scalars))
+    return VectorBatch.from_buffer(a.count, a.dim, result)
+
+
+def batch_dot(a: VectorBatch, b):
+    data = _operand(a, b)
+    if bk.use_numpy(a.count * a.dim):
+        return _flat(bk.row_dot(a.data, data, a.count, a.dim))
+    return _flat(_row_sums(list(map(_mul, a.data, data)), a.count, a.dim))
+
+
+def _batch_inner(a: VectorBatch, b):
+    data = _operand(a, b)
+    if a.field == 'complex' or (isinstance(data, list) and any(isinstance(x, complex) for x in data)):
+        data = [conj(complex(z)) for z in data]
+    return batch_dot(a, VectorBatch.from_buffer(a.count, a.dim, data))
+
+
+def batch_norm(a: VectorBatch):
+    if a.field == 'complex':
+        return _flat([sqrt(z.real) for z in _batch_inner(a, a)])
+    return _flat([sqrt(x) for x in batch_dot(a, a)])
+
+
+def batch_normalize(a: VectorBatch) -> VectorBatch:
+    return _row_scale(a, [1 / x for x in batch_norm(a)])
+
+
+def batch_add(a: VectorBatch, b, *args) -> VectorBatch:
+    operands = [_operand(a, b)] + [_operand(a, c) for c in args]
+    if bk.use_numpy(a.count * a.dim):
+        return VectorBatch.from_buffer(a.count, a.dim, bk.add(a.data, *operands))
+    total = a.data
+    for data in operands:
+        total = list(map(_add, total, data))
+    return VectorBatch.from_buffer(a.count, a.dim, total)
+
+
+def batch_scalar_multiply(a: VectorBatch, s) -> VectorBatch:
+    if isinstance(s, (int, float, complex)):
+        if isinstance(s, complex):
+            assert a.field == 'complex', "Can't multiply a real vector by a complex number"
+        return VectorBatch.from_buffer(a.count, a.dim, [x * s for x in a.data])
+    assert len(s) == a.count, "Need one scalar per vector"
+    return _row_scale(a, s)
+
+
+def batch_proj(a: VectorBatch, b) -> VectorBatch:
+    if isinstance(b, Vector):
+        b = VectorBatch.from_buffer(a.count, a.dim, _operand(a, b))
+    if a.field == 'real' and b.field == 'real':
+        scalars = [x / y for x, y in zip(batch_dot(a, b), batch_dot(b, b))]
+    else:
+        assert a.field == 'complex' and b.field == 'complex', "Cannot project complex and real vectors"
+        scalars = [x / y.real for x, y in zip(_batch_inner(a, b), _batch_inner(b, b))]
+    return _row_scale(b, scalars)
+
+
+def batch_perp(a: VectorBatch, b) -> VectorBatch:
+    return batch_add(a, batch_scalar_multiply(batch_proj(a, b), -1))
+
+
+def batch_cross_product(a: VectorBatch, b) -> VectorBatch:
+    assert a.dim == 3, "Vectors must be in 3-dimensions"
+    data = _operand(a, b)
+    assert a.field == 'real' and not isinstance(data, list), "Vectors must be real"
+    if bk.use_numpy(a.count * a.dim):
+        return VectorBatch.from_buffer(a.count, 3, bk.row_cross(a.data, data, a.count))
+    ax, ay, az = a.data[0::3], a.data[1::3], a.data[2::3]
+    bx, by, bz = data[0::3], data[1::3], data[2::3]
+    result = array('d', bytes(8 * 3 * a.count))
+    result[0::3] = array('d', [y1 * z2 - z1 * y2 for y1, z1, y2, z2 in zip(ay, az, by, bz)])
+    result[1::3] = array('d', [z1 * x2 - x1 * z2 for x1, z1, x2, z2 in zip(ax, az, bx, bz)])
+    result[2::3] = array('d', [x1 * y2 - y1 * x2 for x1, y1, x2, y2 in zip(ax, ay, bx, by)])
+    return VectorBatch.from_buffer(a.count, 3, result)
+
+
+def batch_angle(a: VectorBatch, b):
+    b_norms = batch_norm(b) if isinstance(b, VectorBatch) else [norm(b)] * a.count
+    return _flat([
+        acos(max(-1, min(1, dot / (x * y))))
+        for dot, x, y in zip(batch_dot(a, b), batch_norm(a), b_norms)
+    ])
@@ -0,0 +1,203 @@
+"""
+Benchmarks for the hot paths of the api package
+
+usage:
+    python -m benchmarks.run [--sizes N ...] [--cases NAME ...] [--repeat R] [--output FILE]
+    python -m benchmarks.run compare OLD.json NEW.json [--threshold T]
+
+Each case is timed at each size n (best wall time over R runs), then run once more under
+tracemalloc to record its peak traced memory, and the number and size of the memory
+blocks which are still allocated once it returns (i.e., held by its result). Results
+are written as JSON. compare flags every case whose time, allocated blocks or peak memory
+grew by more than the threshold (a fraction, 0.1 = 10%) and exits with status 1 if there are any
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from api import equation as eq
+from api import matrix as mx
+from api import vector as vc
+
+
+def _grid(m: int, n: int):
+    return [[random.uniform(-1, 1) for j in range(n)] for i in range(m)]
+
+
+def _vector(n: int) -> vc.Vector:
+    return vc.Vector(*[random.uniform(-1, 1) for i in range(n)])
+
+
+def dot_product(n: int):
+    v, w = _vector(n), _vector(n)
+    return lambda: vc.dot_product(v, w)
+
+
+def add_varargs(n: int):
+    # n vectors of a fixed, small dimension
+    vectors = [_vector(16) for i in range(n)]
+    return lambda: vc.add(*vectors)
+
+
+def to_rref(n: int):
+    A = mx.create_matrix(_grid(n, n))
+    return lambda: mx.to_rref(A.copy())
+
+
+def rank(n: int):
+    # results are cached on a Matrix, so each run works on a copy, or it would time a cache hit
+    A = mx.create_matrix(_grid(n, n))
+    return lambda: mx.rank(A.copy())
+
+
+def matrix_matrix_product(n: int):
+    A, B = mx.create_matrix(_grid(n, n)), mx.create_matrix(_grid(n, n))
+    return lambda: mx.matrix_matrix_product(A, B)
+
+
+def matrix_transpose(n: int):
+    # the packed entries of the transpose are cached on A, so each run marks A as modified
+    # and reads the entries of a new transpose
+    A = mx.create_matrix(_grid(n, n))
+
+    def run():
+        A._touch()
+        return mx.matrix_transpose(A).data
+    return run
+
+
+def create_matrix(n: int):
+    grid = _grid(n, n)
+    return lambda: mx.create_matrix(grid)
+
+
+def linear_system_copy(n: int):
+    ls = eq.LinearSystem(*[eq.LinearEquation(row, 1) for row in _grid(n, n)])
+    return lambda: ls.copy()
+
+
+def super_augmented_rref(n: int):
+    # an n*n coefficient matrix, reduced against 8 right-hand-sides
+    lhs, rhs = mx.create_matrix(_grid(n, n)), mx.create_matrix(_grid(n, 8))
+    return lambda: mx.to_rref(mx.SuperAugmentedMatrix(lhs.copy(), rhs.copy()))
+
+
+# name: (setup, default sizes), setup(n) produces the function to be measured
+CASES = {
+    'vector.dot_product': (dot_product, [10, 100, 1000]),
+    'vector.add': (add_varargs, [10, 100, 1000]),
+    'matrix.to_rref': (to_rref, [10, 50, 100]),
+    'matrix.rank': (rank, [10, 50, 100]),
+    'matrix.matrix_matrix_product': (matrix_matrix_product, [10, 50, 100]),
+    'matrix.matrix_transpose': (matrix_transpose, [10, 100, 500]),
+    'matrix.create_matrix': (create_matrix, [10, 100, 500]),
+    'equation.LinearSystem.copy': (linear_system_copy, [10, 100, 500]),
+    'matrix.SuperAugmentedMatrix.to_rref': (super_augmented_rref, [10, 50, 100]),
+}
+
+
+def measure(fn, repeat: int) -> dict:
+    best = float('inf')
+    for i in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    result = fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del result
+    diff = after.compare_to(before, 'lineno')
+    return {
+        'time': best,
+        'allocations': sum(max(stat.count_diff, 0) for stat in diff),
+        'allocated': sum(max(stat.size_diff, 0) for stat in diff),
+        'peak': peak,
+    }
+
+
+def run(names, sizes, repeat: int, seed: int = 0) -> dict:
+    results = []
+    for name in names:
+        setup, default_sizes = CASES[name]
+        for n in sizes or default_sizes:
+            random.seed(seed)
+            result = measure(setup(n), repeat)
+            result.update({'name': name, 'n': n})
+            results.append(result)
+            print(f'{name:<40} n={n:<6} {result["time"] * 1000:>10.3f} ms'
+                  f' {result["allocations"]:>10} blocks {result["peak"] / 1024:>10.1f} KiB',
+                  file=sys.stderr)
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'date': datetime.now(timezone.utc).isoformat(),
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def compare(old: dict, new: dict, threshold: float) -> list:
+    # produces the regressions, as (name, n, metric, old value, new value)
+    baseline = {(r['name'], r['n']): r for r in old['results']}
+    regressions = []
+    for r in new['results']:
+        key = (r['name'], r['n'])
+        if key not in baseline:
+            continue
+        for metric in ('time', 'allocations', 'peak'):
+            before, after = baseline[key][metric], r[metric]
+            if before > 0 and after > before * (1 + threshold):
+                regressions.append((r['name'], r['n'], metric, before, after))
+    return regressions
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ['compare']:
+        parser = argparse.ArgumentParser(prog='benchmarks.run compare')
+        parser.add_argument('old')
+        parser.add_argument('new')
+        parser.add_argument('--threshold', type=float, default=0.1)
+        args = parser.parse_args(argv[1:])
+        with open(args.old) as f:
+            old = json.load(f)
+        with open(args.new) as f:
+            new = json.load(f)
+        regressions = compare(old, new, args.threshold)
+        for name, n, metric, before, after in regressions:
+            print(f'REGRESSION {name} n={n} {metric}: {before:.6g} -> {after:.6g}'
+                  f' (+{(after / before - 1) * 100:.1f}%)')
+        if not regressions:
+            print('no regressions')
+        return 1 if regressions else 0
+
+    parser = argparse.ArgumentParser(prog='benchmarks.run')
+    parser.add_argument('--sizes', type=int, nargs='+')
+    parser.add_argument('--cases', nargs='+', choices=sorted(CASES), default=list(CASES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', '-o')
+    args = parser.parse_args(argv)
+    report = run(args.cases, args.sizes, args.repeat, args.seed)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
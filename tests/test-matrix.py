@@ -1,4 +1,6 @@
 import unittest
+from array import array
+from fractions import Fraction
 
 from api import equation as eq
 from api import vector as vc
@@ -46,6 +48,25 @@ class TestMatrix(unittest.TestCase):
         mx.to_rref(A)
         self.assertFalse(mx.is_consistent(A))
 
+    def test_rank(self):
+        A = mx.create_matrix([
+            [0, 2, 4],
+            [0, 1, 2],
+            [0, 3, 7]
+        ])
+        self.assertEqual(mx.rank(A), 2)
+        self.assertEqual(mx.nullity(A), 1)
+        mx.to_rref(A)
+        self.assertTrue(mx.matrix_equal(A, mx.create_matrix([
+            [0, 1, 0],
+            [0, 0, 1],
+            [0, 0, 0]
+        ])))
+        A = mx.create_matrix([[1], [0], [0]])
+        A.augment_with(vc.Vector(1, 0, 2))
+        self.assertEqual(mx.rank(A), 2)
+        self.assertFalse(mx.is_consistent(A))
+
     def test_super_matrix(self):
         a_grid = [
             [1, -2, -1, 3],
@@ -62,7 +83,113 @@ class TestMatrix(unittest.TestCase):
             mx.create_matrix(b_grid)
         )
         mx.to_rref(sam)
-        # print(sam)
+        self.assertTrue(mx.matrix_equal(sam.lhs, mx.create_matrix([
+            [1, -2, 0, 1],
+            [0, 0, 1, -2],
+            [0, 0, 0, 0]
+        ])))
+        self.assertTrue(vc.is_equal(sam.rhs.col(1), vc.Vector(2, 1, 0)))
+
+    def test_lu_factor(self):
+        A = mx.create_matrix([
+            [2, 1, 1],
+            [4, -6, 0],
+            [-2, 7, 2]
+        ])
+        F = mx.lu_factor(A)
+        self.assertEqual(F.rank, 3)
+        self.assertEqual(F.pivots, [1, 2, 3])
+        x = F.solve(vc.Vector(5, -2, 9))
+        self.assertTrue(vc.is_equal(x, vc.Vector(1, 1, 2)))
+        X = F.solve_many(mx.create_matrix([
+            [5, 2],
+            [-2, 4],
+            [9, -2]
+        ]))
+        self.assertTrue(vc.is_equal(X.col(1), vc.Vector(1, 1, 2)))
+        self.assertTrue(vc.is_equal(X.col(2), vc.Vector(1, 0, 0)))
+        F = mx.lu_factor(mx.create_matrix([
+            [1, 2],
+            [2, 4]
+        ]))
+        self.assertEqual(F.rank, 1)
+        self.assertTrue(vc.is_equal(F.solve(vc.Vector(3, 6)), vc.Vector(3, 0)))
+
+    def test_qr(self):
+        A = mx.create_matrix([
+            [1, 0],
+            [1, 1],
+            [1, 2]
+        ])
+        Q, R = mx.qr(A)
+        self.assertEqual((Q.m, Q.n, R.m, R.n), (3, 3, 3, 2))
+        self.assertTrue(mx.matrix_equal(mx.matrix_matrix_product(Q, R), A))
+        self.assertTrue(mx.matrix_equal(mx.matrix_matrix_product(mx.matrix_transpose(Q), Q), mx.identity(3)))
+        self.assertEqual(R.sub(2, 1), 0)
+        self.assertEqual(R.sub(3, 2), 0)
+        Q, R = mx.qr(A, economy=True)
+        self.assertEqual((Q.m, Q.n, R.m, R.n), (3, 2, 2, 2))
+        self.assertTrue(mx.matrix_equal(mx.matrix_matrix_product(Q, R), A))
+        C = mx.create_matrix([
+            [1j, 2],
+            [1, -1j]
+        ])
+        Q, R = mx.qr(C)
+        self.assertTrue(mx.matrix_equal(mx.matrix_matrix_product(Q, R), C))
+
+    def test_lstsq(self):
+        A = mx.create_matrix([
+            [1, 0],
+            [1, 1],
+            [1, 2]
+        ])
+        self.assertTrue(vc.is_equal(mx.lstsq(A, vc.Vector(6, 0, 0)), vc.Vector(5, -3)))
+        X = mx.lstsq(A, mx.create_matrix([
+            [6, 1],
+            [0, 2],
+            [0, 3]
+        ]))
+        self.assertTrue(vc.is_equal(X.col(1), vc.Vector(5, -3)))
+        self.assertTrue(vc.is_equal(X.col(2), vc.Vector(1, 1)))
+        self.assertRaises(AssertionError, mx.lstsq, mx.create_matrix([[1, 2], [2, 4], [3, 6]]), vc.Vector(1, 2, 3))
+
+    def test_determinant_inverse(self):
+        A = mx.create_matrix([
+            [0, 2, 1],
+            [1, 1, 0],
+            [3, 0, 4]
+        ])
+        self.assertAlmostEqual(mx.determinant(A), -11)
+        inv = mx.inverse(A)
+        self.assertTrue(mx.matrix_equal(mx.matrix_matrix_product(A, inv), mx.identity(3)))
+        self.assertIs(mx.inverse(A), inv)
+        self.assertAlmostEqual(mx.condition_number(mx.identity(4)), 1)
+        self.assertGreater(mx.condition_number(A), 1)
+        # modifying A invalidates the cached results
+        A.set(1, 1, 1)
+        self.assertAlmostEqual(mx.determinant(A), -7)
+        self.assertIsNot(mx.inverse(A), inv)
+        B = mx.create_matrix([
+            [1, 2],
+            [2, 4]
+        ])
+        self.assertEqual(mx.determinant(B), 0)
+        self.assertEqual(mx.condition_number(B), float('inf'))
+        with self.assertRaises(AssertionError):
+            mx.inverse(B)
+        # a small scale doesn't make a matrix singular
+        C = mx.matrix_scalar_product(mx.identity(3), 1e-5)
+        self.assertAlmostEqual(mx.determinant(C) / 1e-15, 1)
+        self.assertEqual(mx.rank(C), 3)
+        self.assertTrue(mx.matrix_equal(mx.inverse(C), mx.matrix_scalar_product(mx.identity(3), 1e5)))
+        self.assertAlmostEqual(mx.condition_number(C), 1)
+        D = C.copy()
+        mx.to_rref(D)
+        self.assertTrue(mx.matrix_equal(D, mx.identity(3)))
+        E = mx.matrix_scalar_product(B, 1e-5)
+        E.augment_with(vc.Vector(1e-5, 1e-5))
+        self.assertFalse(mx.is_consistent(E))
+        self.assertEqual(mx.rank(mx.matrix_scalar_product(B, 1e-5)), 1)
 
     def test_complex_example(self):
         grid = [
@@ -135,11 +262,328 @@ class TestMatrix(unittest.TestCase):
         ])
         C = mx.matrix_matrix_product(A, B)
         self.assertTrue(mx.matrix_equal(C, ans))
+        # Test 3, blocks which don't divide the dimensions
+        tile = mx.TILE_SIZE
+        mx.TILE_SIZE = 2
+        A = mx.create_matrix([[i + 2 * j for j in range(5)] for i in range(3)])
+        B = mx.create_matrix([[i - j for j in range(3)] for i in range(5)])
+        C = mx.matrix_matrix_product(A, B)
+        mx.TILE_SIZE = tile
+        ans = mx.create_matrix([[
+            sum((i + 2 * k) * (k - j) for k in range(5)) for j in range(3)
+        ] for i in range(3)])
+        self.assertTrue(mx.matrix_equal(C, ans))
+        # Test 4, identity and zero operands
+        self.assertTrue(mx.matrix_equal(mx.matrix_matrix_product(mx.identity(3), A), A))
+        self.assertTrue(mx.matrix_equal(mx.matrix_matrix_product(A, mx.identity(5)), A))
+        self.assertTrue(mx.matrix_equal(
+            mx.matrix_matrix_product(mx.zero_matrix(2, 3), A),
+            mx.zero_matrix(2, 5)
+        ))
+
+
+    def test_storage(self):
+        A = mx.create_matrix([
+            [1, 2, 3],
+            [4, 5, 6]
+        ])
+        self.assertEqual(len(A.data), 6)
+        self.assertEqual(A.stride, 3)
+        A.set(2, 3, 10)
+        self.assertEqual(A.sub(2, 3), 10)
+        self.assertTrue(vc.is_equal(A.row(2), vc.Vector(4, 5, 10)))
+        self.assertTrue(vc.is_equal(A.col(2), vc.Vector(2, 5)))
+        B = A.copy()
+        B.set(1, 1, complex(0, 1))
+        self.assertEqual(A.sub(1, 1), 1)
+        self.assertEqual(B.sub(1, 1), complex(0, 1))
+        self.assertTrue(eq.systems_are_identical(
+            A.ls,
+            eq.LinearSystem(
+                eq.LinearEquation([1, 2, 3], 0),
+                eq.LinearEquation([4, 5, 10], 0)
+            )
+        ))
+        # ls is read-only and built once per change of A, a modified copy is assigned back
+        self.assertIs(A.ls, A.ls)
+        for ero in (eq.ERO(1, [1, 2]), eq.ERO(2, [1, 2]), eq.ERO(2, [1, 1j]), eq.ERO(3, [1, 2, 1])):
+            with self.assertRaises((TypeError, AttributeError)):
+                eq.apply_ero(A.ls, ero)
+        with self.assertRaises(TypeError):
+            A.ls.e[1].a.components[0] = 99
+        with self.assertRaises(AttributeError):
+            A.ls.e[1].rhs = 1
+        with self.assertRaises(TypeError):
+            A.ls.e[1].a += vc.Vector(1, 1, 1)
+        self.assertEqual(A.sub(1, 1), 1)
+        ls = A.ls.copy()
+        ls.e[1].a.components[0] = 99
+        eq.apply_ero(ls, eq.ERO(1, [1, 2]))
+        A.ls = ls
+        self.assertEqual(A.sub(2, 1), 99)
+        self.assertEqual(A.ls.e[2].a.sub(1), 99)
+        self.assertEqual(A.ls.e[1].a.copy().components[0], 4)
+        # entries too large for a double are kept as they are
+        C = mx.create_matrix([[10 ** 400, 1]])
+        self.assertEqual(C.sub(1, 1), 10 ** 400)
+        self.assertEqual(list(mx._buffer(x for x in [1, 2j])), [1, 2j])
+
+    def test_exact(self):
+        # within TOLERANCE of singular, but not singular
+        A = mx.create_matrix([
+            [1, 1],
+            [1, 1.00001]
+        ])
+        self.assertEqual(mx.rank(A), 1)
+        self.assertEqual(mx.rank(A, exact=True), 2)
+        self.assertEqual(mx.nullity(A, exact=True), 0)
+        B = mx.create_matrix([
+            [1, 2, 3],
+            [4, 5, 6],
+            [7, 8, 10]
+        ])
+        self.assertEqual(mx.determinant(B, exact=True), -3)
+        self.assertEqual(mx.determinant(mx.create_matrix([[0.5, 1], [1, 3]]), exact=True), Fraction(1, 2))
+        B.set(3, 3, 9)
+        self.assertEqual(mx.determinant(B, exact=True), 0)
+        B.augment_with(vc.Vector(1, 2, 4))
+        self.assertEqual(mx.rank(B, exact=True), 3)
+        self.assertFalse(mx.is_consistent(B, exact=True))
+        B.aug_set(3, 3)
+        self.assertTrue(mx.is_consistent(B, exact=True))
+        C = mx.create_matrix([
+            [2, 1],
+            [1, 3]
+        ])
+        C.augment_with(vc.Vector(1, 0))
+        mx.to_rref(C, exact=True)
+        self.assertEqual(list(C.data), [1, 0, 0, 1])
+        self.assertEqual(C.b, [Fraction(3, 5), Fraction(-1, 5)])
+        # Fractions and ints beyond 2**53 are stored as they are, not rounded to doubles
+        third = Fraction(1, 3)
+        D = mx.create_matrix([
+            [third, third],
+            [third, third + Fraction(1, 10 ** 20)]
+        ])
+        self.assertEqual(D.sub(2, 2), third + Fraction(1, 10 ** 20))
+        self.assertEqual(mx.rank(D, exact=True), 2)
+        self.assertEqual(mx.determinant(D, exact=True), Fraction(1, 3 * 10 ** 20))
+        E = mx.create_matrix([
+            [2 ** 60 + 1, 2 ** 60],
+            [2 ** 60, 2 ** 60 - 1]
+        ])
+        self.assertEqual(mx.rank(E, exact=True), 2)
+        self.assertEqual(mx.determinant(E, exact=True), -1)
+        E.set(1, 1, 2 ** 60)
+        self.assertEqual(E.sub(1, 1), 2 ** 60)
+        self.assertEqual(mx.determinant(E, exact=True), -(2 ** 60))
+        self.assertEqual(vc.Vector(third, 1).components, [third, 1])
+
+    def test_cache(self):
+        A = mx.create_matrix([
+            [1, 2, 3],
+            [2, 4, 6],
+            [1, 0, 1]
+        ])
+        self.assertEqual(mx.rank(A), 2)
+        self.assertEqual(mx.pivot_columns(A), [1, 2])
+        F = mx.lu_factor(A)
+        R = mx.rref(A)
+        self.assertIs(mx.lu_factor(A), F)
+        self.assertIs(mx.rref(A), R)
+        T = mx.matrix_transpose(A)
+        self.assertIsNot(mx.matrix_transpose(A), T)
+        self.assertIs(mx.matrix_transpose(A).data, T.data)
+        T.augment_with(vc.Vector(1, 2, 3))
+        self.assertFalse(mx.matrix_transpose(A).augmented)
+        self.assertTrue(mx.matrix_equal(R, mx.create_matrix([[1, 0, 1], [0, 1, 1], [0, 0, 0]])))
+        self.assertEqual(A.sub(1, 1), 1)
+        R.set(1, 1, 5)
+        self.assertEqual(mx.rref(A).sub(1, 1), 1)
+        A.set(2, 3, 7)
+        self.assertEqual(mx.rank(A), 3)
+        self.assertEqual(mx.nullity(A), 0)
+        self.assertIsNot(mx.lu_factor(A), F)
+        d = mx.determinant(A)
+        mx.apply_ero(A, eq.ERO(2, [1, 2]))
+        self.assertAlmostEqual(mx.determinant(A), 2 * d)
+        A.augment_with(vc.Vector(1, 2, 3))
+        self.assertTrue(mx.is_consistent(A))
+
+    def test_views(self):
+        A = mx.create_matrix([
+            [1, 2, 3],
+            [4, 5, 6],
+            [7, 8, 9]
+        ])
+        r, c = A.row(2), A.col(3)
+        A.set(2, 3, 10)
+        self.assertTrue(vc.is_equal(r, vc.Vector(4, 5, 10)))
+        self.assertTrue(vc.is_equal(c, vc.Vector(3, 10, 9)))
+        c.set(1, 0)
+        self.assertEqual(A.sub(1, 3), 0)
+        v = r.copy()
+        A.set(2, 1, -4)
+        self.assertTrue(vc.is_equal(v, vc.Vector(4, 5, 10)))
+        T = mx.matrix_transpose(A)
+        self.assertTrue(vc.is_equal(T.row(3), vc.Vector(0, 10, 9)))
+        T.set(1, 3, 70)
+        self.assertEqual(A.sub(3, 1), 70)
+        self.assertTrue(mx.matrix_equal(mx.matrix_transpose(T), A))
+        S = mx.submatrix(A, 2, 3, 2, 3)
+        self.assertEqual((S.m, S.n), (2, 2))
+        self.assertTrue(mx.matrix_equal(S, mx.create_matrix([[5, 10], [8, 9]])))
+        self.assertEqual(mx.determinant(S), -35)
+        A.set(3, 3, 20)
+        self.assertEqual(mx.determinant(S), 20)
+        self.assertTrue(mx.matrix_equal(mx.matrix_add(S, mx.matrix_transpose(S)),
+                                        mx.create_matrix([[10, 18], [18, 40]])))
+        mx.to_rref(S)
+        self.assertTrue(mx.matrix_equal(A, mx.create_matrix([[1, 2, 0], [-4, 1, 0], [70, 0, 1]])))
+        C = S.copy()
+        C.set(1, 1, 3)
+        self.assertEqual(A.sub(2, 2), 1)
+        S.set(1, 2, 1j)
+        self.assertEqual(A.sub(2, 3), 1j)
+        self.assertEqual(r.field, 'complex')
+        # the components of a view are read-only, so cached results can't go stale
+        B = mx.create_matrix([[1, 2], [2, 4]])
+        self.assertEqual(mx.rank(B), 1)
+        for M in (B, A):
+            for view in (M.row(2), M.col(1)):
+                with self.assertRaises(TypeError):
+                    view.components[1] = 5
+        self.assertEqual(B.sub(2, 2), 4)
+        row = B.row(2)
+        row += vc.Vector(0, 1)
+        self.assertEqual(mx.rank(B), 2)
+        self.assertEqual(mx.determinant(B), 1)
+
+    def test_sparse(self):
+        S = mx.SparseMatrix(3, 4, [(1, 1, 2), (3, 4, -1), (2, 2, 5), (3, 4, 4), (1, 3, 0)])
+        self.assertEqual(S.nnz, 3)
+        self.assertEqual(S.sub(3, 4), 3)
+        self.assertEqual(S.sub(1, 3), 0)
+        self.assertTrue(vc.is_equal(S.row(3), vc.Vector(0, 0, 0, 3)))
+        self.assertTrue(vc.is_equal(S.col(2), vc.Vector(0, 5, 0)))
+        A = mx.create_matrix([
+            [2, 0, 0, 0],
+            [0, 5, 0, 0],
+            [0, 0, 0, 3]
+        ])
+        self.assertTrue(mx.matrix_equal(mx.sparse_to_matrix(S), A))
+        self.assertTrue(mx.matrix_equal(mx.matrix_to_sparse(A), S))
+        x = vc.Vector(1, 2, 3, 4)
+        self.assertTrue(vc.is_equal(mx.matrix_vector_product(S, x), vc.Vector(2, 10, 12)))
+        T = mx.matrix_transpose(S)
+        self.assertIsInstance(T, mx.SparseMatrix)
+        self.assertTrue(mx.matrix_equal(T, mx.matrix_transpose(A)))
+        self.assertIsInstance(mx.matrix_matrix_product(S, T), mx.SparseMatrix)
+        for B, C in ((S, T), (A, T), (S, mx.matrix_transpose(A))):
+            self.assertTrue(mx.matrix_equal(
+                mx.matrix_matrix_product(B, C),
+                mx.matrix_matrix_product(A, mx.matrix_transpose(A))
+            ))
+        self.assertEqual(mx.matrix_subtract(S, S).nnz, 0)
+        self.assertTrue(mx.matrix_equal(mx.matrix_add(S, A), mx.matrix_scalar_product(A, 2)))
+        self.assertTrue(mx.matrix_equal(mx.matrix_add(S, S), mx.matrix_scalar_product(A, 2)))
+
+    def test_sparse_functions(self):
+        grid = [
+            [2, 0, 1],
+            [0, 3, 0],
+            [1, 0, 4]
+        ]
+        A = mx.create_matrix(grid)
+        S = mx.matrix_to_sparse(A)
+        self.assertEqual(mx.rank(S), 3)
+        self.assertEqual(mx.rank(S, exact=True), 3)
+        self.assertTrue(mx.is_consistent(S))
+        self.assertEqual(mx.nullity(S), 0)
+        self.assertAlmostEqual(mx.determinant(S), 21)
+        self.assertEqual(mx.determinant(S, exact=True), 21)
+        self.assertTrue(mx.matrix_equal(mx.inverse(S), mx.inverse(A)))
+        self.assertAlmostEqual(mx.condition_number(S), mx.condition_number(A))
+        b = vc.Vector(1, 2, 3)
+        self.assertTrue(vc.is_equal(mx.lstsq(S, b), mx.lstsq(A, b)))
+        H = mx.homogeneous(S)
+        self.assertTrue(H.augmented)
+        self.assertTrue(mx.matrix_equal(H, mx.homogeneous(A)))
+        mx.to_rref(S)
+        self.assertIsInstance(S, mx.SparseMatrix)
+        self.assertEqual(S.nnz, 3)
+        self.assertTrue(mx.matrix_equal(S, mx.identity(3)))
+        # the results cached before to_rref are dropped
+        self.assertEqual(mx.determinant(S), 1)
+
+    def test_operators(self):
+        A = mx.create_matrix([[1, 2], [3, 4]])
+        B = mx.create_matrix([[0, 1], [1, 0]])
+        self.assertTrue(mx.matrix_equal(A + B, mx.matrix_add(A, B)))
+        self.assertTrue(mx.matrix_equal(A - B, mx.matrix_subtract(A, B)))
+        self.assertTrue(mx.matrix_equal(2 * A, -(-A * 2)))
+        self.assertTrue(mx.matrix_equal(A @ B, mx.matrix_matrix_product(A, B)))
+        self.assertTrue(vc.is_equal(A @ vc.Vector(1, 1), vc.Vector(3, 7)))
+        S = mx.matrix_to_sparse(B)
+        self.assertTrue(mx.matrix_equal(S + A, A + B))
+        self.assertTrue(mx.matrix_equal(S @ A, B @ A))
+        data = A.data
+        d = mx.determinant(A)
+        A += B
+        A -= S
+        A *= 2
+        self.assertIs(A.data, data)
+        self.assertAlmostEqual(mx.determinant(A), 4 * d)
+        T = mx.matrix_transpose(A)
+        T -= B
+        self.assertTrue(mx.matrix_equal(A, mx.create_matrix([[2, 3], [5, 8]])))
+        r = A.row(2)
+        r += vc.Vector(1, 1)
+        self.assertEqual(A.sub(2, 1), 6)
+        A *= 1j
+        self.assertEqual(A.sub(1, 2), 3j)
+
+    def test_in_place_aliasing(self):
+        # the operand is a view of the target itself
+        A = mx.create_matrix([[1, 2], [3, 4]])
+        A += mx.matrix_transpose(A)
+        self.assertTrue(mx.matrix_equal(A, mx.create_matrix([[2, 5], [5, 8]])))
+        C = mx.create_matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        C -= mx.matrix_transpose(C)
+        self.assertTrue(mx.matrix_equal(C, mx.create_matrix([[0, -2, -4], [2, 0, -2], [4, 2, 0]])))
+        S = mx.submatrix(C, 1, 2, 1, 2)
+        S += mx.submatrix(C, 2, 3, 2, 3)
+        self.assertTrue(mx.matrix_equal(S, mx.create_matrix([[0, -4], [4, 0]])))
+        A += A
+        self.assertTrue(mx.matrix_equal(A, mx.create_matrix([[4, 10], [10, 16]])))
 
+    def test_bulk_constructors(self):
+        A = mx.Matrix.from_rows([[1, 2, 3], vc.Vector(4, 5)])
+        self.assertTrue(mx.matrix_equal(A, mx.create_matrix([[1, 2, 3], [4, 5, 0]])))
+        self.assertEqual((A.m, A.n), (2, 3))
+        C = mx.Matrix.from_columns([vc.Vector(1, 4), [2, 5], vc.Vector(3, 0)])
+        self.assertTrue(mx.matrix_equal(C, A))
+        data = array('d', [1, 2, 3, 4, 5, 0])
+        B = mx.Matrix.from_buffer(2, 3, data, b=[7, 8])
+        self.assertIs(B.data, data)
+        self.assertTrue(B.augmented)
+        self.assertEqual(B.aug(2), 8)
+        self.assertTrue(mx.matrix_equal(mx.Matrix.from_buffer(2, 3, [1, 2, 3, 4, 5, 0]), A))
+        self.assertEqual(mx.Matrix.from_rows([[1j, 2], [3, 4]]).sub(1, 1), 1j)
+        self.assertTrue(mx.matrix_equal(mx.identity(3), mx.create_matrix([[1, 0, 0], [0, 1, 0], [0, 0, 1]])))
+        self.assertTrue(mx.matrix_equal(mx.zero_matrix(2, 3), mx.create_matrix([[0, 0, 0], [0, 0, 0]])))
+        ls = eq.LinearSystem.from_rows([[1, 2], [3]], [5, 6])
+        self.assertEqual((ls.m, ls.n), (2, 2))
+        self.assertTrue(eq.systems_are_identical(ls, eq.LinearSystem(eq.LinearEquation([1, 2], 5), eq.LinearEquation([3, 0], 6))))
+        self.assertTrue(eq.systems_are_identical(B.ls, mx.Matrix(B.ls).ls))
 
     def test_has_solution(self):
-        # print(mx.identity(10))
-        pass
+        A = mx.create_matrix([[1, 2], [2, 4], [0, 1]])
+        self.assertTrue(mx.has_solution(A, vc.Vector(3, 6, 1)))
+        self.assertFalse(mx.has_solution(A, vc.Vector(3, 5, 1)))
+        A.set(3, 2, 0)
+        self.assertFalse(mx.has_solution(A, vc.Vector(3, 6, 1)))
+        self.assertFalse(mx.has_solution(A, vc.Vector(1, 2)))
 
 
 if __name__ == '__main__':
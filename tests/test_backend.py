@@ -0,0 +1,52 @@
+import unittest
+
+from api import backend as bk
+from api import vector as vc
+from api import matrix as mx
+
+
+class TestBackend(unittest.TestCase):
+    def tearDown(self):
+        bk.set_backend('auto')
+
+    def test_set_backend(self):
+        bk.set_backend('python')
+        self.assertEqual(bk.get_backend(), 'python')
+        self.assertFalse(bk.use_numpy(10 ** 6))
+        with self.assertRaises(AssertionError):
+            bk.set_backend('fortran')
+        if bk.np is None:
+            self.assertNotIn('numpy', bk.available_backends())
+            with self.assertRaises(AssertionError):
+                bk.set_backend('numpy')
+
+    @unittest.skipUnless(bk.np is not None, "NumPy is not installed")
+    def test_backends_agree(self):
+        n = 20
+        v = vc.Vector(*[i - 7 for i in range(n)])
+        w = vc.Vector(*[(i * 3) % 5 for i in range(n)])
+        A = mx.create_matrix([[(i * j) % 7 - 3 for j in range(n)] for i in range(n)])
+        results = {}
+        for name in ('python', 'numpy'):
+            bk.set_backend(name)
+            results[name] = (
+                vc.add(v, w, v),
+                vc.scalar_multiply(v, 2.5),
+                vc.dot_product(v, w),
+                vc.norm(v),
+                mx.matrix_vector_product(A, v),
+                mx.matrix_matrix_product(A, A),
+                mx.matrix_transpose(A)
+            )
+        python, numpy = results['python'], results['numpy']
+        self.assertTrue(vc.is_equal(python[0], numpy[0]))
+        self.assertTrue(vc.is_equal(python[1], numpy[1]))
+        self.assertAlmostEqual(python[2], numpy[2])
+        self.assertAlmostEqual(python[3], numpy[3])
+        self.assertTrue(vc.is_equal(python[4], numpy[4]))
+        self.assertTrue(mx.matrix_equal(python[5], numpy[5]))
+        self.assertTrue(mx.matrix_equal(python[6], numpy[6]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+
+from api import vector as vc
+from api import matrix as mx
+from api import eigen as eg
+from api import structured as st
+
+
+class TestEigen(unittest.TestCase):
+    def assertEigenpairs(self, A, result):
+        for value, v in zip(result.values, result.vectors):
+            Av = mx.matrix_vector_product(A, v)
+            self.assertTrue(vc.is_equal(Av, vc.scalar_multiply(v, value)))
+
+    def test_power_iteration(self):
+        A = mx.create_matrix([
+            [2, 1],
+            [1, 3]
+        ])
+        result = eg.power_iteration(A)
+        self.assertTrue(result.converged)
+        self.assertAlmostEqual(result.values[0], (5 + 5 ** 0.5) / 2)
+        self.assertEigenpairs(A, result)
+        result = eg.power_iteration(A, max_iter=2)
+        self.assertFalse(result.converged)
+        self.assertEqual(result.iterations, 2)
+
+    def test_inverse_iteration(self):
+        A = mx.create_matrix([
+            [4, 1, 0],
+            [1, 3, 1],
+            [0, 1, 2]
+        ])
+        result = eg.inverse_iteration(A, 1)
+        self.assertTrue(result.converged)
+        self.assertAlmostEqual(result.values[0], 3 - 3 ** 0.5)
+        self.assertEigenpairs(A, result)
+        result = eg.inverse_iteration(mx.create_matrix([[2, 0], [0, 5]]), 5)
+        self.assertAlmostEqual(result.values[0], 5)
+
+    def test_eigenvalues(self):
+        result = eg.eigenvalues(mx.create_matrix([
+            [0, 0, 1],
+            [1, 0, 0],
+            [0, 1, 0]
+        ]))
+        self.assertTrue(result.converged)
+        self.assertIsNone(result.vectors)
+        expected = [complex(-0.5, -3 ** 0.5 / 2), complex(-0.5, 3 ** 0.5 / 2), 1]
+        for value, e in zip(result.values, expected):
+            self.assertAlmostEqual(value, e)
+        self.assertIsInstance(result.values[2], float)
+        result = eg.eigenvalues(mx.create_matrix([
+            [1, 2, 3],
+            [0, 4, 5],
+            [0, 0, 6]
+        ]))
+        for value, e in zip(result.values, [1, 4, 6]):
+            self.assertAlmostEqual(value, e)
+        result = eg.eigenvalues(mx.create_matrix([[1j, 1], [0, 2]]))
+        self.assertAlmostEqual(result.values[0], 1j)
+        self.assertAlmostEqual(result.values[1], 2)
+
+    def test_symmetric_eigen(self):
+        A = mx.create_matrix([
+            [2, -1, 0],
+            [-1, 2, -1],
+            [0, -1, 2]
+        ])
+        result = eg.symmetric_eigen(A)
+        self.assertTrue(result.converged)
+        for value, e in zip(result.values, [2 - 2 ** 0.5, 2, 2 + 2 ** 0.5]):
+            self.assertAlmostEqual(value, e)
+        self.assertEigenpairs(A, result)
+        H = mx.create_matrix([
+            [2, 1j],
+            [-1j, 2]
+        ])
+        self.assertTrue(eg.is_hermitian(H))
+        result = eg.symmetric_eigen(H)
+        self.assertEqual(len(result.vectors), 2)
+        for value, e in zip(result.values, [1, 3]):
+            self.assertAlmostEqual(value, e)
+        self.assertEigenpairs(H, result)
+        self.assertRaises(AssertionError, eg.symmetric_eigen, mx.create_matrix([[1, 2], [3, 4]]))
+
+    def test_inputs(self):
+        # a SparseMatrix, a view from an offset and a structured matrix give the eigenvalues of
+        # their entries
+        T = [[2, -1, 0], [-1, 2, -1], [0, -1, 2]]
+        expected = [2 - 2 ** 0.5, 2, 2 + 2 ** 0.5]
+        big = mx.create_matrix([[9, 9, 9, 9]] + [[9] + row for row in T])
+        view = mx.submatrix(big, 2, 4, 2, 4)
+        for A in (mx.matrix_to_sparse(mx.create_matrix(T)), view, st.SymmetricMatrix(T),
+                  st.BandedMatrix(T, 1, 1)):
+            self.assertTrue(eg.is_hermitian(A))
+            for result in (eg.eigenvalues(A), eg.symmetric_eigen(A)):
+                for value, e in zip(result.values, expected):
+                    self.assertAlmostEqual(value, e)
+            self.assertEigenpairs(mx.create_matrix(T), eg.symmetric_eigen(A))
+            self.assertAlmostEqual(eg.inverse_iteration(A, 1.9).values[0], 2)
+            self.assertAlmostEqual(eg.power_iteration(A).values[0], 2 + 2 ** 0.5)
+        # a view of a nonsymmetric part of a Matrix
+        A = mx.submatrix(mx.create_matrix([[5, 5, 5], [5, 1, 2], [5, 0, 3]]), 2, 3, 2, 3)
+        self.assertFalse(eg.is_hermitian(A))
+        for value, e in zip(eg.eigenvalues(A).values, [1, 3]):
+            self.assertAlmostEqual(value, e)
+        lower = st.TriangularMatrix([[1, 0], [4, 3]], lower=True)
+        for value, e in zip(eg.eigenvalues(lower).values, [1, 3]):
+            self.assertAlmostEqual(value, e)
+
+
+if __name__ == '__main__':
+    unittest.main()
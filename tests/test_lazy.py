@@ -0,0 +1,51 @@
+import unittest
+
+from api import vector as vc
+from api import matrix as mx
+from api import lazy as lz
+
+
+class TestLazy(unittest.TestCase):
+    def setUp(self):
+        self.A = mx.create_matrix([[1, 2], [3, 4]])
+        self.B = mx.create_matrix([[0, 1], [-1, 2]])
+
+    def test_combination(self):
+        e = lz.matrix_add(lz.matrix_scalar_product(self.A, 3), lz.matrix_negate(self.B))
+        self.assertIsInstance(e, lz.Combination)
+        self.assertEqual(len(e.terms), 2)
+        expected = mx.matrix_subtract(mx.matrix_scalar_product(self.A, 3), self.B)
+        self.assertTrue(mx.matrix_equal(lz.evaluate(e), expected))
+        # the terms of one operand are merged
+        e = lz.matrix_subtract(lz.matrix_add(self.A, self.B), lz.matrix_scalar_product(self.A, 2))
+        self.assertEqual(len(e.terms), 2)
+        self.assertTrue(mx.matrix_equal(e.evaluate(), mx.matrix_subtract(self.B, self.A)))
+        T = mx.matrix_transpose(self.A)
+        self.assertTrue(mx.matrix_equal(lz.matrix_add(T, self.A).evaluate(), mx.create_matrix([[2, 5], [5, 8]])))
+        S = mx.matrix_to_sparse(self.B)
+        self.assertTrue(mx.matrix_equal(lz.matrix_subtract(self.A, S).evaluate(), mx.matrix_subtract(self.A, self.B)))
+
+    def test_vectors(self):
+        u, v, w = vc.Vector(1, 2), vc.Vector(3, 4), vc.Vector(1j, 0)
+        e = lz.subtract(lz.add(u, v, w), lz.scalar_multiply(u, 2))
+        self.assertTrue(vc.is_equal(e.evaluate(), vc.Vector(2 + 1j, 2)))
+        e = lz.add(lz.matrix_vector_product(self.A, u), lz.negate(v))
+        self.assertTrue(vc.is_equal(lz.evaluate(e), vc.Vector(2, 7)))
+
+    def test_product(self):
+        self.assertEqual(lz._chain_order([10, 100, 5, 50])[0][2], 1)
+        self.assertEqual(lz._chain_order([50, 5, 100, 10])[0][2], 0)
+        A = mx.create_matrix([[1, 2, 3]])
+        B = mx.create_matrix([[1], [0], [2]])
+        e = lz.matrix_matrix_product(lz.matrix_matrix_product(B, A), lz.matrix_add(B, B))
+        self.assertIsInstance(e, lz.Product)
+        self.assertEqual(e.shape, (3, 1))
+        self.assertEqual(len(e.factors), 3)
+        expected = mx.matrix_matrix_product(B, mx.matrix_matrix_product(A, mx.matrix_add(B, B)))
+        self.assertTrue(mx.matrix_equal(e.evaluate(), expected))
+        v = lz.matrix_vector_product(lz.matrix_matrix_product(self.A, self.B), vc.Vector(1, 1))
+        self.assertTrue(vc.is_equal(v.evaluate(), vc.Vector(3, 7)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import os
+import struct
+import tempfile
+import unittest
+from array import array
+
+from api import vector as vc
+from api import matrix as mx
+from api import solvers as sv
+from api import loaders as ld
+
+
+class TestLoaders(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.grid = [[float(3 * i + j) for j in range(3)] for i in range(4)]
+        self.A = mx.create_matrix(self.grid)
+        self.loaded = []
+
+    def tearDown(self):
+        for A in self.loaded:
+            A.close()
+        self.dir.cleanup()
+
+    def write(self, name: str, content) -> str:
+        path = os.path.join(self.dir.name, name)
+        with open(path, 'wb' if isinstance(content, bytes) else 'w') as f:
+            f.write(content)
+        return path
+
+    def check(self, F, A):
+        self.loaded.append(F)
+        self.assertEqual((F.m, F.n), (A.m, A.n))
+        self.assertTrue(mx.matrix_equal(F.copy(), A))
+        self.assertEqual(F.sub(2, 3), A.sub(2, 3))
+        self.assertTrue(vc.is_equal(F.row(2), A.row(2)))
+        self.assertTrue(vc.is_equal(F.col(3), A.col(3)))
+        v = vc.Vector(*range(1, A.n + 1))
+        self.assertTrue(vc.is_equal(mx.matrix_vector_product(F, v), mx.matrix_vector_product(A, v)))
+        T = mx.matrix_transpose(F)
+        self.assertTrue(mx.matrix_equal(T.copy(), mx.matrix_transpose(A)))
+        w = vc.Vector(*range(1, A.m + 1))
+        self.assertTrue(vc.is_equal(mx.matrix_vector_product(T, w), mx.matrix_vector_product(mx.matrix_transpose(A), w)))
+        chunks = list(F.iter_chunks(3))
+        self.assertEqual([i for i, chunk in chunks], list(range(1, A.m + 1, 3)))
+        self.assertTrue(mx.matrix_equal(chunks[-1][1], mx.submatrix(A, chunks[-1][0], A.m, 1, A.n)))
+        self.assertTrue(mx.matrix_equal(list(T.iter_chunks(2))[1][1], mx.submatrix(mx.matrix_transpose(A), 3, 3, 1, A.m)))
+
+    def test_load_raw(self):
+        values = array('d', [x for row in self.grid for x in row])
+        path = self.write('a.bin', b'\0' * 16 + values.tobytes())
+        self.check(ld.load_raw(path, 4, 3, offset=16), self.A)
+
+    def test_load_npy(self):
+        def npy(shape, fortran_order, values):
+            header = f"{{'descr': '<f8', 'fortran_order': {fortran_order}, 'shape': {shape}, }}"
+            header += ' ' * (63 - len(header) % 64) + '\n'
+            return b'\x93NUMPY\x01\x00' + struct.pack('<H', len(header)) + header.encode() + array('d', values).tobytes()
+
+        self.check(ld.load_npy(self.write('c.npy', npy((4, 3), False, [x for row in self.grid for x in row]))), self.A)
+        self.check(ld.load_npy(self.write('f.npy', npy((4, 3), True, [row[j] for j in range(3) for row in self.grid]))), self.A)
+
+    def test_load_csv(self):
+        text = 'x,y,z\n' + '\n'.join(','.join(str(x) for x in row) for row in self.grid) + '\n\n'
+        self.check(ld.load_csv(self.write('a.csv', text), header=1), self.A)
+        F = ld.load_csv(self.write('b.csv', '4 1\n1 3'), delimiter=' ')
+        self.loaded.append(F)
+        result = sv.conjugate_gradient(F, vc.Vector(1, 2))
+        self.assertTrue(vc.is_equal(result.x, vc.Vector(1 / 11, 7 / 11)))
+
+    def test_load_matrix_market(self):
+        S = ld.load_matrix_market(self.write('a.mtx', '\n'.join([
+            '%%MatrixMarket matrix coordinate real symmetric',
+            '% a comment',
+            '3 3 5',
+            '3 1 2.5',
+            '1 1 4',
+            '2 2 1',
+            '2 2 2',
+            '3 3 0',
+        ])))
+        self.assertIsInstance(S, mx.SparseMatrix)
+        self.assertTrue(mx.matrix_equal(S, mx.create_matrix([[4, 0, 2.5], [0, 3, 0], [2.5, 0, 0]])))
+        self.assertEqual(list(S.indices), [0, 2, 1, 0])
+        S = ld.load_matrix_market(self.write('b.mtx', '\n'.join([
+            '%%MatrixMarket matrix coordinate pattern skew-symmetric',
+            '2 2 1',
+            '2 1',
+        ])))
+        self.assertTrue(mx.matrix_equal(S, mx.create_matrix([[0, -1], [1, 0]])))
+        A = ld.load_matrix_market(self.write('c.mtx', '\n'.join([
+            '%%MatrixMarket matrix array integer general',
+            '2 3',
+            '1', '4', '2', '5', '3', '6',
+        ])))
+        self.assertTrue(mx.matrix_equal(A, mx.create_matrix([[1, 2, 3], [4, 5, 6]])))
+        # a skew-symmetric array lists the strictly lower triangle, the diagonal is left out
+        A = ld.load_matrix_market(self.write('d.mtx', '\n'.join([
+            '%%MatrixMarket matrix array real skew-symmetric',
+            '3 3',
+            '1', '2', '3',
+        ])))
+        self.assertTrue(mx.matrix_equal(A, mx.create_matrix([[0, -1, -2], [1, 0, -3], [2, 3, 0]])))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+from api import vector as vc
+from api import matrix as mx
+from api import equation as eq
+from api import parallel as pl
+
+
+class TestParallel(unittest.TestCase):
+    def setUp(self):
+        self.systems = [
+            eq.LinearSystem(eq.LinearEquation([2, 1], 3), eq.LinearEquation([1, -1], 0)),
+            eq.LinearSystem(eq.LinearEquation([1, 1], 1), eq.LinearEquation([2, 2], 3)),
+            eq.LinearSystem(eq.LinearEquation([1, 1, 1], 1), eq.LinearEquation([2, 2, 0], 3)),
+            eq.LinearSystem(eq.LinearEquation([1j, 0], 1), eq.LinearEquation([0, 2], 3)),
+        ]
+        A = mx.create_matrix([[1, 2], [3, 4]])
+        A.augment_with(vc.Vector(5, 6))
+        self.systems.append(A)
+
+    def check(self, solutions):
+        self.assertEqual(len(solutions), 5)
+        self.assertTrue(vc.is_equal(solutions[0].x, vc.Vector(1, 1)))
+        self.assertFalse(solutions[1].consistent)
+        self.assertIsNone(solutions[1].x)
+        self.assertEqual(solutions[1].rank, 2)
+        self.assertTrue(vc.is_equal(solutions[2].x, vc.Vector(1.5, 0, -0.5)))
+        self.assertTrue(vc.is_equal(solutions[3].x, vc.Vector(-1j, 1.5)))
+        self.assertTrue(vc.is_equal(solutions[4].x, vc.Vector(-4, 4.5)))
+
+    def test_solve_batch(self):
+        self.check(pl.solve_batch(self.systems, workers=1))
+        self.check(pl.solve_batch(self.systems, workers=2, chunksize=2))
+
+    def test_solve_stream(self):
+        pairs = list(pl.solve_stream(iter(self.systems * 3), workers=2, chunksize=4))
+        self.assertEqual(sorted(index for index, solution in pairs), list(range(15)))
+        solutions = dict(pairs)
+        self.check([solutions[k] for k in range(10, 15)])
+
+
+if __name__ == '__main__':
+    unittest.main()
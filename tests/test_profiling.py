@@ -0,0 +1,47 @@
+import json
+import unittest
+
+from api import vector as vc
+from api import matrix as mx
+from api import profiling as pf
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        # the test starts from disabled profiling, even under LINEAR_ALGEBRA_PROFILE=1
+        self.enabled = pf.is_enabled()
+        pf.disable()
+
+    def tearDown(self):
+        if self.enabled:
+            pf.enable()
+
+    def test_profile(self):
+        to_rref, init = mx.to_rref, vc.Vector.__init__
+        with pf.profile() as stats:
+            self.assertTrue(pf.is_enabled())
+            self.assertIsNot(mx.to_rref, to_rref)
+            A = mx.create_matrix([[1, 2, 3], [4, 5, 6]])
+            B = mx.matrix_matrix_product(A, mx.matrix_transpose(A))
+            mx.to_rref(B)
+            vc.add(vc.Vector(1, 2), vc.Vector(3, 4))
+        self.assertFalse(pf.is_enabled())
+        self.assertIs(mx.to_rref, to_rref)
+        self.assertEqual(stats['matrix.to_rref'].calls, 1)
+        self.assertEqual(stats['matrix.matrix_matrix_product'].flops, 2 * 2 * 3 * 2)
+        self.assertEqual(stats['matrix.create_matrix'].calls, 1)
+        self.assertGreater(stats['matrix.create_matrix'].allocations, 0)
+        self.assertGreater(stats['matrix.to_rref'].time, 0)
+        summary = json.loads(pf.to_json())
+        self.assertEqual(summary['functions']['vector.add']['flops'], 2)
+        self.assertGreaterEqual(summary['allocations']['Vector'], 3)
+        text = pf.to_prometheus()
+        self.assertIn('linear_algebra_calls_total{function="matrix.to_rref"} 1\n', text)
+        self.assertIn('# TYPE linear_algebra_objects_allocated_total counter', text)
+        vc.add(vc.Vector(1, 2), vc.Vector(3, 4))
+        self.assertEqual(stats['vector.add'].calls, 1)
+        self.assertIs(vc.Vector.__init__, init)
+
+
+if __name__ == '__main__':
+    unittest.main()
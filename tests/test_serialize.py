@@ -0,0 +1,81 @@
+import copy
+import os
+import pickle
+import tempfile
+import unittest
+from fractions import Fraction
+
+from api import vector as vc
+from api import matrix as mx
+from api import equation as eq
+from api import serialize as sr
+
+
+class TestSerialize(unittest.TestCase):
+    def test_vector(self):
+        for v in [vc.Vector(1, 2.5, -3), vc.Vector(1j, 2)]:
+            w = sr.loads(sr.dumps(v))
+            self.assertEqual(list(w.components), list(v.components))
+            self.assertEqual(w.field, v.field)
+        A = mx.create_matrix([[1, 2], [3, 4]])
+        w = pickle.loads(pickle.dumps(A.col(2)))
+        self.assertEqual(type(w), vc.Vector)
+        self.assertEqual(list(w.components), [2, 4])
+
+    def test_matrix(self):
+        A = mx.create_matrix([[1, 2, 3], [4, 5, 6]])
+        self.assertTrue(mx.matrix_equal(sr.loads(sr.dumps(A)), A))
+        T = pickle.loads(pickle.dumps(mx.matrix_transpose(A)))
+        self.assertEqual(type(T), mx.Matrix)
+        self.assertTrue(mx.matrix_equal(T, mx.create_matrix([[1, 4], [2, 5], [3, 6]])))
+        self.assertTrue(mx.matrix_equal(copy.deepcopy(mx.submatrix(A, 1, 2, 2, 3)), mx.create_matrix([[2, 3], [5, 6]])))
+        A.augment_with(vc.Vector(7, 8j))
+        B = sr.loads(sr.dumps(A))
+        self.assertTrue(B.augmented)
+        self.assertTrue(mx.matrix_equal(B, A))
+        self.assertEqual(B.aug(2), 8j)
+        A = mx.create_matrix([[1, 2], [3, 4]])
+        A.set(1, 1, Fraction(1, 3))
+        B = pickle.loads(pickle.dumps(A))
+        self.assertEqual(B.sub(1, 1), Fraction(1, 3))
+        self.assertEqual(B.sub(2, 2), 4)
+
+    def test_exact_values(self):
+        # values a double can't hold exactly come back with their value and type
+        A = mx.create_matrix([[2 ** 60 + 1, 1], [1, 1]])
+        for B in (copy.deepcopy(A), pickle.loads(pickle.dumps(A)), sr.loads(sr.dumps(A))):
+            self.assertEqual(B.sub(1, 1), 2 ** 60 + 1)
+            self.assertEqual(mx.determinant(B, exact=True), 2 ** 60)
+        A = mx.create_matrix([[10 ** 400, 0.5], [Fraction(3), -1]])
+        B = sr.loads(sr.dumps(A))
+        self.assertEqual([type(x) for x in B.data], [int, float, Fraction, int])
+        self.assertEqual(list(B.data), list(A.data))
+        v = pickle.loads(pickle.dumps(vc.Vector(10 ** 400, 0.1)))
+        self.assertEqual(list(v.components), [10 ** 400, 0.1])
+        self.assertEqual(copy.deepcopy(vc.Vector(2 ** 60 + 1)).sub(1), 2 ** 60 + 1)
+
+    def test_super_augmented_matrix(self):
+        S = mx.SuperAugmentedMatrix(mx.create_matrix([[1, 2], [3, 4]]), mx.create_matrix([[5, 6, 7], [8, 9, 10]]))
+        T = sr.loads(sr.dumps(S))
+        self.assertTrue(mx.matrix_equal(T.lhs, S.lhs))
+        self.assertTrue(mx.matrix_equal(T.rhs, S.rhs))
+
+    def test_linear_system(self):
+        ls = eq.LinearSystem(eq.LinearEquation([1, 2], 3), eq.LinearEquation([4j, 5], 6))
+        loaded = pickle.loads(pickle.dumps(ls))
+        self.assertTrue(eq.systems_are_identical(loaded, ls))
+        self.assertEqual(loaded.e[1].a.field, 'real')
+        self.assertEqual(loaded.e[2].a.field, 'complex')
+
+    def test_save_load(self):
+        A = mx.create_matrix([[0.1, 1e300], [-2, 3]])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'a.bin')
+            sr.save(A, path)
+            self.assertEqual(list(sr.load(path).data), list(A.data))
+        with self.assertRaises(AssertionError):
+            sr.loads(b'not serialized' + bytes(16))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+
+from api import vector as vc
+from api import matrix as mx
+from api import solvers as sv
+
+
+class TestSolvers(unittest.TestCase):
+    def setUp(self):
+        # symmetric, positive definite and diagonally dominant
+        self.A = mx.create_matrix([
+            [4, 1, 0, 0],
+            [1, 5, 2, 0],
+            [0, 2, 6, 1],
+            [0, 0, 1, 3]
+        ])
+        self.x = vc.Vector(1, -2, 3, 0.5)
+        self.b = mx.matrix_vector_product(self.A, self.x)
+
+    def test_solvers(self):
+        for solver in (sv.conjugate_gradient, sv.gmres, sv.jacobi, sv.gauss_seidel):
+            for A in (self.A, mx.matrix_to_sparse(self.A)):
+                result = solver(A, self.b)
+                self.assertTrue(result.converged)
+                self.assertTrue(vc.is_equal(result.x, self.x))
+                self.assertEqual(len(result.residuals), result.iterations + 1)
+
+    def test_gmres_nonsymmetric(self):
+        A = mx.create_matrix([
+            [3, 2, -1],
+            [0, complex(1, 2), 4],
+            [1, -1, 5]
+        ])
+        x = vc.Vector(1, complex(0, 1), -1)
+        result = sv.gmres(A, mx.matrix_vector_product(A, x), restart=2)
+        self.assertTrue(result.converged)
+        self.assertTrue(vc.is_equal(result.x, x))
+
+    def test_max_iter(self):
+        result = sv.jacobi(self.A, self.b, max_iter=2)
+        self.assertFalse(result.converged)
+        self.assertEqual(result.iterations, 2)
+
+    def test_operator(self):
+        class Laplacian:
+            def matrix_vector_product(self, v):
+                c = v.components
+                n = len(c)
+                return vc.Vector(*[
+                    2 * c[i] - (c[i - 1] if i > 0 else 0) - (c[i + 1] if i < n - 1 else 0)
+                    for i in range(n)
+                ])
+        b = vc.Vector(1, 0, 0, 0, 1)
+        result = sv.conjugate_gradient(Laplacian(), b)
+        self.assertTrue(result.converged)
+        self.assertTrue(vc.is_equal(result.x, vc.Vector(1, 1, 1, 1, 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,6 +12,20 @@ class TestSpaces(unittest.TestCase):
             sp.span_is_equal(s, u)
         )
 
+    def test_contained_in_span(self):
+        s = sp.Span(vc.Vector(1, 1, 0), vc.Vector(2, 2, 0), vc.Vector(1, 0, 0))
+        self.assertEqual(2, s.dim)
+        self.assertEqual(3, len(s.vectors))
+        self.assertTrue(sp.contained_in_span(vc.Vector(3, -7, 0), s))
+        self.assertFalse(sp.contained_in_span(vc.Vector(0, 0, 1), s))
+        self.assertFalse(sp.span_is_equal(s, sp.Span(vc.Vector(1, 0, 0), vc.Vector(0, 0, 1))))
+        s.add(vc.Vector(1, 1, 1))
+        self.assertEqual(3, s.dim)
+        self.assertTrue(sp.contained_in_span(vc.Vector(0, 0, 1), s))
+        c = sp.Span(vc.Vector(1j, 1))
+        self.assertTrue(sp.contained_in_span(vc.Vector(-1, 1j), c))
+        self.assertFalse(sp.contained_in_span(vc.Vector(1, 1j), c))
+
     def test_line_passing_through(self):
         L = sp.line_passing_through(vc.Vector(2, -3, 5), vc.Vector(4, -2, 6))
         Y = sp.Line(vc.Vector(0, -4, 4), vc.Vector(1, 0.5, 0.5))
@@ -25,7 +39,7 @@ class TestSpaces(unittest.TestCase):
     def test_plane_passing_through(self):
         P = sp.plane_passing_through(vc.Vector(1, 0, 0), vc.Vector(1, 1, 0), vc.Vector(1, 0, 1))
         Y = sp.plane_passing_through(vc.Vector(1, 1, 1), vc.Vector(1, 10, 2), vc.Vector(1, 0, 2))
-        # self.assertTrue(sp.plane_is_equal(P, Y)) - this should be true!!!
+        self.assertTrue(sp.plane_is_equal(P, Y))
 
 
 if __name__ == '__main__':
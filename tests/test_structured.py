@@ -0,0 +1,167 @@
+import unittest
+from fractions import Fraction
+
+from api import vector as vc
+from api import matrix as mx
+from api import structured as st
+
+
+class TestStructured(unittest.TestCase):
+    def setUp(self):
+        self.lower = [[2, 0, 0, 0], [1, 3, 0, 0], [-1, 2, 4, 0], [0, 5, 1, -2]]
+        self.banded = [[4, 1, 0, 0, 0], [2, 5, 1, 0, 0], [0, 7, 1, 3, 0], [0, 0, 1, 6, 2], [0, 0, 0, 3, 8]]
+        self.symmetric = [[4, 1, 2], [1, 5, -1], [2, -1, 6]]
+        self.b = vc.Vector(1, -2, 3, 4)
+
+    def assertMatrixEqual(self, A, B):
+        A = A.to_dense() if isinstance(A, st._Structured) else A
+        B = B.to_dense() if isinstance(B, st._Structured) else B
+        self.assertEqual((A.m, A.n), (B.m, B.n))
+        for i in range(1, A.m + 1):
+            for j in range(1, A.n + 1):
+                self.assertAlmostEqual(A.sub(i, j), B.sub(i, j))
+
+    def assertVectorEqual(self, v, w):
+        self.assertEqual(v.dim, w.dim)
+        for x, y in zip(v.components, w.components):
+            self.assertAlmostEqual(x, y)
+
+    def check(self, S, grid):
+        # every kernel of S agrees with the dense Matrix of grid
+        A = mx.create_matrix(grid)
+        v = vc.Vector.from_sequence(range(1, A.n + 1))
+        B = mx.create_matrix([[i - j for j in range(A.n)] for i in range(A.n)])
+        self.assertMatrixEqual(S, A)
+        self.assertVectorEqual(mx.matrix_vector_product(S, v), mx.matrix_vector_product(A, v))
+        self.assertMatrixEqual(mx.matrix_matrix_product(S, B), mx.matrix_matrix_product(A, B))
+        self.assertMatrixEqual(mx.matrix_matrix_product(B, S), mx.matrix_matrix_product(B, A))
+        self.assertMatrixEqual(S @ S, A @ A)
+        self.assertMatrixEqual(mx.matrix_transpose(S), mx.matrix_transpose(A))
+        self.assertAlmostEqual(mx.determinant(S), mx.determinant(A))
+        self.assertMatrixEqual(mx.inverse(S), mx.inverse(A))
+        x = mx.lstsq(S, v)
+        self.assertVectorEqual(mx.matrix_vector_product(A, x), v)
+        self.assertMatrixEqual(mx.matrix_matrix_product(A, mx.lstsq(S, B)), B)
+
+    def test_diagonal(self):
+        D = st.DiagonalMatrix([2, -1, 4])
+        self.check(D, [[2, 0, 0], [0, -1, 0], [0, 0, 4]])
+        self.assertIsInstance(D @ D, st.DiagonalMatrix)
+        self.assertIsInstance(mx.inverse(D), st.DiagonalMatrix)
+        self.assertIs(mx.matrix_transpose(D), D)
+        self.assertEqual(mx.determinant(st.identity(5)), 1)
+        with self.assertRaises(AssertionError):
+            st.DiagonalMatrix([1, 0]).solve(vc.Vector(1, 1))
+
+    def test_triangular(self):
+        L = st.TriangularMatrix(self.lower, lower=True)
+        self.assertEqual(len(L.data), 10)
+        self.check(L, self.lower)
+        U = mx.matrix_transpose(L)
+        self.assertIsInstance(U, st.TriangularMatrix)
+        self.assertFalse(U.lower)
+        self.check(U, [list(col) for col in zip(*self.lower)])
+        self.assertVectorEqual(mx.matrix_vector_product(L, L.solve(self.b)), self.b)
+        self.assertIsInstance(mx.inverse(U), st.TriangularMatrix)
+        with self.assertRaises(AssertionError):
+            st.TriangularMatrix(self.lower)
+
+    def test_banded(self):
+        S = st.BandedMatrix(self.banded, 1, 2)
+        self.assertEqual(len(S.data), 5 * 4)
+        self.check(S, self.banded)
+        T = mx.matrix_transpose(S)
+        self.assertEqual((T.lower_bandwidth, T.upper_bandwidth), (2, 1))
+        self.check(T, [list(col) for col in zip(*self.banded)])
+        # a singular banded matrix
+        singular = st.BandedMatrix([[1, 2, 0], [2, 4, 0], [0, 0, 1]], 1, 1)
+        self.assertEqual(mx.determinant(singular), 0)
+        with self.assertRaises(AssertionError):
+            st.BandedMatrix(self.banded, 0, 2)
+
+    def test_symmetric(self):
+        S = st.SymmetricMatrix(self.symmetric)
+        self.assertEqual(len(S.data), 6)
+        self.check(S, self.symmetric)
+        self.assertIs(mx.matrix_transpose(S), S)
+        # an indefinite matrix isn't solved by Cholesky
+        indefinite = [[1, 2], [2, 1]]
+        self.check(st.SymmetricMatrix(mx.create_matrix(indefinite)), indefinite)
+        with self.assertRaises(AssertionError):
+            st.SymmetricMatrix([[1, 2], [3, 4]])
+
+    def test_cached_factor(self):
+        # the factorization is computed once, and reused by every solve
+        S = st.SymmetricMatrix(self.symmetric)
+        mx.lstsq(S, mx.identity(3))
+        factors = S._cache['cholesky']
+        S.solve(vc.Vector(1, 2, 3))
+        self.assertEqual(mx.determinant(S), mx.determinant(S))
+        self.assertIs(S._cache['cholesky'], factors)
+        self.assertIs(mx.inverse(S), mx.inverse(S))
+        indefinite = st.SymmetricMatrix([[1, 2], [2, 1]])
+        indefinite.solve(vc.Vector(1, 1))
+        F = mx.lu_factor(indefinite._dense())
+        self.assertIs(mx.lu_factor(indefinite._dense()), F)
+        B = st.BandedMatrix(self.banded, 1, 2)
+        B.solve(vc.Vector(1, 2, 3, 4, 5))
+        factor = B._cache['factor']
+        mx.lstsq(B, mx.identity(5))
+        self.assertIs(B._cache['factor'], factor)
+        self.assertIs(mx.inverse(B), mx.inverse(B))
+
+    def test_dense_functions(self):
+        # the functions without a structured kernel work on the dense form, in either position
+        for S in (st.DiagonalMatrix([2, -1, 4]), st.TriangularMatrix(self.lower, lower=True),
+                  st.BandedMatrix(self.banded, 1, 2), st.SymmetricMatrix(self.symmetric)):
+            A = S.to_dense()
+            B = mx.create_matrix([[i * j + 1 for j in range(S.n)] for i in range(S.n)])
+            self.assertMatrixEqual(mx.matrix_add(S, B), mx.matrix_add(A, B))
+            self.assertMatrixEqual(mx.matrix_add(B, S), mx.matrix_add(A, B))
+            self.assertMatrixEqual(mx.matrix_add(S, S), mx.matrix_add(A, A))
+            self.assertMatrixEqual(mx.matrix_add(mx.matrix_to_sparse(B), S), mx.matrix_add(A, B))
+            self.assertMatrixEqual(mx.matrix_subtract(B, S), mx.matrix_subtract(B, A))
+            self.assertMatrixEqual(S + B, mx.matrix_add(A, B))
+            self.assertMatrixEqual(B + S, mx.matrix_add(A, B))
+            self.assertMatrixEqual(S - B, mx.matrix_subtract(A, B))
+            self.assertMatrixEqual(B - S, mx.matrix_subtract(B, A))
+            self.assertTrue(mx.matrix_equal(S, A))
+            self.assertTrue(mx.matrix_equal(A, S))
+            self.assertFalse(mx.matrix_equal(S, B))
+            self.assertMatrixEqual(mx.matrix_scalar_product(S, 3), mx.matrix_scalar_product(A, 3))
+            self.assertMatrixEqual(S * 3, mx.matrix_scalar_product(A, 3))
+            self.assertMatrixEqual(3 * S, mx.matrix_scalar_product(A, 3))
+            self.assertMatrixEqual(mx.matrix_negate(S), mx.matrix_negate(A))
+            self.assertMatrixEqual(-S, mx.matrix_negate(A))
+            self.assertEqual(mx.rank(S), mx.rank(A))
+            self.assertEqual(mx.rank(S, exact=True), mx.rank(A, exact=True))
+            self.assertEqual(mx.nullity(S), mx.nullity(A))
+            self.assertEqual(mx.is_consistent(S), mx.is_consistent(A))
+            self.assertAlmostEqual(mx.condition_number(S), mx.condition_number(A))
+            self.assertMatrixEqual(mx.rref(S), mx.rref(A))
+            with self.assertRaises(AssertionError):
+                mx.to_rref(S)
+            C = B.copy()
+            C += S
+            self.assertMatrixEqual(C, mx.matrix_add(A, B))
+            C -= S
+            self.assertMatrixEqual(C, B)
+        # a singular structured matrix
+        singular = st.BandedMatrix([[1, 2, 0], [2, 4, 0], [0, 0, 1]], 1, 1)
+        self.assertEqual(mx.rank(singular), 2)
+        self.assertEqual(mx.nullity(singular), 1)
+        self.assertEqual(mx.condition_number(singular), float('inf'))
+
+    def test_exact_determinant(self):
+        third = Fraction(1, 3)
+        self.assertEqual(mx.determinant(st.DiagonalMatrix([0.5, third]), exact=True), Fraction(1, 6))
+        L = st.TriangularMatrix([[0.1, 0], [1, 3]], lower=True)
+        self.assertEqual(mx.determinant(L, exact=True), 3 * Fraction(0.1))
+        self.assertEqual(mx.determinant(st.BandedMatrix(self.banded, 1, 2), exact=True),
+                         mx.determinant(mx.create_matrix(self.banded), exact=True))
+        S = st.SymmetricMatrix([[third, third], [third, third + Fraction(1, 10 ** 20)]])
+        self.assertEqual(mx.determinant(S, exact=True), Fraction(1, 3 * 10 ** 20))
+
+
+if __name__ == '__main__':
+    unittest.main()
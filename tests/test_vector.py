@@ -1,6 +1,7 @@
 import unittest
 
 from api import vector as vc
+from api import matrix as mx
 from math import sqrt
 
 TOLERANCE = 0.001
@@ -23,6 +24,24 @@ class TestVector(unittest.TestCase):
         self.assertEqual(self.v1.components[1], 2)
         self.assertEqual(self.v1.components[2], 3)
 
+    def test_storage(self):
+        v = vc.Vector.from_sequence([1, 2.5, 3])
+        self.assertEqual(v.field, 'real')
+        self.assertEqual(v.components.typecode, 'd')
+        self.assertTrue(vc.is_equal(v, vc.Vector(1, 2.5, 3)))
+        w = vc.Vector.from_sequence(v.components)
+        w.components[0] = 7
+        self.assertEqual(v.sub(1), 1)
+        z = vc.Vector(1, complex(2, 1))
+        self.assertEqual(z.field, 'complex')
+        self.assertEqual(vc.negate(z).field, 'complex')
+        self.assertFalse(hasattr(v, '__dict__'))
+        self.assertEqual(repr(v), '[1, 2.5, 3]')
+        self.assertEqual(vc.Vector(10 ** 400).sub(1), 10 ** 400)
+        g = vc.Vector.from_sequence(x for x in [1, 2j])
+        self.assertEqual(g.field, 'complex')
+        self.assertEqual(g.dim, 2)
+
     def test_zero_vector(self):
         self.assertEqual(self.zero3.dim, 3)
         for i in range(3):
@@ -286,6 +305,98 @@ class TestVector(unittest.TestCase):
             vc.is_orthogonal(a, z) and vc.is_orthogonal(b, z)
         )
 
+    def test_operators(self):
+        v, w = vc.Vector(1, 2), vc.Vector(3, 4)
+        self.assertTrue(vc.is_equal(v + w, vc.Vector(4, 6)))
+        self.assertTrue(vc.is_equal(v - w, vc.Vector(-2, -2)))
+        self.assertTrue(vc.is_equal(2 * v, v * 2))
+        self.assertTrue(vc.is_equal(-v, vc.Vector(-1, -2)))
+        self.assertEqual(v @ w, 11)
+        components = v.components
+        v += w
+        v -= vc.Vector(1, 1)
+        v *= 3
+        self.assertIs(v.components, components)
+        self.assertTrue(vc.is_equal(v, vc.Vector(9, 15)))
+        v += vc.Vector(1j, 0)
+        self.assertEqual(v.field, 'complex')
+        self.assertTrue(vc.is_equal(v, vc.Vector(9 + 1j, 15)))
+        with self.assertRaises(TypeError):
+            v + 1
+
+
+class TestVectorBatch(unittest.TestCase):
+    def setUp(self):
+        self.vs = [vc.Vector(1, 2, 3), vc.Vector(-2, 0, 1), vc.Vector(0.5, 4, -1)]
+        self.ws = [vc.Vector(3, -5, 7), vc.Vector(9, 2, -1), vc.Vector(1, 1, 1)]
+        self.a = vc.VectorBatch(*self.vs)
+        self.b = vc.VectorBatch(*self.ws)
+
+    def test_constructor(self):
+        self.assertEqual(len(self.a), 3)
+        self.assertEqual(self.a.dim, 3)
+        self.assertTrue(vc.is_equal(self.a.vector(2), self.vs[1]))
+        batch = vc.VectorBatch.from_buffer(2, 2, [1, 2, 3, 4])
+        self.assertTrue(vc.is_equal(batch.vector(2), vc.Vector(3, 4)))
+
+    def test_scalars(self):
+        dots = vc.batch_dot(self.a, self.b)
+        norms = vc.batch_norm(self.a)
+        angles = vc.batch_angle(self.a, self.b)
+        for k in range(3):
+            self.assertAlmostEqual(dots[k], vc.dot_product(self.vs[k], self.ws[k]))
+            self.assertAlmostEqual(norms[k], vc.norm(self.vs[k]))
+            self.assertAlmostEqual(angles[k], vc.angle(self.vs[k], self.ws[k]))
+
+    def test_vectors(self):
+        results = [
+            (vc.batch_normalize(self.a), lambda v, w: vc.normalize(v)),
+            (vc.batch_add(self.a, self.b, self.a), lambda v, w: vc.add(v, w, v)),
+            (vc.batch_scalar_multiply(self.a, -2), lambda v, w: vc.scalar_multiply(v, -2)),
+            (vc.batch_proj(self.a, self.b), vc.proj),
+            (vc.batch_perp(self.a, self.b), vc.perp),
+            (vc.batch_cross_product(self.a, self.b), vc.cross_product),
+        ]
+        for batch, f in results:
+            for k in range(3):
+                self.assertTrue(vc.is_equal(batch.vector(k + 1), f(self.vs[k], self.ws[k])))
+        scaled = vc.batch_scalar_multiply(self.a, [1, 2, 3])
+        self.assertTrue(vc.is_equal(scaled.vector(3), vc.scalar_multiply(self.vs[2], 3)))
+
+    def test_broadcast(self):
+        w = self.ws[0]
+        projections = vc.batch_proj(self.a, w)
+        for k in range(3):
+            self.assertTrue(vc.is_equal(projections.vector(k + 1), vc.proj(self.vs[k], w)))
+
+    def test_views(self):
+        # rows and columns of a Matrix are VectorViews, which work as operands too
+        A = mx.create_matrix([[3, -5, 7], [9, 2, -1], [1, 1, 1]])
+        for w in (A.row(1), A.col(2)):
+            u = w.copy()
+            dots = vc.batch_dot(self.a, w)
+            angles = vc.batch_angle(self.a, w)
+            added = vc.batch_add(self.a, w)
+            projections = vc.batch_proj(self.a, w)
+            crosses = vc.batch_cross_product(self.a, w)
+            for k in range(3):
+                self.assertAlmostEqual(dots[k], vc.dot_product(self.vs[k], u))
+                self.assertAlmostEqual(angles[k], vc.angle(self.vs[k], u))
+                self.assertTrue(vc.is_equal(added.vector(k + 1), vc.add(self.vs[k], u)))
+                self.assertTrue(vc.is_equal(projections.vector(k + 1), vc.proj(self.vs[k], u)))
+                self.assertTrue(vc.is_equal(crosses.vector(k + 1), vc.cross_product(self.vs[k], u)))
+        rows = vc.VectorBatch(A.row(1), A.row(2))
+        self.assertTrue(vc.is_equal(rows.vector(2), vc.Vector(9, 2, -1)))
+        A.set(1, 1, 1j)
+        self.assertEqual(vc.batch_dot(vc.VectorBatch(vc.Vector(1, 0, 0)), A.row(1))[0], 1j)
+
+    def test_complex(self):
+        a = vc.VectorBatch(vc.Vector(complex(0, 1), 2), vc.Vector(1, complex(0, 1)))
+        b = vc.VectorBatch(vc.Vector(1, complex(0, 1)), vc.Vector(complex(0, 2), 1))
+        self.assertEqual(a.field, 'complex')
+        self.assertAlmostEqual(vc.batch_norm(a)[0], vc.norm(a.vector(1)))
+        self.assertTrue(vc.is_equal(vc.batch_proj(a, b).vector(2), vc.proj(a.vector(2), b.vector(2))))
+
 
 if __name__ == '__main__':
     unittest.main()